@@ -1,26 +1,38 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from enum import Enum
-from app.config.database import get_db
+from datetime import datetime, date
+from app.dependencies.database import get_read_db
 from app.schemas.account import (
     DepositAccountResponse, 
     AccountDetailsResponse, 
     AccountMetricsResponse, 
+    PortfolioOverviewResponse,
+    TermDepositProjectionResponse,
     PaymentTypeStatisticsResponse,
-    MonthlyCreditDebitStatisticsResponse
+    CategorySpendStatisticsResponse,
+    BalanceHistoryResponse,
+    MonthlyCreditDebitStatisticsResponse,
+    RecurringPaymentResponse
 )
 from app.schemas.response import ApiResponse
 from app.services.account_service import AccountService
 from app.services.transaction_service import TransactionService
+from app.services.recurring_payment_service import RecurringPaymentService
+from app.services.term_deposit_service import TermDepositService
 from app.dependencies.auth import authenticate_user
-from app.models.user import User
+from app.utils.principal_cache import Principal
 from app.models.consent_fI_type import FITypeEnum
 from app.models.financial_accounts import FinancialAccount
 from app.models.consent_request import ConsentRequest
 from app.utils.logger_util import logger_exception
 from app.constants.message import Messages
+from app.constants.constant import TRANSACTION_TYPE_CREDIT, TRANSACTION_TYPE_DEBIT
 from app.utils.response import success_response
+from app.utils.conditional import (
+    build_etag, is_not_modified, not_modified_response, with_cache_headers
+)
 
 
 class DepositAccountType(str, Enum):
@@ -29,6 +41,18 @@ class DepositAccountType(str, Enum):
     TERM_DEPOSIT = "term_deposit"
 
 
+class BalanceDownsamplingMethod(str, Enum):
+    """Enum for balance history downsampling methods in API requests."""
+    LTTB = "lttb"
+    MINMAX = "minmax"
+
+
+class TransactionTypeFilter(str, Enum):
+    """Enum for transaction types in API requests."""
+    DEBIT = "debit"
+    CREDIT = "credit"
+
+
 # ---------------------------------------------------------------------------
 # Router Configuration
 # ---------------------------------------------------------------------------
@@ -38,6 +62,21 @@ router = APIRouter(
 )
 
 
+def _build_account_etag(
+    request: Request,
+    account_service: AccountService,
+    user_id: int,
+    account_id: Optional[int] = None,
+    *extra
+) -> str:
+    """
+    Builds the ETag of an account endpoint from the request URL and the
+    data version of the account (or of all the user's accounts).
+    """
+    version = account_service.get_data_version(user_id, account_id)
+    return build_etag(request.url.path, request.url.query, user_id, version, *extra)
+
+
 # ===========================================================================
 # Get Deposit Accounts by User and Type
 # ===========================================================================
@@ -47,12 +86,13 @@ router = APIRouter(
     dependencies=[Depends(authenticate_user)]
 )
 def get_deposit_accounts(
+    request: Request,
     type: DepositAccountType = Query(
         ...,
         description="Account type filter: 'deposit' or 'term_deposit'"
     ),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(authenticate_user)
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
 ):
     """
     Fetches deposit accounts for the authenticated user.
@@ -65,6 +105,11 @@ def get_deposit_accounts(
     """
     try:
         account_service = AccountService(db)
+
+        # Answer conditional requests before running any query
+        etag = _build_account_etag(request, account_service, current_user.id)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
         
         # Convert DepositAccountType enum to FITypeEnum
         type_upper = type.value.upper().replace("-", "_")
@@ -82,10 +127,11 @@ def get_deposit_accounts(
             account_type=account_type
         )
         
-        return success_response(
+        response = success_response(
             data=accounts,
             message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Deposit accounts")
         )
+        return with_cache_headers(response, etag)
     
     except HTTPException:
         raise
@@ -97,6 +143,105 @@ def get_deposit_accounts(
         )
 
 
+# ===========================================================================
+# Get Portfolio Overview (All Deposit and Term Deposit Accounts)
+# ===========================================================================
+@router.get(
+    "/portfolio",
+    response_model=ApiResponse[PortfolioOverviewResponse],
+    dependencies=[Depends(authenticate_user)]
+)
+def get_portfolio_overview(
+    request: Request,
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
+):
+    """
+    Fetches every deposit and term deposit account of the authenticated user with
+    current balance / value, last month credit and debit, and totals per account type.
+    Replaces one /{account_id}/metrics call per account on the dashboard.
+    
+    Returns:
+        Portfolio overview with accounts, per-type totals and the overall total
+    """
+    try:
+        account_service = AccountService(db)
+
+        # Last month's flows are relative to the current month, so it is part of the ETag
+        etag = _build_account_etag(
+            request, account_service, current_user.id, None,
+            datetime.now().strftime("%Y-%m")
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        portfolio = account_service.get_portfolio_overview(current_user.id)
+        
+        response = success_response(
+            data=portfolio,
+            message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Portfolio overview")
+        )
+        return with_cache_headers(response, etag)
+    
+    except HTTPException:
+        raise
+    except Exception:
+        logger_exception(f"Failed to fetch portfolio overview for user_id={current_user.id}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=Messages.SOMETHING_WENT_WRONG
+        )
+
+
+# ===========================================================================
+# Get Term Deposit Projections
+# ===========================================================================
+@router.get(
+    "/term-deposits/projections",
+    response_model=ApiResponse[TermDepositProjectionResponse],
+    dependencies=[Depends(authenticate_user)]
+)
+def get_term_deposit_projections(
+    request: Request,
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
+):
+    """
+    Fetches accrued interest to date, projected maturity value and a monthly
+    maturity ladder for every term deposit of the authenticated user.
+    
+    Returns:
+        Term deposit projections with the maturity ladder and totals
+    """
+    try:
+        account_service = AccountService(db)
+
+        # Accrued interest changes daily, so the valuation date is part of the ETag
+        today = date.today()
+        etag = _build_account_etag(
+            request, account_service, current_user.id, None, today.isoformat()
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        projections = TermDepositService(db).get_user_projections(current_user.id, today)
+        
+        response = success_response(
+            data=projections,
+            message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Term deposit projections")
+        )
+        return with_cache_headers(response, etag)
+    
+    except HTTPException:
+        raise
+    except Exception:
+        logger_exception(f"Failed to fetch term deposit projections for user_id={current_user.id}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=Messages.SOMETHING_WENT_WRONG
+        )
+
+
 # ===========================================================================
 # Get Account Details by Account ID
 # ===========================================================================
@@ -106,9 +251,10 @@ def get_deposit_accounts(
     dependencies=[Depends(authenticate_user)]
 )
 def get_account_details(
+    request: Request,
     account_id: int = Path(..., description="Account ID to fetch details for"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(authenticate_user)
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
 ):
     """
     Fetches detailed account information for a specific account.
@@ -122,6 +268,11 @@ def get_account_details(
     """
     try:
         account_service = AccountService(db)
+
+        # Answer conditional requests before running any query
+        etag = _build_account_etag(request, account_service, current_user.id, account_id)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
         
         # Fetch account details
         details = account_service.get_account_details(
@@ -132,13 +283,14 @@ def get_account_details(
         if details is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Account not found or access denied"
+                detail=Messages.ACCOUNT_NOT_FOUND
             )
         
-        return success_response(
+        response = success_response(
             data=details,
             message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Account details")
         )
+        return with_cache_headers(response, etag)
     
     except HTTPException:
         raise
@@ -159,9 +311,10 @@ def get_account_details(
     dependencies=[Depends(authenticate_user)]
 )
 def get_account_metrics(
+    request: Request,
     account_id: int = Path(..., description="Account ID to fetch metrics for"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(authenticate_user)
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
 ):
     """
     Fetches account metrics including current balance and last month transaction totals.
@@ -173,13 +326,22 @@ def get_account_metrics(
         Account metrics including current balance, last month total credit, and last month total debit
     """
     try:
+        # Metrics are relative to the current month, so it is part of the ETag
+        etag = _build_account_etag(
+            request, AccountService(db), current_user.id, account_id,
+            datetime.now().strftime("%Y-%m")
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
         transaction_service = TransactionService(db)
         metrics = transaction_service.get_account_metrics(account_id)
         
-        return success_response(
+        response = success_response(
             data=metrics,
             message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Account metrics")
         )
+        return with_cache_headers(response, etag)
     
     except HTTPException:
         raise
@@ -200,9 +362,10 @@ def get_account_metrics(
     dependencies=[Depends(authenticate_user)]
 )
 def get_payment_type_statistics(
+    request: Request,
     account_id: int = Path(..., description="Account ID to fetch payment statistics for"),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(authenticate_user)
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
 ):
     """
     Fetches payment type statistics grouped by transaction mode.
@@ -214,13 +377,18 @@ def get_payment_type_statistics(
         Payment type statistics including mode, amount, count, and percentage for each payment type
     """
     try:
+        etag = _build_account_etag(request, AccountService(db), current_user.id, account_id)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
         transaction_service = TransactionService(db)
         statistics = transaction_service.get_payment_type_statistics(account_id)
         
-        return success_response(
+        response = success_response(
             data=statistics,
             message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Payment statistics")
         )
+        return with_cache_headers(response, etag)
     
     except HTTPException:
         raise
@@ -232,6 +400,132 @@ def get_payment_type_statistics(
         )
 
 
+# ===========================================================================
+# Get Category Spend Statistics
+# ===========================================================================
+@router.get(
+    "/{account_id}/category-statistics",
+    response_model=ApiResponse[CategorySpendStatisticsResponse],
+    dependencies=[Depends(authenticate_user)]
+)
+def get_category_spend_statistics(
+    request: Request,
+    account_id: int = Path(..., description="Account ID to fetch category statistics for"),
+    transaction_type: TransactionTypeFilter = Query(TransactionTypeFilter.DEBIT, description="Transaction type: 'debit' (spend) or 'credit' (income)"),
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
+):
+    """
+    Fetches spend (or income) statistics grouped by transaction category.
+    
+    Path Parameters:
+        - account_id: The account ID to fetch category statistics for
+    
+    Query Parameters:
+        - transaction_type: 'debit' (default) or 'credit'
+    
+    Returns:
+        Category statistics including category, amount, count, and percentage for each category
+    """
+    try:
+        account_service = AccountService(db)
+        account_service.ensure_account_owned_by_user(account_id, current_user.id)
+
+        etag = _build_account_etag(request, account_service, current_user.id, account_id)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        transaction_service = TransactionService(db)
+        statistics = transaction_service.get_category_spend_statistics(
+            account_id=account_id,
+            transaction_type=(
+                TRANSACTION_TYPE_CREDIT
+                if transaction_type == TransactionTypeFilter.CREDIT
+                else TRANSACTION_TYPE_DEBIT
+            )
+        )
+        
+        response = success_response(
+            data=statistics,
+            message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Category statistics")
+        )
+        return with_cache_headers(response, etag)
+    
+    except HTTPException:
+        raise
+    except Exception:
+        logger_exception(f"Failed to fetch category statistics for account_id={account_id}, user_id={current_user.id}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=Messages.SOMETHING_WENT_WRONG
+        )
+
+
+# ===========================================================================
+# Get Balance History
+# ===========================================================================
+@router.get(
+    "/{account_id}/balance-history",
+    response_model=ApiResponse[BalanceHistoryResponse],
+    dependencies=[Depends(authenticate_user)]
+)
+def get_balance_history(
+    request: Request,
+    account_id: int = Path(..., description="Account ID to fetch the balance history for"),
+    points: int = Query(365, ge=10, le=2000, description="Maximum number of points to return"),
+    method: BalanceDownsamplingMethod = Query(BalanceDownsamplingMethod.LTTB, description="Downsampling method: 'lttb' or 'minmax'"),
+    from_date: Optional[date] = Query(None, description="First day (inclusive), YYYY-MM-DD"),
+    to_date: Optional[date] = Query(None, description="Last day (inclusive), YYYY-MM-DD"),
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
+):
+    """
+    Fetches the end-of-day balance series of an account for charting.
+    
+    Path Parameters:
+        - account_id: The account ID to fetch the balance history for
+    
+    Query Parameters:
+        - points: Maximum number of points (default: 365, min: 10, max: 2000)
+        - method: 'lttb' (default, shape preserving) or 'minmax' (keeps every peak and trough)
+        - from_date / to_date: Optional inclusive date range
+    
+    Returns:
+        Downsampled balance points and the size of the full series
+    """
+    try:
+        account_service = AccountService(db)
+        account_service.ensure_account_owned_by_user(account_id, current_user.id)
+
+        etag = _build_account_etag(request, account_service, current_user.id, account_id)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        transaction_service = TransactionService(db)
+        history = transaction_service.get_balance_history(
+            account_id=account_id,
+            points=points,
+            method=method.value,
+            from_date=from_date,
+            to_date=to_date
+        )
+        
+        response = success_response(
+            data=history,
+            message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Balance history")
+        )
+        return with_cache_headers(response, etag)
+    
+    except HTTPException:
+        raise
+    except Exception:
+        logger_exception(f"Failed to fetch balance history for account_id={account_id}, user_id={current_user.id}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=Messages.SOMETHING_WENT_WRONG
+        )
+
+
 # ===========================================================================
 # Get Monthly Credit/Debit Statistics
 # ===========================================================================
@@ -241,10 +535,11 @@ def get_payment_type_statistics(
     dependencies=[Depends(authenticate_user)]
 )
 def get_monthly_credit_debit_statistics(
+    request: Request,
     account_id: int = Path(..., description="Account ID to fetch monthly statistics for"),
     year: Optional[int] = Query(None, description="Year to filter by. If not provided, returns available years only."),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(authenticate_user)
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
 ):
     """
     Fetches monthly credit and debit statistics for a given account and year.
@@ -259,16 +554,21 @@ def get_monthly_credit_debit_statistics(
         Monthly credit/debit statistics including available years and monthly data
     """
     try:
+        etag = _build_account_etag(request, AccountService(db), current_user.id, account_id)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
         transaction_service = TransactionService(db)
         statistics = transaction_service.get_monthly_credit_debit_statistics(
             account_id=account_id,
             year=year
         )
         
-        return success_response(
+        response = success_response(
             data=statistics,
             message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Monthly statistics")
         )
+        return with_cache_headers(response, etag)
     
     except HTTPException:
         raise
@@ -279,3 +579,58 @@ def get_monthly_credit_debit_statistics(
             detail=Messages.SOMETHING_WENT_WRONG
         )
 
+
+# ===========================================================================
+# Get Recurring Payments
+# ===========================================================================
+@router.get(
+    "/{account_id}/recurring-payments",
+    response_model=ApiResponse[List[RecurringPaymentResponse]],
+    dependencies=[Depends(authenticate_user)]
+)
+def get_recurring_payments(
+    request: Request,
+    account_id: int = Path(..., description="Account ID to fetch recurring payments for"),
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
+):
+    """
+    Fetches recurring payments (EMIs, SIPs, rent, subscriptions, salary) detected
+    in the account's transaction history.
+    
+    Path Parameters:
+        - account_id: The account ID to fetch recurring payments for
+    
+    Returns:
+        List of recurring payments, soonest expected payment first
+    """
+    try:
+        account_service = AccountService(db)
+        account_service.ensure_account_owned_by_user(account_id, current_user.id)
+
+        recurring_payment_service = RecurringPaymentService(db)
+
+        # Detection runs after ingest, so its own version is part of the ETag
+        etag = _build_account_etag(
+            request, account_service, current_user.id, account_id,
+            recurring_payment_service.get_version(account_id)
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        recurring_payments = recurring_payment_service.get_recurring_payments(account_id)
+        
+        response = success_response(
+            data=[RecurringPaymentResponse.model_validate(item) for item in recurring_payments],
+            message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Recurring payments")
+        )
+        return with_cache_headers(response, etag)
+    
+    except HTTPException:
+        raise
+    except Exception:
+        logger_exception(f"Failed to fetch recurring payments for account_id={account_id}, user_id={current_user.id}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=Messages.SOMETHING_WENT_WRONG
+        )
@@ -1,13 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Union
+from uuid import UUID, uuid4
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi.responses import StreamingResponse, FileResponse
 from sqlalchemy.orm import Session
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate as sqlalchemy_paginate
-from app.config.database import get_db
-from app.schemas.transaction import TransactionResponse, TransactionPaginationRequest
-from app.schemas.pagination import PaginatedResponse
+from app.config.database import SessionLocal, USE_REPLICA
+from app.dependencies.database import get_read_db
+from app.config.celery_client import get_celery_client
+from app.schemas.transaction import (
+    TransactionResponse,
+    TransactionPaginationRequest,
+    TransactionExportFormat,
+    TransactionExportRequest
+)
+from app.schemas.pagination import PaginatedResponse, CursorPaginatedResponse
+from app.schemas.response import ApiResponse
 from app.services.transaction_service import TransactionService
+from app.services.account_service import AccountService
 from app.dependencies.auth import authenticate_user
+from app.utils.principal_cache import Principal
 from app.utils.logger_util import logger_exception
+from app.utils.response import success_response
+from app.utils.export import EXPORT_STORAGE_DIR, MEDIA_TYPES, iter_export_chunks
 from app.constants.message import Messages
 
 
@@ -25,12 +40,12 @@ router = APIRouter(
 # ===========================================================================
 @router.post(
     "",
-    response_model=PaginatedResponse[TransactionResponse],
-    dependencies=[Depends(authenticate_user)]
+    response_model=Union[PaginatedResponse[TransactionResponse], CursorPaginatedResponse[TransactionResponse]]
 )
 def get_transactions(
     payload: TransactionPaginationRequest,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
 ):
     """
     Paginated transactions using JSON payload instead of query params.
@@ -38,21 +53,50 @@ def get_transactions(
     Supports page-based pagination using fastapi-pagination.
     Supports server-side sorting by date/time and amount only.
     
+    With `search`, switches to search mode: matches narrations and transaction IDs
+    (prefix, partial and fuzzy), ordered by relevance and paginated with
+    `cursor` / `next_cursor` instead of `page`. Sorting is ignored in search mode.
+    
     Request Body:
         - account_id: Account ID (required, min: 1)
         - page: Page number (default: 1, min: 1)
         - size: Page size (default: 10, min: 1, max: 100)
         - sort_by: Field name to sort by (optional, allowed values: 'transaction_timestamp', 'amount')
         - sort_order: Sort order - 'asc' or 'desc' (default: 'desc')
+        - search: Search string (optional, 2-100 characters)
+        - cursor: next_cursor of the previous search page (optional)
+        - from_date / to_date: Inclusive date range (optional)
+        - min_amount / max_amount: Inclusive amount range (optional)
+        - transaction_type: 'CREDIT' or 'DEBIT' (optional)
+        - modes: List of transaction modes, e.g. ["UPI", "NEFT"] (optional)
+        - category_ids: List of transaction category IDs (optional)
     """
+    AccountService(db).ensure_account_owned_by_user(payload.account_id, current_user.id)
+
     try:
         transaction_service = TransactionService(db)
 
+        if payload.search:
+            try:
+                return transaction_service.search_transactions(
+                    account_id=payload.account_id,
+                    search=payload.search,
+                    size=payload.size,
+                    cursor=payload.cursor,
+                    filters=payload.filters()
+                )
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                    detail=Messages.IS_NOT_VALID.replace(":name", "Cursor")
+                )
+
         # Build SQLAlchemy query with sorting
         query = transaction_service.get_transactions_by_account_id_query(
             account_id=payload.account_id,
             sort_by=payload.sort_by,
-            sort_order=payload.sort_order
+            sort_order=payload.sort_order,
+            filters=payload.filters()
         )
 
         # Convert payload → fastapi-pagination Params
@@ -61,6 +105,8 @@ def get_transactions(
         # Apply pagination
         return sqlalchemy_paginate(query, params=params)
 
+    except HTTPException:
+        raise
     except Exception:
         logger_exception(f"Failed to fetch transactions for account_id={payload.account_id}")
         raise HTTPException(
@@ -68,3 +114,103 @@ def get_transactions(
             detail=Messages.FETCH_FAILED.replace(":name", "Transactions")
         )
 
+
+# ===========================================================================
+# Stream Full Transaction History (CSV / Parquet)
+# ===========================================================================
+@router.get("/export")
+def stream_transaction_export(
+    account_id: int = Query(..., ge=1, description="Account ID to export transactions for"),
+    format: TransactionExportFormat = Query(TransactionExportFormat.CSV, description="Export format: 'csv' or 'parquet'"),
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
+):
+    """
+    Streams an account's full transaction history as CSV or Parquet.
+    Rows are read through a server-side cursor and encoded chunk by chunk,
+    so memory use is constant regardless of history size.
+    """
+    AccountService(db).ensure_account_owned_by_user(account_id, current_user.id)
+
+    def _stream():
+        # The response outlives the request-scoped session, so stream from a dedicated
+        # one routed the same way (the primary after a recent write)
+        stream_db = SessionLocal(info={USE_REPLICA: db.info.get(USE_REPLICA)})
+        try:
+            batches = TransactionService(stream_db).iter_transaction_batches(account_id)
+            yield from iter_export_chunks(batches, format.value)
+        finally:
+            stream_db.close()
+
+    return StreamingResponse(
+        _stream(),
+        media_type=MEDIA_TYPES[format.value],
+        headers={
+            "Content-Disposition": f'attachment; filename="transactions_{account_id}.{format.value}"'
+        }
+    )
+
+
+# ===========================================================================
+# Request Asynchronous Transaction Export
+# ===========================================================================
+@router.post(
+    "/export",
+    response_model=ApiResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
+def request_transaction_export(
+    payload: TransactionExportRequest,
+    db: Session = Depends(get_read_db),
+    current_user: Principal = Depends(authenticate_user)
+):
+    """
+    Queues a background export of an account's full transaction history.
+    The returned export_id is used to download the file once it is ready.
+    """
+    AccountService(db).ensure_account_owned_by_user(payload.account_id, current_user.id)
+
+    export_id = uuid4().hex
+    try:
+        get_celery_client().send_task(
+            "export_account_transactions",
+            args=[payload.account_id, current_user.id, payload.format.value, export_id]
+        )
+    except Exception:
+        logger_exception(f"Failed to queue transaction export for account_id={payload.account_id}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=Messages.SOMETHING_WENT_WRONG
+        )
+
+    return success_response(
+        data={"export_id": export_id},
+        message=Messages.CREATED_SUCCESSFULLY.replace(":name", "Export"),
+        status_code=status.HTTP_202_ACCEPTED
+    )
+
+
+# ===========================================================================
+# Download Asynchronous Transaction Export
+# ===========================================================================
+@router.get("/export/{export_id}")
+def download_transaction_export(
+    export_id: UUID = Path(..., description="Export ID returned when the export was requested"),
+    current_user: Principal = Depends(authenticate_user)
+):
+    """
+    Downloads a completed export. Returns 404 while the export is still running.
+    """
+    for export_format in TransactionExportFormat:
+        file_path = EXPORT_STORAGE_DIR / str(current_user.id) / f"{export_id.hex}.{export_format.value}"
+        if file_path.exists():
+            return FileResponse(
+                file_path,
+                media_type=MEDIA_TYPES[export_format.value],
+                filename=file_path.name
+            )
+
+    raise HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=Messages.EXPORT_NOT_READY
+    )
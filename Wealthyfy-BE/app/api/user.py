@@ -1,11 +1,16 @@
+import asyncio
+import json
 from fastapi import APIRouter, status, Depends, Response, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from app.config.database import get_db
+from app.config.database import get_db, SessionLocal
+from app.config.setting import settings
 from app.schemas.user import UserResponse, CreateUserPanAndPhoneRequest
 from app.schemas.response import ApiResponse
 from app.utils.response import success_response, error_response
 from app.services.user_services import UserService
-from app.dependencies.auth import authenticate_user
+from app.dependencies.auth import authenticate_user, authenticate_user_fresh
 from app.constants.message import Messages
 from app.schemas.pancard import VerifyPancardRequest, PanCardResponse
 from app.models.pancard import Pancard, ConsentEnum
@@ -15,6 +20,7 @@ from app.schemas.otp import SendOtpRequest, VerifyOtpRequest
 from app.constants.constant import PENDING
 from app.schemas.setu import LinkBankRequest
 from app.utils.helper import to_utc_z_format
+from app.utils.session_events import session_status_hub
 
 # ---------------------------------------------------------------------------
 # Router Configuration
@@ -224,7 +230,8 @@ def verify_otp(payload: VerifyOtpRequest):
 def link_bank(
     payload: LinkBankRequest,
     db: Session = Depends(get_db),
-    current_user=Depends(authenticate_user)
+    # Uncached: the PAN and phone number are usually saved just before this call
+    current_user=Depends(authenticate_user_fresh)
 ):
     pancard = current_user.pancard.pancard
     pancard_id = current_user.pancard.id
@@ -246,33 +253,13 @@ def link_bank(
     # Only create consent request if URL is present in response
     consent_request_id = None
     if consent_data.get("url"):
-        # Create user service instance
-        user_service = UserService(db)
-        
-        # Check and expire existing pending consents for the user
-        user_service.expire_pending_consents(user_id=current_user.id)
-        
-        # Create consent request
-        consent_request = user_service.create_consent_request(
+        # Expires the user's pending consents and stores this one with its
+        # FI types in a single statement
+        consent_request_id = UserService(db).create_consent_request(
             user_id=current_user.id,
             pan_id=pancard_id,
             consent_data=consent_data
         )
-        
-        # Store consent request primary key ID for response
-        consent_request_id = consent_request.id
-        
-        # Create consent FI types
-        detail = consent_data.get("detail", {})
-        fi_types = detail.get("fiTypes", [])
-        if fi_types:
-            user_service.create_consent_fi_types(
-                consent_request_id=consent_request.id,
-                fi_types=fi_types
-            )
-        else:
-            # Commit the consent request even if there are no FI types
-            db.commit()
     
     return success_response(
             data={
@@ -307,6 +294,77 @@ def check_session_status(
         message=Messages.FETCH_SUCCESSFULLY.replace(":name", "Session status")
     )
 
+# ===========================================================================
+# STREAM SESSION STATUS (SERVER-SENT EVENTS)
+# ===========================================================================
+def _read_session_status(consent_id: str) -> dict:
+    # Primary, not replica: the snapshot must include transitions published before subscribing
+    db = SessionLocal()
+    try:
+        return UserService(db).check_session_status(consent_id)
+    finally:
+        db.close()
+
+
+def _sse_event(data: dict) -> str:
+    return f"event: session-status\ndata: {json.dumps(data)}\n\n"
+
+
+@router.get(
+    "/session-status/stream",
+    dependencies=[Depends(authenticate_user)]
+)
+async def stream_session_status(
+    consent_id: str = Query(..., description="Consent ID to watch")
+):
+    """
+    Server-sent events replacement for polling /session-status.
+
+    Sends the current status immediately, then every transition pushed by the
+    webhook handler and the ingest worker, and closes once `is_ready` is true.
+    No DB connection is held while waiting. Streams end after
+    APP_SSE_STREAM_TIMEOUT_SECONDS; clients reconnect and get a fresh snapshot.
+    """
+    queue = session_status_hub.subscribe(consent_id)
+    try:
+        # Subscribe before reading the snapshot so no transition falls in between
+        await session_status_hub.wait_subscribed(timeout=2)
+        snapshot = await run_in_threadpool(_read_session_status, consent_id)
+    except BaseException:
+        session_status_hub.unsubscribe(consent_id, queue)
+        raise
+
+    async def _events():
+        try:
+            yield _sse_event(snapshot)
+            if snapshot.get("is_ready"):
+                return
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + settings.app.APP_SSE_STREAM_TIMEOUT_SECONDS
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    payload = await asyncio.wait_for(
+                        queue.get(),
+                        timeout=min(settings.app.APP_SSE_KEEPALIVE_SECONDS, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    # Comment line: keeps proxies from closing an idle connection
+                    yield ": keepalive\n\n"
+                    continue
+
+                yield _sse_event(payload)
+                if payload.get("is_ready"):
+                    return
+        finally:
+            session_status_hub.unsubscribe(consent_id, queue)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # ===========================================================================
 # MARK SETUP AS COMPLETE
 # ===========================================================================
@@ -1,10 +1,14 @@
 import pkgutil
 import importlib
 from celery import Celery
+from celery.signals import worker_process_init, task_prerun, task_postrun
 from app.config.setting import settings
+from app.config.celery_client import configure_celery
+from app.config.database import configure_worker_engines
 from app.jobs import tasks as tasks_pkg
 from app.jobs import scheduler as scheduler_pkg
 from app.config.logger import setup_logging
+from app.utils.profiling import start_task_profile, stop_task_profile
 
 # ---------------------------------------------------------
 # Initialize centralized logging FOR CELERY WORKERS
@@ -21,17 +25,31 @@ celery_app = Celery(
 )
 
 # ---------------------------------------------------------
-# Celery Base Configuration
+# Serialisation, queue topology and routing, shared with the
+# API's producer-only client (app.config.celery_client)
 # ---------------------------------------------------------
-celery_app.conf.update(
-    task_serializer="json",
-    result_serializer="json",
-    accept_content=["json"],
-    timezone="UTC",
-    enable_utc=True,
-    task_track_started=True,
-    worker_hijack_root_logger=False,
-)
+configure_celery(celery_app)
+
+
+# ---------------------------------------------------------
+# Worker-sized DB pools (one per forked child process)
+# ---------------------------------------------------------
+@worker_process_init.connect
+def _init_worker_db(**_kwargs):
+    configure_worker_engines()
+
+
+# ---------------------------------------------------------
+# Opt-in task profiling: send_task(..., kwargs={"_profile": True})
+# ---------------------------------------------------------
+@task_prerun.connect
+def _start_task_profile(task_id=None, task=None, kwargs=None, **_kwargs):
+    start_task_profile(task_id, task.name, kwargs)
+
+
+@task_postrun.connect
+def _stop_task_profile(task_id=None, **_kwargs):
+    stop_task_profile(task_id)
 
 
 # ----------------------------
@@ -0,0 +1,121 @@
+"""
+Celery configuration shared by the API and the workers, and the API's
+producer-only client.
+
+The API only ever sends tasks by name, so it uses get_celery_client(): the
+same broker, queues and routes as the workers, without importing the task
+modules, the beat schedule or the worker signal handlers that
+app.config.celery_app loads. Celery itself is imported on the first send.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Optional, TYPE_CHECKING
+from app.config.setting import settings
+from app.constants.constant import QUEUE_INTERACTIVE, QUEUE_REFRESH, QUEUE_MAINTENANCE, QUEUE_INGEST_LARGE
+
+if TYPE_CHECKING:
+    from celery import Celery
+
+# ---------------------------------------------------------
+# Queue Topology
+# One worker per queue, so a long refresh ingest or batch job never holds
+# up onboarding (see impcmmd.py for the worker commands). Priorities order
+# tasks within a queue; with the Redis broker 0 is the highest.
+# ---------------------------------------------------------
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 3
+PRIORITY_LOW = 6
+
+# First-time data of a user still onboarding; passed to send_task explicitly
+ONBOARDING_INGEST_ROUTE = {"queue": QUEUE_INTERACTIVE, "priority": PRIORITY_HIGH}
+
+TASK_ROUTES = {
+    "dispatch_notifications": {"queue": QUEUE_INTERACTIVE, "priority": PRIORITY_HIGH},
+    "export_account_transactions": {"queue": QUEUE_INTERACTIVE, "priority": PRIORITY_NORMAL},
+    "process_session_data": {"queue": QUEUE_REFRESH, "priority": PRIORITY_NORMAL},
+    "detect_recurring_payments": {"queue": QUEUE_REFRESH, "priority": PRIORITY_LOW},
+    "sync_fip_master_data": {"queue": QUEUE_MAINTENANCE, "priority": PRIORITY_NORMAL},
+    "refresh_term_deposit_projections": {"queue": QUEUE_MAINTENANCE, "priority": PRIORITY_LOW},
+    # Runs where exports are written, so it sees the same export directory
+    "expire_transaction_exports": {"queue": QUEUE_INTERACTIVE, "priority": PRIORITY_LOW},
+}
+
+
+def session_ingest_route(
+    file_size_bytes: Optional[int],
+    transaction_count: Optional[int],
+    is_onboarding: bool
+) -> Dict[str, Any]:
+    """
+    send_task routing options for a session ingest. Sessions at or above the
+    large-ingest thresholds go to the high-memory ingest-large worker (ahead of
+    its refresh work when the user is onboarding); the rest go to the
+    interactive queue while onboarding, else to the default route.
+    """
+    is_large = (
+        (file_size_bytes or 0) >= settings.celery.CELERY_LARGE_INGEST_BYTES
+        or (transaction_count or 0) >= settings.celery.CELERY_LARGE_INGEST_TRANSACTIONS
+    )
+    if is_large:
+        return {"queue": QUEUE_INGEST_LARGE, "priority": PRIORITY_HIGH if is_onboarding else PRIORITY_NORMAL}
+    return dict(ONBOARDING_INGEST_ROUTE) if is_onboarding else {}
+
+
+def configure_celery(celery: "Celery"):
+    """Applies the serialisation, queue topology and broker settings to an app."""
+    from kombu import Queue
+
+    celery.conf.update(
+        task_serializer="json",
+        result_serializer="json",
+        accept_content=["json"],
+        timezone="UTC",
+        enable_utc=True,
+        task_track_started=True,
+        worker_hijack_root_logger=False,
+
+        task_queues=tuple(
+            Queue(name, routing_key=name)
+            for name in (QUEUE_INTERACTIVE, QUEUE_REFRESH, QUEUE_MAINTENANCE, QUEUE_INGEST_LARGE)
+        ),
+        task_default_queue=QUEUE_REFRESH,
+        task_default_priority=PRIORITY_NORMAL,
+        task_routes=TASK_ROUTES,
+
+        # Acknowledge after the task finishes: a task whose worker shuts down or
+        # crashes is redelivered instead of lost. A child killed mid-task (e.g. by
+        # the OOM killer) only requeues tasks registered with
+        # reject_on_worker_lost=True - those safe to replay - so a task that kills
+        # its child cannot be redelivered forever. Each child reserves one task at
+        # a time, so a long ingest never sits in a busy child's prefetch buffer
+        # while other children are idle.
+        task_acks_late=True,
+        worker_prefetch_multiplier=1,
+
+        # Memory watchdog: a child left above this resident size by a task (large
+        # ingests parse the whole session file) is replaced once the task finishes
+        worker_max_memory_per_child=settings.celery.CELERY_WORKER_MAX_MEMORY_PER_CHILD_KB,
+
+        # Every task is fire-and-forget (send_task without reading the result)
+        task_ignore_result=True,
+
+        broker_transport_options={
+            "visibility_timeout": settings.celery.CELERY_VISIBILITY_TIMEOUT,
+            "queue_order_strategy": "priority",
+            "priority_steps": list(range(10)),
+            "sep": ":",
+        },
+    )
+
+
+@lru_cache(maxsize=1)
+def get_celery_client() -> "Celery":
+    """Producer-only Celery app, created on first use; send tasks by name."""
+    from celery import Celery
+
+    celery = Celery(
+        "wealthyfy",
+        broker=settings.celery.CELERY_BROKER_URL,
+        backend=settings.celery.CELERY_RESULT_BACKEND,
+    )
+    configure_celery(celery)
+    return celery
@@ -1,18 +1,121 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import time
+from contextlib import contextmanager
+from typing import Iterator
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
 from .setting import settings  # adjust path if needed
+from app.utils.write_marker import mark_recent_write
 
-engine = create_engine(
-    settings.db.DB_DATABASE_URL,
-    echo=settings.app.APP_DEBUG,
-    pool_pre_ping=True,
+# Session.info keys used by the routing session
+USE_REPLICA = "use_replica"
+LAST_WRITE_AT = "last_write_at"
+PENDING_WRITE = "pending_write"
+# Set to the acting user's id: commits then mark the user's recent write,
+# so the user's next requests read from the primary (see write_marker)
+WRITER_USER_ID = "writer_user_id"
+
+
+def _create_engine(url: str, pool_size: int, max_overflow: int):
+    return create_engine(
+        url,
+        echo=settings.app.APP_DEBUG,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.db.DB_POOL_TIMEOUT,
+        pool_recycle=settings.db.DB_POOL_RECYCLE,
+    )
+
+
+def _create_engines(pool_size: int, max_overflow: int):
+    primary = _create_engine(settings.db.DB_DATABASE_URL, pool_size, max_overflow)
+
+    replica_url = settings.db.DB_REPLICA_DATABASE_URL
+    replica = _create_engine(replica_url, pool_size, max_overflow) if replica_url else None
+
+    return primary, replica
+
+
+# --- Engines (API process defaults) ---
+engine, replica_engine = _create_engines(
+    settings.db.DB_POOL_SIZE,
+    settings.db.DB_MAX_OVERFLOW,
 )
 
+
+def configure_worker_engines():
+    """
+    Replace the engines inherited from the parent process with smaller,
+    worker-sized pools. Called once per Celery worker child after fork.
+    """
+    global engine, replica_engine
+
+    # Drop inherited connections without closing the parent's sockets
+    engine.dispose(close=False)
+    if replica_engine is not None:
+        replica_engine.dispose(close=False)
+
+    engine, replica_engine = _create_engines(
+        settings.db.DB_WORKER_POOL_SIZE,
+        settings.db.DB_WORKER_MAX_OVERFLOW,
+    )
+
+
+# --- Routing Session ---
+class RoutingSession(Session):
+    """
+    Session that sends reads to the read replica when opted in via
+    `info[USE_REPLICA]`. Flushes and DML always go to the primary, and once
+    a session has written, its reads stay on the primary for
+    DB_REPLICA_STICKY_SECONDS so callers read their own writes. Across
+    requests the same holds through the per-user write marker.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        is_write = self._flushing or (clause is not None and getattr(clause, "is_dml", False))
+
+        if is_write:
+            self.info[LAST_WRITE_AT] = time.monotonic()
+            self.info[PENDING_WRITE] = True
+            return engine
+
+        if replica_engine is None or not self.info.get(USE_REPLICA):
+            return engine
+
+        last_write_at = self.info.get(LAST_WRITE_AT)
+        if last_write_at and time.monotonic() - last_write_at < settings.db.DB_REPLICA_STICKY_SECONDS:
+            return engine
+
+        return replica_engine
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _mark_user_write(session: Session):
+    if session.info.pop(PENDING_WRITE, False) and session.info.get(WRITER_USER_ID):
+        mark_recent_write(session.info[WRITER_USER_ID])
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _discard_pending_write(session: Session):
+    session.info.pop(PENDING_WRITE, None)
+
+
+@contextmanager
+def use_primary(db: Session) -> Iterator[Session]:
+    """Routes a session's reads to the primary for the duration of the block."""
+    use_replica = db.info.get(USE_REPLICA)
+    db.info[USE_REPLICA] = False
+    try:
+        yield db
+    finally:
+        db.info[USE_REPLICA] = use_replica
+
+
 # --- Session Factory ---
 SessionLocal = sessionmaker(
+    class_=RoutingSession,
     autocommit=False,
     autoflush=False,
-    bind=engine
 )
 
 # --- Declarative Base for Models ---
@@ -0,0 +1,12 @@
+from redis import Redis
+from app.config.setting import settings
+
+# ---------------------------------------------------------
+# Shared Redis client (connects lazily on first command)
+# ---------------------------------------------------------
+redis_client = Redis.from_url(
+    settings.redis.REDIS_URL,
+    decode_responses=True,
+    socket_timeout=settings.redis.REDIS_SOCKET_TIMEOUT,
+    socket_connect_timeout=settings.redis.REDIS_SOCKET_TIMEOUT,
+)
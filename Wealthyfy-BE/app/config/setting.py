@@ -1,6 +1,12 @@
+from pathlib import Path
+from typing import Optional
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings
 from urllib.parse import quote_plus
 
+# Wealthyfy-BE root; relative storage paths resolve against it, not the cwd
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
 
 # ---------------------------------------------------------
 # App Configuration
@@ -11,6 +17,25 @@ class AppSettings(BaseSettings):
     APP_DEBUG: bool = True
     APP_PORT: int = 8000
     APP_ENCRYPTION_KEY: str
+    # Responses smaller than this (bytes) are sent uncompressed
+    APP_COMPRESSION_MIN_SIZE: int = 1024
+    # Server-sent event streams: keepalive comment interval and maximum lifetime
+    APP_SSE_KEEPALIVE_SECONDS: int = 15
+    APP_SSE_STREAM_TIMEOUT_SECONDS: int = 300
+    # Opt-in profiler (app.utils.profiling); request profiling is off without a secret
+    APP_PROFILING_SECRET: Optional[str] = None
+    APP_PROFILING_INTERVAL_MS: int = 5
+    APP_PROFILING_MAX_SECONDS: int = 60
+    APP_PROFILING_MAX_PER_MINUTE: int = 2
+    # Async transaction exports, written by the export worker and served by the API
+    # (both must see the same directory); deleted APP_EXPORT_TTL_HOURS after writing
+    APP_EXPORT_STORAGE_DIR: Path = PROJECT_ROOT / "storage" / "exports"
+    APP_EXPORT_TTL_HOURS: int = 24
+
+    @field_validator("APP_EXPORT_STORAGE_DIR")
+    @classmethod
+    def _absolute_storage_dir(cls, value: Path) -> Path:
+        return value if value.is_absolute() else PROJECT_ROOT / value
 
 
 # ---------------------------------------------------------
@@ -25,14 +50,38 @@ class DatabaseSettings(BaseSettings):
     DB_USERNAME: str
     DB_PASSWORD: str
 
-    @property
-    def DB_DATABASE_URL(self) -> str:
+    # Connection pool used by the API process
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+
+    # Connection pool used by each Celery worker child (one task at a time)
+    DB_WORKER_POOL_SIZE: int = 2
+    DB_WORKER_MAX_OVERFLOW: int = 2
+
+    # Optional read replica; read-only endpoints fall back to the primary when unset
+    DB_REPLICA_HOST: Optional[str] = None
+    DB_REPLICA_PORT: Optional[int] = None
+    DB_REPLICA_STICKY_SECONDS: float = 5.0
+
+    def _build_url(self, host: str, port: int) -> str:
         password = quote_plus(self.DB_PASSWORD)
         return (
             f"{self.DB_CONNECTION}+{self.DB_DRIVER}://{self.DB_USERNAME}:{password}"
-            f"@{self.DB_HOST}:{self.DB_PORT}/{self.DB_DATABASE}"
+            f"@{host}:{port}/{self.DB_DATABASE}"
         )
 
+    @property
+    def DB_DATABASE_URL(self) -> str:
+        return self._build_url(self.DB_HOST, self.DB_PORT)
+
+    @property
+    def DB_REPLICA_DATABASE_URL(self) -> Optional[str]:
+        if not self.DB_REPLICA_HOST:
+            return None
+        return self._build_url(self.DB_REPLICA_HOST, self.DB_REPLICA_PORT or self.DB_PORT)
+
 
 # ---------------------------------------------------------
 # Keycloak Configuration
@@ -59,6 +108,25 @@ class SetuSettings(BaseSettings):
     SETU_AA_PRODUCT_INSTANCE_ID: str
     SETU_AA_CLIENT_ID: str
     SETU_AA_CLIENT_SECRET: str
+    SETU_AA_AUTH_URL: str = "https://uat.setu.co/api/v2/auth/token"
+
+    # Outbound call protection, per process (see SetuService._request).
+    # Rate limits are per process too: set them to the Setu quota divided by
+    # the number of API and worker processes calling Setu.
+    SETU_CONNECT_TIMEOUT_SECONDS: float = 3.05
+    SETU_READ_TIMEOUT_SECONDS: float = 10
+    SETU_MAX_CONCURRENT_CALLS_PER_ENDPOINT: int = 8
+    SETU_BULKHEAD_WAIT_SECONDS: float = 1
+    SETU_PAN_RATE_LIMIT_PER_SECOND: float = 5
+    SETU_AA_RATE_LIMIT_PER_SECOND: float = 20
+    SETU_RATE_LIMIT_WAIT_SECONDS: float = 2
+    SETU_BREAKER_FAILURE_RATE: float = 0.5
+    SETU_BREAKER_MINIMUM_CALLS: int = 20
+    SETU_BREAKER_WINDOW_CALLS: int = 20
+    SETU_BREAKER_OPEN_SECONDS: float = 30
+    SETU_RETRY_ATTEMPTS: int = 3
+    SETU_RETRY_BASE_DELAY_SECONDS: float = 0.25
+    SETU_RETRY_MAX_DELAY_SECONDS: float = 2
 
 
 # ---------------------------------------------------------
@@ -68,6 +136,8 @@ class TwilloSettings(BaseSettings):
     TWILIO_ACCOUNT_SID: str
     TWILIO_AUTH_TOKEN: str
     TWILIO_VERIFICATION_SERVICE_SID: str
+    # Sends Twilio API calls to this base URL instead (e.g. a local stand-in server)
+    TWILIO_API_BASE_URL: Optional[str] = None
 
 # ---------------------------------------------------------
 # Pusher Configuration
@@ -78,12 +148,51 @@ class PusherSettings(BaseSettings):
     PUSHER_SECRET: str
     PUSHER_CLUSTER: str
     PUSHER_SSL: bool = True
+    # Overrides the cluster's API host (e.g. a local stand-in server)
+    PUSHER_HOST: Optional[str] = None
+    PUSHER_PORT: Optional[int] = None
 # ---------------------------------------------------------
 # Celery Configuration
 # ---------------------------------------------------------
 class CelerySettings(BaseSettings):
     CELERY_BROKER_URL: str
     CELERY_RESULT_BACKEND: str
+    # Unacknowledged tasks are redelivered after this long; must exceed the longest task
+    CELERY_VISIBILITY_TIMEOUT: int = 7200
+    # Session ingests at or above either threshold go to the ingest-large queue
+    CELERY_LARGE_INGEST_BYTES: int = 50 * 1024 * 1024
+    CELERY_LARGE_INGEST_TRANSACTIONS: int = 200_000
+    # A worker child whose resident memory exceeds this after a task is replaced
+    CELERY_WORKER_MAX_MEMORY_PER_CHILD_KB: int = 1_048_576
+    # Session ingests with FAILED accounts are retried (delay doubling per attempt)
+    CELERY_INGEST_MAX_RETRIES: int = 3
+    CELERY_INGEST_RETRY_DELAY_SECONDS: int = 60
+    # An ingest attempt redelivered after its worker died this many times is
+    # given up and the session marked FAILED (a file that kills its worker)
+    CELERY_INGEST_MAX_DELIVERIES: int = 3
+
+# ---------------------------------------------------------
+# Redis / Cache Configuration
+# ---------------------------------------------------------
+class RedisSettings(BaseSettings):
+    REDIS_URL: str = "redis://localhost:6380/2"
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+
+    # In-process LRU tier in front of Redis
+    CACHE_LRU_MAX_ENTRIES: int = 2048
+    CACHE_TTL_SECONDS: int = 86400
+
+    # Authenticated-user cache, keyed by Keycloak subject. In-process only unless
+    # PRINCIPAL_CACHE_REDIS is set; with the Redis tier an invalidation reaches
+    # every API process, whose local copies live PRINCIPAL_CACHE_LOCAL_TTL_SECONDS
+    PRINCIPAL_CACHE_REDIS: bool = False
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_LOCAL_TTL_SECONDS: int = 5
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+
+    # In-process consent_id -> consent request lookup of session polling and
+    # webhooks; entries never go stale, they live CACHE_TTL_SECONDS
+    CONSENT_REQUEST_CACHE_MAX_ENTRIES: int = 10000
 
 # ---------------------------------------------------------
 # Root Configuration
@@ -96,6 +205,7 @@ class Settings(BaseSettings):
     twillo: TwilloSettings
     pusher: PusherSettings
     celery: CelerySettings
+    redis: RedisSettings = Field(default_factory=RedisSettings)
 
     class Config:
         env_file = ".env"
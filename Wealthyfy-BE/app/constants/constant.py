@@ -16,4 +16,16 @@ TRANSACTION_TYPE_CREDIT = "CREDIT"
 TRANSACTION_TYPE_DEBIT = "DEBIT"
 
 # Date format constants
-DATE_FORMAT_YYYY_MM_DD = "%Y-%m-%d"
\ No newline at end of file
+DATE_FORMAT_YYYY_MM_DD = "%Y-%m-%d"
+
+# Calendar day boundaries for daily balance snapshots (AA data is IST)
+BALANCE_SNAPSHOT_TIMEZONE = "Asia/Kolkata"
+
+# Text search configuration for transaction narrations (no stemming or stop words)
+TRANSACTION_SEARCH_CONFIG = "simple"
+
+# Celery queues (routing and priorities in app.config.celery_client)
+QUEUE_INTERACTIVE = "interactive"    # A user is waiting: first-time onboarding ingest, notifications, exports
+QUEUE_REFRESH = "refresh"            # Periodic consent refresh ingest and its follow-ups
+QUEUE_MAINTENANCE = "maintenance"    # Scheduled batch jobs
+QUEUE_INGEST_LARGE = "ingest-large"  # Session ingests too big for the regular workers' memory
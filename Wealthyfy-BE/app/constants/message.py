@@ -10,6 +10,7 @@ class Messages:
     TOKEN_EXPIRED = "Token has expired. Please log in again."
     SOMETHING_WENT_WRONG = "Something went wrong. Please try again later."
     USER_NOT_FOUND = "User not found."
+    ACCOUNT_NOT_FOUND = "Account not found or access denied"
     CREATED_SUCCESSFULLY = ":name created successfully."
     FETCH_SUCCESSFULLY = ":name fetch successfully."
     UPDATE_SUCCESSFULLY = ":name update successfully."
@@ -23,4 +24,6 @@ class Messages:
     FAILED_TO_SEND_OTP = "Failed to send OTP. Please try again later."
     SAVED_SUCCESSFULLY = ":name saved successfully."
     CONSENT_CANCELLED_NEW_CONSENT_CREATED = "New consent created, previous pending consent expired"
-    UNKNOWN_ERROR = "An unknown error occurred."
\ No newline at end of file
+    UNKNOWN_ERROR = "An unknown error occurred."
+    EXPORT_NOT_READY = "Export not found or not ready yet."
+    SERVICE_UNAVAILABLE = ":name is temporarily unavailable. Please try again shortly."
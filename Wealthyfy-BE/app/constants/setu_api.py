@@ -6,7 +6,7 @@ class SetuAPI:
 
     PAN_VERIFICATION_API = f"{_settings.SETU_PANCARD_BASE_URL}/api/verify/pan"
     CREATE_CONSENT_API = f"{_settings.SETU_AA_BASE_URL}/consents"
-    AA_AUTH_TOKEN = "https://uat.setu.co/api/v2/auth/token"
+    AA_AUTH_TOKEN = _settings.SETU_AA_AUTH_URL
     CREATE_DATA_SESSION_API = f"{_settings.SETU_AA_BASE_URL}/sessions"
     FETCH_FIP_ID_API = f"{_settings.SETU_AA_BASE_URL}/fips"
     FETCH_SESSION_DATA_API = f"{_settings.SETU_AA_BASE_URL}/sessions/{'{session_id}'}"
\ No newline at end of file
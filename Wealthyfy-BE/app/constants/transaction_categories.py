@@ -0,0 +1,108 @@
+"""
+Transaction categories and the narration rules that map onto them.
+
+Category ids are stable: they are seeded by migration and stored on
+bank_transactions.category_id, so never renumber an existing entry.
+
+Rules are listed in priority order - when a narration matches several
+categories the first one listed wins (e.g. "NEFT/ACME CORP/SALARY" is SALARY,
+not TRANSFER).
+"""
+
+# Category ids
+SALARY = 1
+EMI_LOAN = 2
+INVESTMENTS = 3
+INSURANCE = 4
+TAXES = 5
+RENT = 6
+UTILITIES = 7
+FOOD_DINING = 8
+GROCERIES = 9
+SHOPPING = 10
+TRAVEL = 11
+FUEL = 12
+ENTERTAINMENT = 13
+HEALTH = 14
+INTEREST = 15
+BANK_CHARGES = 16
+CASH_WITHDRAWAL = 17
+TRANSFER = 18
+OTHERS = 19
+
+# (id, code, display name)
+TRANSACTION_CATEGORIES = [
+    (SALARY, "SALARY", "Salary"),
+    (EMI_LOAN, "EMI_LOAN", "EMI & Loans"),
+    (INVESTMENTS, "INVESTMENTS", "Investments"),
+    (INSURANCE, "INSURANCE", "Insurance"),
+    (TAXES, "TAXES", "Taxes"),
+    (RENT, "RENT", "Rent"),
+    (UTILITIES, "UTILITIES", "Bills & Utilities"),
+    (FOOD_DINING, "FOOD_DINING", "Food & Dining"),
+    (GROCERIES, "GROCERIES", "Groceries"),
+    (SHOPPING, "SHOPPING", "Shopping"),
+    (TRAVEL, "TRAVEL", "Travel"),
+    (FUEL, "FUEL", "Fuel"),
+    (ENTERTAINMENT, "ENTERTAINMENT", "Entertainment"),
+    (HEALTH, "HEALTH", "Health"),
+    (INTEREST, "INTEREST", "Interest"),
+    (BANK_CHARGES, "BANK_CHARGES", "Bank Charges"),
+    (CASH_WITHDRAWAL, "CASH_WITHDRAWAL", "Cash Withdrawal"),
+    (TRANSFER, "TRANSFER", "Transfers"),
+    (OTHERS, "OTHERS", "Others"),
+]
+
+# category id -> keywords, in priority order.
+# Keywords are whole words of the upper-cased narration ("INT PD" also matches
+# "Int.Pd"); a trailing "*" makes the last word a prefix ("PHARM*" matches
+# "PHARMACY" and "PHARMEASY").
+CATEGORY_RULES = [
+    (SALARY, ["SALARY", "SAL", "SAL CR", "PAYROLL"]),
+    (EMI_LOAN, ["EMI", "LOAN", "BAJAJ FINANCE", "BAJAJ FIN", "LN REPAY"]),
+    (INVESTMENTS, [
+        "MUTUAL FUND", "MF", "SIP", "ZERODHA", "GROWW", "UPSTOX", "INDIAN CLEARING CORP",
+        "ICCL", "NSE CLEARING", "PPF",
+    ]),
+    (INSURANCE, ["INSURANCE", "LIC", "PREMIUM", "POLICYBAZAAR"]),
+    (TAXES, ["INCOME TAX", "TDS", "CBDT", "GST", "ADVANCE TAX"]),
+    (RENT, ["RENT", "HOUSERENT", "NOBROKER"]),
+    (UTILITIES, [
+        "ELECTRICITY", "BESCOM", "BSES", "TATA POWER", "MSEDCL", "WATER BILL", "BILLDESK",
+        "RECHARGE", "AIRTEL", "JIO", "VODAFONE", "BROADBAND", "DTH", "TATA PLAY", "LPG",
+        "INDANE", "BHARAT GAS",
+    ]),
+    (FOOD_DINING, [
+        "SWIGGY", "ZOMATO", "DOMINO*", "MCDONALD*", "STARBUCKS", "KFC", "PIZZA*",
+        "RESTAURANT", "CAFE", "EATSURE",
+    ]),
+    (GROCERIES, [
+        "BIGBASKET", "BLINKIT", "GROFERS", "ZEPTO", "DMART", "AVENUE SUPERMARTS", "JIOMART",
+        "SUPERMARKET", "KIRANA", "INSTAMART",
+    ]),
+    (SHOPPING, [
+        "AMAZON", "AMAZONPAY", "FLIPKART", "MYNTRA", "AJIO", "NYKAA", "MEESHO", "TATA CLIQ",
+        "RELIANCE RETAIL", "DECATHLON",
+    ]),
+    (TRAVEL, [
+        "UBER", "OLA", "RAPIDO", "IRCTC", "MAKEMYTRIP", "GOIBIBO", "INDIGO", "AIR INDIA",
+        "REDBUS", "CLEARTRIP", "YATRA", "FASTAG", "METRO",
+    ]),
+    (FUEL, ["PETROL", "FUEL", "HPCL", "BPCL", "IOCL", "INDIAN OIL", "SHELL"]),
+    (ENTERTAINMENT, [
+        "NETFLIX", "SPOTIFY", "HOTSTAR", "BOOKMYSHOW", "PRIME VIDEO", "PVR", "INOX",
+        "YOUTUBE", "SONYLIV",
+    ]),
+    (HEALTH, [
+        "PHARM*", "APOLLO", "HOSPITAL", "MEDPLUS", "1MG", "PRACTO", "CLINIC",
+        "DIAGNOSTIC*", "NETMEDS",
+    ]),
+    (INTEREST, ["INT PD", "INTPD", "INTEREST", "INT CR", "SB INT"]),
+    (BANK_CHARGES, [
+        "CHARGES", "CHRG*", "CHGS", "AMC", "SMS ALERT", "MIN BAL", "PENALTY", "DEBIT CARD FEE",
+    ]),
+    (CASH_WITHDRAWAL, ["ATM", "ATW", "NFS", "CASH WDL", "CASH WITHDRAWAL", "CWDR"]),
+    # Lowest priority: anything that merely looks like money moving between people.
+    # Any UPI handle (x@bank) also lands here unless a rule above matched.
+    (TRANSFER, ["NEFT", "IMPS", "RTGS", "TRANSFER", "TRF", "SELF", "P2A", "P2P"]),
+]
@@ -1,29 +1,49 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from app.services.keyclock_service import KeycloakService
 from app.services.user_services import UserService
-from app.config.database import get_db
-from app.models.user import User
+from app.config.database import get_db, WRITER_USER_ID
 from sqlalchemy.orm import Session
-from app.constants.message import Messages
+from app.utils.principal_cache import Principal, get_cached_principal, cache_principal
 
 security = HTTPBearer(auto_error=True)
 
 def authenticate_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
-) -> User:
+) -> Principal:
     """
-    Validates the Keycloak token and returns the authenticated user object.
+    Validates the Keycloak token and returns the authenticated user's principal.
+    The user is read from the principal cache, and from the database on a miss.
     """
-    token = credentials.credentials
+    return _authenticate(credentials.credentials, db, use_cache=True)
+
+
+def authenticate_user_fresh(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db),
+) -> Principal:
+    """
+    authenticate_user reading the user from the database, for endpoints acting on
+    profile fields the user may just have changed through another API process.
+    """
+    return _authenticate(credentials.credentials, db, use_cache=False)
+
+
+def _authenticate(token: str, db: Session, use_cache: bool) -> Principal:
     keycloak = KeycloakService()
 
     token_data = keycloak.get_authenticate(token)
-    
+
     keycloak_user_id = token_data.get("sub")
 
-    user_service = UserService(db)
-    user = user_service.get_user_by_id(keycloak_user_id)
+    principal = get_cached_principal(keycloak_user_id) if use_cache else None
+    if principal is None:
+        user_service = UserService(db)
+        user = user_service.get_user_by_id(keycloak_user_id)
+        principal = Principal.from_user(user)
+        cache_principal(principal)
 
-    return user
+    # The request's write session is this one: its commits mark the user's recent write
+    db.info[WRITER_USER_ID] = principal.id
+    return principal
@@ -0,0 +1,18 @@
+from fastapi import Depends
+from app.config.database import SessionLocal, USE_REPLICA
+from app.dependencies.auth import authenticate_user
+from app.utils.principal_cache import Principal
+from app.utils.write_marker import has_recent_write
+
+
+def get_read_db(current_user: Principal = Depends(authenticate_user)):
+    """
+    Session for read-only endpoints, routed to the read replica unless the
+    user wrote within DB_REPLICA_STICKY_SECONDS (their write may not have
+    reached the replica yet).
+    """
+    db = SessionLocal(info={USE_REPLICA: not has_recent_write(current_user.id)})
+    try:
+        yield db
+    finally:
+        db.close()
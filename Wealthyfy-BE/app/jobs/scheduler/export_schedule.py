@@ -0,0 +1,10 @@
+from celery.schedules import crontab
+
+
+def register(celery_app):
+    celery_app.conf.beat_schedule.update({
+        "hourly-transaction-export-cleanup": {
+            "task": "expire_transaction_exports",
+            "schedule": crontab(minute=15),
+        }
+    })
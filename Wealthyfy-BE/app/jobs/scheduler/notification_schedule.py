@@ -0,0 +1,8 @@
+def register(celery_app):
+    celery_app.conf.beat_schedule.update({
+        # Delivers retries and notifications whose dispatch was never queued
+        "notification-outbox-sweep": {
+            "task": "dispatch_notifications",
+            "schedule": 30.0,
+        }
+    })
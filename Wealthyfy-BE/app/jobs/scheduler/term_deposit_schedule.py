@@ -0,0 +1,10 @@
+from celery.schedules import crontab
+
+
+def register(celery_app):
+    celery_app.conf.beat_schedule.update({
+        "nightly-term-deposit-projections": {
+            "task": "refresh_term_deposit_projections",
+            "schedule": crontab(hour=1, minute=30),
+        }
+    })
@@ -0,0 +1,67 @@
+from sqlalchemy.orm import Session
+from app.config.database import SessionLocal, USE_REPLICA
+from app.services.transaction_service import TransactionService
+from app.config.setting import settings
+from app.utils.export import EXPORT_STORAGE_DIR, delete_expired_exports, iter_export_chunks
+from app.utils.logger_util import logger_info, logger_error
+
+
+def register(celery_app):
+    """
+    Register transaction export Celery tasks.
+    """
+    @celery_app.task(name="export_account_transactions", bind=True, reject_on_worker_lost=True)
+    def export_account_transactions(self, account_id: int, user_id: int, export_format: str, export_id: str):
+        """
+        Stream an account's full transaction history into a downloadable file.
+
+        The file is written under a temporary name and renamed once complete,
+        so the download endpoint never serves a partial export.
+
+        Args:
+            account_id: The account to export
+            user_id: Owner of the account (exports are stored per user)
+            export_format: 'csv' or 'parquet'
+            export_id: Identifier returned to the client for the download
+        """
+        db: Session = SessionLocal(info={USE_REPLICA: True})
+
+        target_dir = EXPORT_STORAGE_DIR / str(user_id)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        final_path = target_dir / f"{export_id}.{export_format}"
+        part_path = target_dir / f"{export_id}.{export_format}.part"
+
+        logger_info("Starting transaction export", account_id=account_id, export_id=export_id)
+
+        try:
+            batches = TransactionService(db).iter_transaction_batches(account_id)
+
+            with open(part_path, "wb") as f:
+                for chunk in iter_export_chunks(batches, export_format):
+                    f.write(chunk)
+
+            part_path.rename(final_path)
+            logger_info("Transaction export completed", export_id=export_id, file_path=str(final_path))
+
+        except Exception as e:
+            logger_error(f"Transaction export failed: {e}", account_id=account_id, export_id=export_id)
+            part_path.unlink(missing_ok=True)
+            raise
+
+        finally:
+            db.close()
+
+    @celery_app.task(name="expire_transaction_exports", bind=True, reject_on_worker_lost=True)
+    def expire_transaction_exports(self):
+        """
+        Delete exports older than APP_EXPORT_TTL_HOURS. Clients download an
+        export shortly after requesting it; nothing else ever removes them.
+        """
+        try:
+            deleted = delete_expired_exports(settings.app.APP_EXPORT_TTL_HOURS * 3600)
+            logger_info("Expired transaction exports deleted", deleted_count=deleted)
+            return deleted
+
+        except Exception as e:
+            logger_error(f"Transaction export cleanup failed: {e}")
+            raise
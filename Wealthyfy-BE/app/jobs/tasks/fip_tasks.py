@@ -10,7 +10,7 @@ def register(celery_app):
     Register FIP-related Celery tasks.
     Tasks are registered at runtime to prevent circular imports.
     """
-    @celery_app.task(name="sync_fip_master_data",bind=True)
+    @celery_app.task(name="sync_fip_master_data", bind=True, reject_on_worker_lost=True)
     def sync_fip_master_data(self):
         """
         Pull FIP list from Setu and upsert into the database.
@@ -0,0 +1,47 @@
+from typing import Optional
+from sqlalchemy.orm import Session
+from app.config.database import SessionLocal
+from app.services.notification_service import NotificationService
+from app.services.pusher_service import PusherService
+from app.utils.logger_util import logger_error
+
+# One Pusher client (and HTTP connection pool) per worker process
+_pusher_service: Optional[PusherService] = None
+
+
+def _get_pusher_service() -> PusherService:
+    global _pusher_service
+    if _pusher_service is None:
+        _pusher_service = PusherService()
+    return _pusher_service
+
+
+def register(celery_app):
+    """
+    Register notification outbox Celery tasks.
+    """
+    @celery_app.task(name="dispatch_notifications", bind=True, reject_on_worker_lost=True)
+    def dispatch_notifications(self, batch_size: int = 500):
+        """
+        Drain the notification outbox. Queued right after a commit that
+        recorded notifications; the beat sweep picks up retries and any
+        dispatch that was never queued.
+        """
+        db: Session = SessionLocal()
+
+        try:
+            service = NotificationService(db)
+            pusher_service = _get_pusher_service()
+
+            while True:
+                counts = service.dispatch_pending(pusher_service, batch_size=batch_size)
+                if sum(counts.values()) < batch_size:
+                    break
+
+        except Exception as e:
+            db.rollback()
+            logger_error(f"Notification dispatch failed: {e}")
+            raise
+
+        finally:
+            db.close()
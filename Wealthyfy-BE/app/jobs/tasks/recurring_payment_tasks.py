@@ -0,0 +1,54 @@
+import time
+from typing import List
+from sqlalchemy.orm import Session
+from app.config.database import SessionLocal
+from app.services.recurring_payment_service import RecurringPaymentService
+from app.utils.logger_util import logger_info, logger_error
+
+
+def register(celery_app):
+    """
+    Register recurring payment detection Celery tasks.
+    """
+    @celery_app.task(name="detect_recurring_payments", bind=True)
+    def detect_recurring_payments(self, account_ids: List[int]):
+        """
+        Re-detect recurring payments for the accounts touched by an ingest.
+        Each account is committed on its own so one bad account does not
+        discard the others; accounts without new transactions are skipped.
+
+        Args:
+            account_ids: Financial account IDs to analyse
+        """
+        db: Session = SessionLocal()
+
+        try:
+            service = RecurringPaymentService(db)
+
+            for account_id in account_ids:
+                started_at = time.perf_counter()
+                try:
+                    series_count = service.refresh_account(account_id)
+                    db.commit()
+                    if series_count is None:
+                        logger_info(
+                            "Recurring payment detection skipped, no new transactions",
+                            account_id=account_id
+                        )
+                        continue
+
+                    logger_info(
+                        "Recurring payments detected",
+                        account_id=account_id,
+                        series_count=series_count,
+                        duration_ms=round((time.perf_counter() - started_at) * 1000, 2)
+                    )
+                except Exception as e:
+                    db.rollback()
+                    logger_error(
+                        f"Recurring payment detection failed: {e}",
+                        account_id=account_id
+                    )
+
+        finally:
+            db.close()
@@ -1,32 +1,46 @@
+from celery.exceptions import Retry
 from sqlalchemy.orm import Session
-from app.config.database import SessionLocal
+from app.config.database import SessionLocal, WRITER_USER_ID
+from app.config.setting import settings
 from app.models.consent_data_session import DataSession, DataSessionStatusEnum
 from app.models.financial_accounts import FinancialAccount
 from app.models.accounts_holder import AccountHolder
 from app.models.account_summary import AccountSummary
 from app.models.banking_account_details import BankingAccountDetails
 from app.models.bank_transaction import BankTransaction
+from app.models.daily_balance_snapshot import DailyBalanceSnapshot
 from app.models.term_deposit_details import TermDepositDetails
 from app.models.financial_institutions import FinancialInstitutions
 from app.models.consent_fI_type import FITypeEnum
 from app.models.consent_request import ConsentRequest
 from app.models.user import User
+from app.models.data_session_progress import DataSessionProgress, AccountIngestStatusEnum
 from app.utils.logger_util import logger_info, logger_error, logger_warning
-from app.services.pusher_service import PusherService
-from app.constants.constant import DATE_FORMAT_YYYY_MM_DD
+from app.services.notification_service import NotificationService
+from app.constants.constant import DATE_FORMAT_YYYY_MM_DD, BALANCE_SNAPSHOT_TIMEZONE
 from app.constants.pusher_events import SESSION_COMPLETED, DATA_FETCHING_COMPLETED
-from datetime import datetime
+from app.utils.analytics_cache import bump_data_versions
+from app.utils.categoriser import categoriser
+from app.utils.session_events import publish_session_status
+from app.utils.ingest_stats import IngestStats
+from datetime import datetime, date
+from zoneinfo import ZoneInfo
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from redis import RedisError
+from app.config.redis_client import redis_client
+
+INGEST_DELIVERIES_KEY = "ingest:deliveries:{data_session_id}:{retries}"
+INGEST_DELIVERIES_TTL_SECONDS = 86400
 
 
 def register(celery_app):
     """
     Register session data processing Celery tasks.
     """
-    @celery_app.task(name="process_session_data", bind=True)
+    @celery_app.task(name="process_session_data", bind=True, reject_on_worker_lost=True)
     def process_session_data(self, data_session_id: int):
         """
         Process session data file and insert parsed data into database tables.
@@ -54,6 +68,32 @@ def register(celery_app):
                 )
                 return
 
+            # Tasks are acknowledged late, so a crash after the commit below
+            # redelivers a session whose data is already in
+            if data_session.usage_count:
+                logger_info(
+                    "Session data already processed, skipping",
+                    data_session_id=data_session_id,
+                    usage_count=data_session.usage_count
+                )
+                return
+
+            # Requeued each time its worker dies: give up on a session that keeps
+            # killing workers instead of blocking its queue with it
+            deliveries = _count_delivery(data_session_id, self.request.retries)
+            if deliveries > settings.celery.CELERY_INGEST_MAX_DELIVERIES:
+                logger_error(
+                    "Session data processing keeps losing its worker, marking session failed",
+                    data_session_id=data_session_id,
+                    deliveries=deliveries,
+                    file_path=data_session.consent_file_path
+                )
+                data_session.status = DataSessionStatusEnum.FAILED
+                db.commit()
+                if data_session.consent_request:
+                    publish_session_status(data_session.consent_request.consent_id, data_session)
+                return
+
             if not data_session.consent_file_path:
                 logger_warning(
                     "No file path found in DataSession",
@@ -73,10 +113,16 @@ def register(celery_app):
                 )
                 return
 
+            stats = IngestStats()
+
             # Load JSON data
             try:
-                with open(file_path, 'r') as f:
-                    session_data = json.load(f)
+                with stats.stage("read"):
+                    with open(file_path, 'rb') as f:
+                        raw_data = f.read()
+                with stats.stage("parse"):
+                    session_data = json.loads(raw_data)
+                del raw_data
             except json.JSONDecodeError as e:
                 logger_error(
                     f"Failed to parse JSON file: {e}",
@@ -88,7 +134,7 @@ def register(celery_app):
             # Get consent request ID for linking
             consent_request_id = data_session.consent_request_id
 
-            # Get user_id from consent request for Pusher event
+            # Get user_id from consent request for Pusher events
             consent_request = db.query(ConsentRequest).filter(
                 ConsentRequest.id == consent_request_id
             ).first()
@@ -96,12 +142,34 @@ def register(celery_app):
             user_id = None
             if consent_request:
                 user_id = consent_request.user_id
+                # The user's reads go to the primary right after the ingest commits
+                db.info[WRITER_USER_ID] = user_id
 
-            # Send session completed event when processing starts
-            if user_id:
-                try:
-                    pusher_service = PusherService()
-                    pusher_service.trigger(
+            notification_service = NotificationService(db)
+
+            # Checkpoints left by an earlier attempt: resume after them
+            checkpoints = {
+                (progress.fip_id, progress.link_ref_number): progress
+                for progress in db.query(DataSessionProgress).filter(
+                    DataSessionProgress.data_session_id == data_session_id
+                )
+            }
+            if checkpoints:
+                logger_info(
+                    "Resuming session data processing",
+                    data_session_id=data_session_id,
+                    completed_accounts=sum(
+                        progress.status == AccountIngestStatusEnum.COMPLETED
+                        for progress in checkpoints.values()
+                    )
+                )
+
+            # Session completed event when processing starts; committed on its
+            # own so the user sees progress before the ingest finishes.
+            # Already sent by the attempt that left checkpoints
+            if user_id and not checkpoints:
+                with stats.stage("notify"):
+                    notification_service.enqueue(
                         user_id=user_id,
                         event=SESSION_COMPLETED,
                         data={
@@ -110,37 +178,86 @@ def register(celery_app):
                             "consent_id": consent_request.consent_id if consent_request else None
                         }
                     )
-                    logger_info(
-                        "Session completed event sent to user (processing started)",
-                        user_id=user_id,
-                        session_id=data_session.session_id
-                    )
-                except Exception as e:
-                    logger_error(
-                        f"Failed to send session completed event: {e}",
-                        user_id=user_id,
-                        session_id=data_session.session_id
-                    )
-                    # Don't raise - Pusher failure shouldn't fail the job
+                    db.commit()
+                    _queue_notification_dispatch(celery_app, data_session_id)
 
             # Process the session data
-            _process_session_data(
+            account_ids = _process_session_data(
                 db=db,
                 session_data=session_data,
                 consent_request_id=consent_request_id,
-                data_session_id=data_session_id
+                data_session_id=data_session_id,
+                checkpoints=checkpoints,
+                stats=stats
             )
 
-            # Commit all changes
-            db.commit()
-            # Increment usage_count after successful processing
+            # Accounts that failed are retried by a later attempt, which resumes
+            # after the committed ones: keep the file and leave usage_count unset.
+            # Once retries are used up the session is finalised with the accounts
+            # that made it in; the failed ones stay recorded in ingest_stats
+            failed_accounts = _failed_accounts(checkpoints)
+            if failed_accounts:
+                max_retries = settings.celery.CELERY_INGEST_MAX_RETRIES
+                if self.request.retries < max_retries:
+                    _save_ingest_stats(db, data_session, stats, checkpoints)
+                    logger_warning(
+                        "Session data processing incomplete, retrying failed accounts",
+                        data_session_id=data_session_id,
+                        failed_accounts=failed_accounts,
+                        retries=self.request.retries
+                    )
+                    raise self.retry(
+                        countdown=settings.celery.CELERY_INGEST_RETRY_DELAY_SECONDS * 2 ** self.request.retries,
+                        max_retries=max_retries
+                    )
+
+                logger_error(
+                    "Session accounts still failing after the last retry, finalising without them",
+                    data_session_id=data_session_id,
+                    failed_accounts=failed_accounts,
+                    retries=self.request.retries
+                )
+
+            # Data fetching completed event, recorded with the data it announces.
+            # Used to complete the FinishStep so the user sees the completion screen
+            if user_id:
+                notification_service.enqueue(
+                    user_id=user_id,
+                    event=DATA_FETCHING_COMPLETED,
+                    data={
+                        "status": "completed",
+                        "message": "Data fetching completed successfully"
+                    }
+                )
+
+            # Increment usage_count in the same commit as the data it counts
             data_session.usage_count = (data_session.usage_count or 0) + 1
-            db.commit()
+
+            # Commit all changes
+            with stats.stage("commit"):
+                db.commit()
             logger_info(
                 "Usage count incremented",
                 data_session_id=data_session_id,
                 usage_count=data_session.usage_count
             )
+            with stats.stage("notify"):
+                if user_id:
+                    _queue_notification_dispatch(celery_app, data_session_id)
+                # Invalidate cached analytics for every account touched by this ingest
+                bump_data_versions(account_ids)
+                # Recurring payment detection runs in its own task so ingest isn't held up
+                if account_ids:
+                    try:
+                        celery_app.send_task("detect_recurring_payments", args=[account_ids])
+                    except Exception as e:
+                        logger_error(
+                            f"Failed to queue recurring payment detection: {e}",
+                            data_session_id=data_session_id
+                        )
+                # Wakes up clients streaming /users/session-status/stream
+                if consent_request:
+                    publish_session_status(consent_request.consent_id, data_session)
             # Delete the file after successful processing
             try:
                 file_path.unlink()
@@ -156,37 +273,16 @@ def register(celery_app):
                     data_session_id=data_session_id
                 )
 
-            # Send data fetching completed event when processing is done
-            # This event is used to complete the FinishStep to ensure they see the completion screen
-            if user_id:
-                try:
-                    pusher_service = PusherService()
-                    pusher_service.trigger(
-                        user_id=user_id,
-                        event=DATA_FETCHING_COMPLETED,
-                        data={
-                            "status": "completed",
-                            "message": "Data fetching completed successfully"
-                        }
-                    )
-                    logger_info(
-                        "Data fetching completed event sent to user (processing done)",
-                        user_id=user_id,
-                        session_id=data_session.session_id
-                    )
-                except Exception as e:
-                    logger_error(
-                        f"Failed to send data fetching completed event: {e}",
-                        user_id=user_id,
-                        session_id=data_session.session_id
-                    )
-                    # Don't raise - Pusher failure shouldn't fail the job
+            _save_ingest_stats(db, data_session, stats, checkpoints)
 
             logger_info(
                 "Session data processing completed successfully",
                 data_session_id=data_session_id
             )
 
+        except Retry:
+            raise
+
         except Exception as e:
             logger_error(
                 f"Session data processing failed: {e}",
@@ -200,22 +296,112 @@ def register(celery_app):
             db.close()
 
 
+def _count_delivery(data_session_id: int, retries: int) -> int:
+    """
+    Counts the deliveries of one ingest attempt (retries start a new count).
+    Returns 0 when Redis is unavailable, so the ingest is never blocked by it.
+    """
+    key = INGEST_DELIVERIES_KEY.format(data_session_id=data_session_id, retries=retries)
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.incr(key)
+        pipe.expire(key, INGEST_DELIVERIES_TTL_SECONDS)
+        deliveries, _ = pipe.execute()
+        return deliveries
+    except RedisError as e:
+        logger_warning(f"Ingest delivery count failed: {e}", data_session_id=data_session_id)
+        return 0
+
+
+def _queue_notification_dispatch(celery_app, data_session_id: int):
+    """
+    Ask a worker to deliver the outbox right away. A failure here only delays
+    delivery until the next notification-outbox-sweep.
+    """
+    try:
+        celery_app.send_task("dispatch_notifications")
+    except Exception as e:
+        logger_error(
+            f"Failed to queue notification dispatch: {e}",
+            data_session_id=data_session_id
+        )
+
+
+def _save_ingest_stats(
+    db: Session,
+    data_session: DataSession,
+    stats: IngestStats,
+    checkpoints: Dict[Tuple[str, str], DataSessionProgress]
+):
+    """
+    Stores the ingest's timings and counters on the session and logs them as
+    the session's one summary line. Written after the data commit so commit
+    and notify time are included; a failure here never fails the ingest.
+    """
+    failed_accounts = _failed_accounts(checkpoints)
+    summary = stats.as_dict()
+    log = logger_warning if stats.has_data_issues else logger_info
+    log(
+        "Session ingest stats",
+        data_session_id=data_session.id,
+        total_ms=summary["total_ms"],
+        stages_ms=summary["stages_ms"],
+        counters=summary["counters"],
+        **({"failed_accounts": failed_accounts} if failed_accounts else {})
+    )
+
+    if failed_accounts:
+        summary["failed_accounts"] = failed_accounts
+
+    try:
+        data_session.ingest_stats = summary
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger_error(
+            f"Failed to store session ingest stats: {e}",
+            data_session_id=data_session.id
+        )
+
+
+def _failed_accounts(checkpoints: Dict[Tuple[str, str], DataSessionProgress]) -> List[str]:
+    """linkRefNumbers of the accounts whose last ingest attempt failed."""
+    return [
+        progress.link_ref_number for progress in checkpoints.values()
+        if progress.status == AccountIngestStatusEnum.FAILED
+    ]
+
+
 def _process_session_data(
     db: Session,
     session_data: Dict[str, Any],
     consent_request_id: int,
-    data_session_id: int
-):
+    data_session_id: int,
+    checkpoints: Dict[Tuple[str, str], DataSessionProgress],
+    stats: IngestStats
+) -> List[int]:
     """
     Process session data and insert into database tables.
+
+    Each account is ingested in its own savepoint and committed together with
+    its COMPLETED checkpoint, so a retry resumes after the last committed
+    account. An account that fails is rolled back to its savepoint and
+    recorded as FAILED, and the rest of the session carries on; the task
+    then retries the FAILED accounts.
     
     Args:
         db: Database session
         session_data: Parsed JSON session data
         consent_request_id: ID of the consent request
         data_session_id: ID of the data session
+        checkpoints: Progress rows of earlier attempts, by (fip_id, link_ref_number)
+        stats: Stage timings and counters of this ingest
+
+    Returns:
+        IDs of the financial accounts ingested, including resumed ones
     """
     fips = session_data.get("fips", [])
+    account_ids = []
 
     for fip_data in fips:
         fip_id = fip_data.get("fipID")
@@ -241,20 +427,89 @@ def _process_session_data(
         accounts = fip_data.get("accounts", [])
 
         for account_data in accounts:
-            _process_account(
-                db=db,
-                account_data=account_data,
-                fip_id=fip_id,
-                consent_request_id=consent_request_id
-            )
+            link_ref_number = account_data.get("linkRefNumber")
+            progress = checkpoints.get((fip_id, link_ref_number))
+            if progress and progress.status == AccountIngestStatusEnum.COMPLETED:
+                if progress.account_id:
+                    account_ids.append(progress.account_id)
+                stats.incr("accounts_resumed")
+                continue
+
+            try:
+                with db.begin_nested():
+                    account_id = _process_account(
+                        db=db,
+                        account_data=account_data,
+                        fip_id=fip_id,
+                        consent_request_id=consent_request_id,
+                        stats=stats
+                    )
+            except Exception as e:
+                stats.incr("accounts_failed")
+                logger_error(
+                    f"Account ingest failed, skipping account: {e}",
+                    data_session_id=data_session_id,
+                    fip_id=fip_id,
+                    link_ref_number=link_ref_number
+                )
+                if link_ref_number:
+                    _save_checkpoint(
+                        db, checkpoints, data_session_id, fip_id, link_ref_number,
+                        AccountIngestStatusEnum.FAILED, error=str(e)
+                    )
+                    with stats.stage("commit"):
+                        db.commit()
+                continue
+
+            if account_id:
+                account_ids.append(account_id)
+                stats.incr("accounts_ingested")
+                _save_checkpoint(
+                    db, checkpoints, data_session_id, fip_id, link_ref_number,
+                    AccountIngestStatusEnum.COMPLETED, account_id=account_id
+                )
+                # The account's data and its checkpoint become durable together
+                with stats.stage("commit"):
+                    db.commit()
+
+    return account_ids
+
+
+def _save_checkpoint(
+    db: Session,
+    checkpoints: Dict[Tuple[str, str], DataSessionProgress],
+    data_session_id: int,
+    fip_id: str,
+    link_ref_number: str,
+    status: AccountIngestStatusEnum,
+    account_id: Optional[int] = None,
+    error: Optional[str] = None
+):
+    """Creates or updates the progress row of one account (not committed)."""
+    progress = checkpoints.get((fip_id, link_ref_number))
+    if not progress:
+        progress = DataSessionProgress(
+            data_session_id=data_session_id,
+            fip_id=fip_id,
+            link_ref_number=link_ref_number,
+            attempts=0
+        )
+        db.add(progress)
+        checkpoints[(fip_id, link_ref_number)] = progress
+
+    progress.status = status
+    progress.attempts += 1
+    progress.account_id = account_id
+    progress.last_error = error[:1000] if error else None
 
 
 def _process_account(
     db: Session,
     account_data: Dict[str, Any],
     fip_id: str,
-    consent_request_id: int
-):
+    consent_request_id: int,
+    stats: IngestStats
+) -> Optional[int]:
     """
     Process a single account and insert into database.
     
@@ -263,6 +518,10 @@ def _process_account(
         account_data: Account data from session JSON
         fip_id: FIP ID
         consent_request_id: ID of the consent request
+        stats: Stage timings and counters of the ingest
+
+    Returns:
+        ID of the created financial account, or None if the account was skipped
     """
     link_ref_number = account_data.get("linkRefNumber")
     if not link_ref_number:
@@ -281,35 +540,41 @@ def _process_account(
     masked_account_number = account_data.get("maskedAccNumber", "")
 
     # Create new financial account (id will be auto-generated: 1, 2, 3...)
-    financial_account = FinancialAccount(
-        consent_id=consent_request_id,  # This maps to consent_request.id
-        fip_id=fip_id,
-        link_ref_number=link_ref_number,
-        masked_account_number=masked_account_number,
-        account_type=account_type
-    )
-    db.add(financial_account)
-    db.flush()  # Flush to get the auto-generated id
+    with stats.stage("accounts"):
+        financial_account = FinancialAccount(
+            consent_id=consent_request_id,  # This maps to consent_request.id
+            fip_id=fip_id,
+            link_ref_number=link_ref_number,
+            masked_account_number=masked_account_number,
+            account_type=account_type
+        )
+        db.add(financial_account)
+        db.flush()  # Flush to get the auto-generated id
 
     # Use the auto-generated id for relationships
     account_id = financial_account.id
 
     # Process account holders
-    _process_account_holders(db, account_info, account_id)
+    with stats.stage("holders"):
+        _process_account_holders(db, account_info, account_id, stats)
 
     # Process account summary and related data
-    _process_account_summary(db, account_info, account_id, account_type)
+    with stats.stage("summaries"):
+        _process_account_summary(db, account_info, account_id, account_type, stats)
 
     # Process transactions
-    _process_transactions(db, account_info, account_id)
+    with stats.stage("transactions"):
+        _process_transactions(db, account_info, account_id, stats)
 
-    # Note: We don't commit here - commit happens once after processing all accounts
+    # Note: We don't commit here - the caller commits each account with its checkpoint
+    return account_id
 
 
 def _process_account_holders(
     db: Session,
     account_info: Dict[str, Any],
-    account_id: int
+    account_id: int,
+    stats: IngestStats
 ):
     """
     Process account holders and insert into database.
@@ -318,6 +583,7 @@ def _process_account_holders(
         db: Database session
         account_info: Account information from JSON
         account_id: Account ID
+        stats: Counters of the ingest
     """
     profile = account_info.get("profile", {})
     holders_data = profile.get("holders", {})
@@ -334,10 +600,7 @@ def _process_account_holders(
             try:
                 dob = datetime.strptime(dob_str, DATE_FORMAT_YYYY_MM_DD)
             except ValueError:
-                logger_warning(
-                    f"Invalid date format for DOB: {dob_str}",
-                    account_id=account_id
-                )
+                stats.incr("invalid_dates")
 
         # Parse ckyc compliance
         ckyc_compliance = None
@@ -360,13 +623,15 @@ def _process_account_holders(
             pan=holder_data.get("pan")
         )
         db.add(account_holder)
+        stats.incr("holders_parsed")
 
 
 def _process_account_summary(
     db: Session,
     account_info: Dict[str, Any],
     account_id: int,
-    account_type: FITypeEnum
+    account_type: FITypeEnum,
+    stats: IngestStats
 ):
     """
     Process account summary and related banking/term deposit details.
@@ -376,6 +641,7 @@ def _process_account_summary(
         account_info: Account information from JSON
         account_id: Account ID
         account_type: Type of account (DEPOSIT, TERM_DEPOSIT, etc.)
+        stats: Counters of the ingest
     """
     summary_data = account_info.get("summary", {})
     if not summary_data:
@@ -390,10 +656,7 @@ def _process_account_summary(
             opening_date_str = opening_date_str.replace('Z', '+00:00')
             opening_date = datetime.fromisoformat(opening_date_str)
         except (ValueError, AttributeError):
-            logger_warning(
-                f"Invalid date format for openingDate: {opening_date_str}",
-                account_id=account_id
-            )
+            stats.incr("invalid_dates")
 
     # Create new account summary
     # Handle both ifscCode (for deposits) and ifsc (for term deposits)
@@ -410,17 +673,18 @@ def _process_account_summary(
 
     # Process banking account details (for DEPOSIT accounts)
     if account_type == FITypeEnum.DEPOSIT:
-        _process_banking_account_details(db, summary_data, account_summary.id)
+        _process_banking_account_details(db, summary_data, account_summary.id, stats)
 
     # Process term deposit details (for TERM_DEPOSIT accounts)
     if account_type == FITypeEnum.TERM_DEPOSIT:
-        _process_term_deposit_details(db, summary_data, account_summary.id)
+        _process_term_deposit_details(db, summary_data, account_summary.id, stats)
 
 
 def _process_banking_account_details(
     db: Session,
     summary_data: Dict[str, Any],
-    summary_id: int
+    summary_id: int,
+    stats: IngestStats
 ):
     """
     Process banking account details.
@@ -429,6 +693,7 @@ def _process_banking_account_details(
         db: Database session
         summary_data: Summary data from JSON
         summary_id: Account summary ID
+        stats: Counters of the ingest
     """
     # Parse balance date time
     balance_date_time = None
@@ -438,21 +703,19 @@ def _process_banking_account_details(
             balance_dt_str = balance_dt_str.replace('Z', '+00:00')
             balance_date_time = datetime.fromisoformat(balance_dt_str)
         except (ValueError, AttributeError):
-            logger_warning(
-                f"Invalid date format for balanceDateTime: {balance_dt_str}"
-            )
+            stats.incr("invalid_dates")
 
     # Parse pending amount
     pending = summary_data.get("pending", {})
-    pending_amount = _parse_decimal(pending.get("amount") if pending else None)
+    pending_amount = _parse_decimal(pending.get("amount") if pending else None, stats=stats)
 
     # Create new banking details
     banking_details = BankingAccountDetails(
         summary_id=summary_id,
-        current_balance=_parse_decimal(summary_data.get("currentBalance"), default=0),
-        available_balance=_parse_decimal(summary_data.get("availableBalance")),
-        current_od_limit=_parse_decimal(summary_data.get("currentODLimit")),
-        drawing_limit=_parse_decimal(summary_data.get("drawingLimit")),
+        current_balance=_parse_decimal(summary_data.get("currentBalance"), default=0, stats=stats),
+        available_balance=_parse_decimal(summary_data.get("availableBalance"), stats=stats),
+        current_od_limit=_parse_decimal(summary_data.get("currentODLimit"), stats=stats),
+        drawing_limit=_parse_decimal(summary_data.get("drawingLimit"), stats=stats),
         facility=summary_data.get("facility"),
         status=summary_data.get("status", ""),
         account_sub_type=summary_data.get("type", ""),
@@ -469,7 +732,8 @@ def _process_banking_account_details(
 def _process_term_deposit_details(
     db: Session,
     summary_data: Dict[str, Any],
-    summary_id: int
+    summary_id: int,
+    stats: IngestStats
 ):
     """
     Process term deposit details.
@@ -478,6 +742,7 @@ def _process_term_deposit_details(
         db: Database session
         summary_data: Summary data from JSON (may contain term deposit specific fields)
         summary_id: Account summary ID
+        stats: Counters of the ingest
     """
     # Parse maturity date
     maturity_date = None
@@ -487,30 +752,28 @@ def _process_term_deposit_details(
             maturity_date_str = maturity_date_str.replace('Z', '+00:00')
             maturity_date = datetime.fromisoformat(maturity_date_str)
         except (ValueError, AttributeError):
-            logger_warning(
-                f"Invalid date format for maturityDate: {maturity_date_str}"
-            )
+            stats.incr("invalid_dates")
 
     # Create new term deposit details
     term_deposit_details = TermDepositDetails(
         summary_id=summary_id,
         account_type=summary_data.get("type", ""),
         current_value=_parse_decimal(
-            summary_data.get("currentValue"), default=0),
+            summary_data.get("currentValue"), default=0, stats=stats),
         description=summary_data.get("description"),
         compounding_frequency=summary_data.get("compoundingFrequency"),
         interest_computation=summary_data.get("interestComputation"),
         interest_on_maturity=summary_data.get("interestOnMaturity"),
         interest_payout=summary_data.get("interestPayout"),
         interest_periodic_payout_amount=_parse_decimal(
-            summary_data.get("interestPeriodicPayoutAmount")),
+            summary_data.get("interestPeriodicPayoutAmount"), stats=stats),
         interest_rate=_parse_decimal(
-            summary_data.get("interestRate"), default=0),
-        maturity_amount=_parse_decimal(summary_data.get("maturityAmount")),
+            summary_data.get("interestRate"), default=0, stats=stats),
+        maturity_amount=_parse_decimal(summary_data.get("maturityAmount"), stats=stats),
         maturity_date=maturity_date,
         principal_amount=_parse_decimal(
-            summary_data.get("principalAmount"), default=0),
-        recurring_amount=_parse_decimal(summary_data.get("recurringAmount")),
+            summary_data.get("principalAmount"), default=0, stats=stats),
+        recurring_amount=_parse_decimal(summary_data.get("recurringAmount"), stats=stats),
         recurring_deposit_day=summary_data.get("recurringDepositDay"),
         tenure_days=summary_data.get("tenureDays"),
         tenure_months=summary_data.get("tenureMonths"),
@@ -522,7 +785,8 @@ def _process_term_deposit_details(
 def _process_transactions(
     db: Session,
     account_info: Dict[str, Any],
-    account_id: int
+    account_id: int,
+    stats: IngestStats
 ):
     """
     Process bank transactions and insert into database using bulk insertion.
@@ -531,6 +795,7 @@ def _process_transactions(
         db: Database session
         account_info: Account information from JSON
         account_id: Account ID
+        stats: Counters of the ingest
     """
     transactions_data = account_info.get("transactions", {})
     transactions_list = transactions_data.get("transaction", [])
@@ -550,38 +815,84 @@ def _process_transactions(
                 txn_timestamp_str = txn_timestamp_str.replace('Z', '+00:00')
                 txn_timestamp = datetime.fromisoformat(txn_timestamp_str)
             except (ValueError, AttributeError):
-                logger_warning(
-                    f"Invalid date format for transactionTimestamp: {txn_timestamp_str}",
-                    account_id=account_id
-                )
+                stats.incr("invalid_dates")
 
         if not txn_timestamp:
             # Skip transactions without valid timestamp
+            stats.incr("transactions_skipped")
             continue
 
+        narration = txn_data.get("narration")
+
         bulk_transactions.append({
             "account_id": account_id,
-            "amount": _parse_decimal(txn_data.get("amount"), default=0),
-            "balance": _parse_decimal(txn_data.get("balance") or txn_data.get("currentBalance")),
+            "amount": _parse_decimal(txn_data.get("amount"), default=0, stats=stats),
+            "balance": _parse_decimal(txn_data.get("balance") or txn_data.get("currentBalance"), stats=stats),
             "mode": txn_data.get("mode", ""),
-            "narration": txn_data.get("narration"),
+            "narration": narration,
+            "category_id": categoriser.categorise(narration),
             "transaction_timestamp": txn_timestamp,
             "transaction_id": txn_data.get("txnId", ""),
             "transaction_type": txn_data.get("type", "")
         })
 
+    stats.incr("transactions_parsed", len(bulk_transactions))
+
     # Bulk insert all transactions at once
     if bulk_transactions:
         db.bulk_insert_mappings(BankTransaction, bulk_transactions)
+        _process_daily_balances(db, bulk_transactions, account_id)
+
 
+def _process_daily_balances(
+    db: Session,
+    bulk_transactions: List[Dict[str, Any]],
+    account_id: int
+):
+    """
+    Derive end-of-day balance snapshots from the running balance of each transaction.
+    
+    Args:
+        db: Database session
+        bulk_transactions: Parsed transactions of the account
+        account_id: Account ID
+    """
+    snapshot_timezone = ZoneInfo(BALANCE_SNAPSHOT_TIMEZONE)
+    closing_balances: Dict[date, Decimal] = {}
 
-def _parse_decimal(value: Any, default: Optional[Decimal] = None) -> Optional[Decimal]:
+    # Stable sort keeps the FIP's order for transactions sharing a timestamp,
+    # so the last one seen on a day carries that day's closing balance
+    for txn in sorted(bulk_transactions, key=lambda t: t["transaction_timestamp"]):
+        if txn["balance"] is None:
+            continue
+        timestamp = txn["transaction_timestamp"]
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(snapshot_timezone)
+        closing_balances[timestamp.date()] = txn["balance"]
+
+    if closing_balances:
+        db.bulk_insert_mappings(DailyBalanceSnapshot, [
+            {
+                "account_id": account_id,
+                "snapshot_date": snapshot_date,
+                "closing_balance": closing_balance
+            }
+            for snapshot_date, closing_balance in closing_balances.items()
+        ])
+
+
+def _parse_decimal(
+    value: Any,
+    default: Optional[Decimal] = None,
+    stats: Optional[IngestStats] = None
+) -> Optional[Decimal]:
     """
     Safely parse a value to Decimal.
     
     Args:
         value: Value to parse
         default: Default value if parsing fails
+        stats: Counters of the ingest; counts values that fail to parse
     
     Returns:
         Decimal or None
@@ -596,4 +907,6 @@ def _parse_decimal(value: Any, default: Optional[Decimal] = None) -> Optional[De
     try:
         return Decimal(str(value))
     except (ValueError, TypeError, InvalidOperation):
+        if stats:
+            stats.incr("invalid_decimals")
         return default
@@ -0,0 +1,36 @@
+import time
+from sqlalchemy.orm import Session
+from app.config.database import SessionLocal
+from app.services.term_deposit_service import TermDepositService
+from app.utils.logger_util import logger_info, logger_error
+
+
+def register(celery_app):
+    """
+    Register term deposit projection Celery tasks.
+    """
+    @celery_app.task(name="refresh_term_deposit_projections", bind=True, reject_on_worker_lost=True)
+    def refresh_term_deposit_projections(self):
+        """
+        Nightly valuation of every term deposit: accrued interest, current value
+        and projected maturity value are recomputed and upserted in batches.
+        """
+        db: Session = SessionLocal()
+        started_at = time.perf_counter()
+
+        try:
+            written = TermDepositService(db).refresh_all_projections()
+            logger_info(
+                "Term deposit projections refreshed",
+                projection_count=written,
+                duration_ms=round((time.perf_counter() - started_at) * 1000, 2)
+            )
+            return written
+
+        except Exception as e:
+            db.rollback()
+            logger_error(f"Term deposit projection refresh failed: {e}")
+            raise
+
+        finally:
+            db.close()
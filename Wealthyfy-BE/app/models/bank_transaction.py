@@ -1,15 +1,24 @@
 from sqlalchemy import (
     Column,
+    Computed,
     String,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     Text,
+    text,
 )
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from app.config.database import Base
+from app.constants.constant import (
+    TRANSACTION_SEARCH_CONFIG,
+    TRANSACTION_TYPE_CREDIT,
+    TRANSACTION_TYPE_DEBIT,
+)
 
 
 class BankTransaction(Base):
@@ -24,7 +33,85 @@ class BankTransaction(Base):
     transaction_timestamp = Column(DateTime(timezone=True), nullable=False)
     transaction_id = Column(String(100), nullable=False)
     transaction_type = Column(String(50), nullable=False)
+    category_id = Column(Integer, ForeignKey('transaction_categories.id'), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Narrations are "/" and "-" separated (UPI/DR/123/SWIGGY/...), which the text
+    # parser would keep as one path-like token, so split on punctuation first
+    narration_search = deferred(Column(
+        TSVECTOR,
+        Computed(
+            f"to_tsvector('{TRANSACTION_SEARCH_CONFIG}', "
+            "regexp_replace(coalesce(narration, '') || ' ' || transaction_id, '[^[:alnum:]]+', ' ', 'g'))",
+            persisted=True
+        )
+    ))
     
     account = relationship("FinancialAccount", back_populates="transactions")
+    category = relationship("TransactionCategory")
+
+    __table_args__ = (
+        # Default listing order and date-range filters
+        Index(
+            "ix_bank_transactions_account_id_timestamp",
+            "account_id",
+            "transaction_timestamp"
+        ),
+        # Amount-range filters and amount sorting
+        Index(
+            "ix_bank_transactions_account_id_amount",
+            "account_id",
+            "amount"
+        ),
+        # One partial index per type: half the size of a composite one and
+        # still ordered by date. Matched only when the type is a literal.
+        Index(
+            "ix_bank_transactions_account_id_timestamp_debit",
+            "account_id",
+            "transaction_timestamp",
+            postgresql_where=text(f"transaction_type = '{TRANSACTION_TYPE_DEBIT}'")
+        ),
+        Index(
+            "ix_bank_transactions_account_id_timestamp_credit",
+            "account_id",
+            "transaction_timestamp",
+            postgresql_where=text(f"transaction_type = '{TRANSACTION_TYPE_CREDIT}'")
+        ),
+        Index(
+            "ix_bank_transactions_account_id_mode_timestamp",
+            "account_id",
+            "mode",
+            "transaction_timestamp"
+        ),
+        # Category filters in date order; spend-by-category stays an
+        # index-only GROUP BY thanks to the included columns
+        Index(
+            "ix_bank_transactions_account_id_category_id_timestamp",
+            "account_id",
+            "category_id",
+            "transaction_timestamp",
+            postgresql_include=["amount", "transaction_type"]
+        ),
+        # Search within an account; account_id in a GIN index needs btree_gin
+        Index(
+            "ix_bank_transactions_account_id_narration_search",
+            "account_id",
+            "narration_search",
+            postgresql_using="gin"
+        ),
+        Index(
+            "ix_bank_transactions_account_id_narration_trgm",
+            "account_id",
+            "narration",
+            postgresql_using="gin",
+            postgresql_ops={"narration": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_bank_transactions_account_id_transaction_id_trgm",
+            "account_id",
+            "transaction_id",
+            postgresql_using="gin",
+            postgresql_ops={"transaction_id": "gin_trgm_ops"}
+        ),
+    )
 
@@ -4,6 +4,7 @@ from sqlalchemy import (
     Integer,
     DateTime,
     ForeignKey,
+    Index,
     Enum as SqlEnum,
     JSON
 )
@@ -41,8 +42,7 @@ class DataSession(Base):
     consent_request_id = Column(
         Integer,
         ForeignKey("consent_request.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Combined status of the data session
@@ -65,6 +65,13 @@ class DataSession(Base):
         comment="Path to the stored consent file, if applicable"
     )
 
+    # Size of the stored session file, used to route its ingest
+    file_size_bytes = Column(Integer, nullable=True)
+    transaction_count = Column(Integer, nullable=True)
+
+    # Stage timings and data-quality counters of the last ingest (see app.utils.ingest_stats)
+    ingest_stats = Column(JSON, nullable=True)
+
     # Audit fields
     created_at = Column(
         DateTime(timezone=True),
@@ -82,3 +89,13 @@ class DataSession(Base):
         "ConsentRequest",
         back_populates="sessions"
     )
+
+    __table_args__ = (
+        # Latest session of a consent request (session status polling); also
+        # serves the foreign key lookups the single-column index did
+        Index(
+            "ix_consent_data_session_consent_request_id_id",
+            "consent_request_id",
+            id.desc()
+        ),
+    )
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, Date, ForeignKey, Numeric
+from app.config.database import Base
+
+
+class DailyBalanceSnapshot(Base):
+    """End-of-day balance of an account, one row per day with activity."""
+    __tablename__ = "daily_balance_snapshots"
+
+    # (account_id, snapshot_date) is the primary key, so a balance history
+    # is a single ordered index range scan
+    account_id = Column(
+        Integer,
+        ForeignKey("financial_accounts.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    snapshot_date = Column(Date, primary_key=True)
+    closing_balance = Column(Numeric(15, 2), nullable=False)
@@ -0,0 +1,62 @@
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    DateTime,
+    ForeignKey,
+    Text,
+    UniqueConstraint,
+    Enum as SqlEnum
+)
+from sqlalchemy.sql import func
+from enum import Enum
+from app.config.database import Base
+
+
+class AccountIngestStatusEnum(str, Enum):
+    """Outcome of ingesting one account of a data session."""
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
+class DataSessionProgress(Base):
+    """
+    Per-account checkpoint of a session ingest. A COMPLETED row is committed
+    with the account's data, so a retried ingest skips it; FAILED rows record
+    accounts that were isolated from the rest of the session.
+    """
+    __tablename__ = "data_session_progress"
+
+    id = Column(Integer, primary_key=True)
+    data_session_id = Column(
+        Integer,
+        ForeignKey("consent_data_session.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    fip_id = Column(String(255), nullable=False)
+    link_ref_number = Column(String(64), nullable=False)
+
+    # Set once the account is ingested
+    account_id = Column(
+        Integer,
+        ForeignKey("financial_accounts.id", ondelete="SET NULL"),
+        nullable=True
+    )
+
+    status = Column(
+        SqlEnum(AccountIngestStatusEnum, name="account_ingest_status_enum"),
+        nullable=False
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "data_session_id", "fip_id", "link_ref_number",
+            name="uq_data_session_progress_account"
+        ),
+    )
@@ -0,0 +1,63 @@
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    DateTime,
+    ForeignKey,
+    Index,
+    Text,
+    JSON,
+    Enum as SqlEnum,
+    text
+)
+from sqlalchemy.sql import func
+from enum import Enum
+from app.config.database import Base
+
+
+class NotificationStatusEnum(str, Enum):
+    """Delivery state of an outbox notification."""
+    PENDING = "PENDING"
+    SENT = "SENT"
+    SUPERSEDED = "SUPERSEDED"
+    FAILED = "FAILED"
+
+
+class NotificationOutbox(Base):
+    """
+    Pusher events recorded in the same transaction as the data they announce
+    and delivered afterwards by the dispatch_notifications task.
+    """
+    __tablename__ = "notification_outbox"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        nullable=False
+    )
+
+    event = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False)
+
+    status = Column(
+        SqlEnum(NotificationStatusEnum, name="notification_status_enum"),
+        nullable=False,
+        default=NotificationStatusEnum.PENDING
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+
+    # Retries are pushed back by moving available_at forward
+    available_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # The dispatcher only ever reads due pending rows
+        Index(
+            "ix_notification_outbox_pending_available_at",
+            "available_at",
+            postgresql_where=text("status = 'PENDING'")
+        ),
+    )
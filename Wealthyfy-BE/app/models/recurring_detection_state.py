@@ -0,0 +1,23 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy.sql import func
+from app.config.database import Base
+
+
+class RecurringDetectionState(Base):
+    """
+    Watermark of the transactions the last recurring detection of an account
+    covered. Detection is skipped while the account's transactions still match
+    it; the count catches rows committed out of id order.
+    """
+    __tablename__ = "recurring_detection_state"
+
+    account_id = Column(
+        Integer,
+        ForeignKey("financial_accounts.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+
+    last_transaction_id = Column(Integer, nullable=False)
+    transaction_count = Column(Integer, nullable=False)
+
+    detected_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -0,0 +1,64 @@
+from sqlalchemy import (
+    Column,
+    String,
+    Integer,
+    DateTime,
+    Float,
+    ForeignKey,
+    Numeric,
+    Enum as SqlEnum
+)
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from enum import Enum
+from app.config.database import Base
+
+
+class RecurringFrequencyEnum(str, Enum):
+    """Billing cycle of a detected recurring payment."""
+    WEEKLY = "WEEKLY"
+    FORTNIGHTLY = "FORTNIGHTLY"
+    MONTHLY = "MONTHLY"
+    QUARTERLY = "QUARTERLY"
+    HALF_YEARLY = "HALF_YEARLY"
+    YEARLY = "YEARLY"
+
+
+class RecurringPayment(Base):
+    """A recurring series (EMI, SIP, rent, subscription, salary) detected in an account's history."""
+    __tablename__ = "recurring_payments"
+
+    id = Column(Integer, primary_key=True)
+
+    account_id = Column(
+        Integer,
+        ForeignKey("financial_accounts.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    # Normalised counterparty the series was grouped by
+    counterparty = Column(String(100), nullable=False)
+    category_id = Column(Integer, ForeignKey("transaction_categories.id"), nullable=True)
+    transaction_type = Column(String(50), nullable=False)
+
+    frequency = Column(
+        SqlEnum(RecurringFrequencyEnum, name="recurring_frequency_enum"),
+        nullable=False
+    )
+    average_interval_days = Column(Float, nullable=False)
+    average_amount = Column(Numeric(15, 2), nullable=False)
+    last_amount = Column(Numeric(15, 2), nullable=False)
+    occurrences = Column(Integer, nullable=False)
+
+    first_seen_at = Column(DateTime(timezone=True), nullable=False)
+    last_seen_at = Column(DateTime(timezone=True), nullable=False)
+    next_expected_at = Column(DateTime(timezone=True), nullable=False)
+
+    # 0..1, higher when intervals and amounts are more regular
+    confidence = Column(Float, nullable=False)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    account = relationship("FinancialAccount")
+    category = relationship("TransactionCategory")
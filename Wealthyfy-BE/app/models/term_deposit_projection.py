@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, Date, DateTime, ForeignKey, Numeric
+from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
+from app.config.database import Base
+
+
+class TermDepositProjection(Base):
+    """Nightly valuation of a term deposit (see app.utils.deposit_projection)."""
+    __tablename__ = "term_deposit_projections"
+
+    summary_id = Column(
+        Integer,
+        ForeignKey("term_deposit_details.summary_id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    account_id = Column(
+        Integer,
+        ForeignKey("financial_accounts.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True
+    )
+
+    as_of_date = Column(Date, nullable=False)
+    accrued_interest = Column(Numeric(15, 2), nullable=False)
+    current_value = Column(Numeric(15, 2), nullable=False)
+    projected_maturity_value = Column(Numeric(15, 2), nullable=False)
+    maturity_date = Column(Date, nullable=False)
+    days_to_maturity = Column(Integer, nullable=False)
+
+    computed_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    term_deposit = relationship("TermDepositDetails")
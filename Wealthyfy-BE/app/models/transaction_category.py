@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.config.database import Base
+
+
+class TransactionCategory(Base):
+    __tablename__ = "transaction_categories"
+
+    # Ids are fixed (see app.constants.transaction_categories) and seeded by migration
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    code = Column(String(50), nullable=False, unique=True)
+    name = Column(String(100), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -51,6 +51,75 @@ class AccountMetricsResponse(BaseModel):
         from_attributes = True
 
 
+class PortfolioAccount(BaseModel):
+    """Schema for a single account in the portfolio overview."""
+    
+    id: int = Field(..., description="Account ID")
+    account_type: str = Field(..., description="Account type (DEPOSIT or TERM_DEPOSIT)")
+    masked_account_number: Optional[str] = Field(None, description="Masked account number")
+    institution_name: Optional[str] = Field(None, description="Financial institution name")
+    current_value: Optional[float] = Field(None, description="Current balance (deposits) or current value (term deposits)")
+    maturity_date: Optional[datetime] = Field(None, description="Maturity date (term deposits only)")
+    last_month_total_credit: float = Field(0.0, description="Total credit transactions in last month")
+    last_month_total_debit: float = Field(0.0, description="Total debit transactions in last month")
+
+
+class PortfolioTypeTotal(BaseModel):
+    """Schema for portfolio totals of one account type."""
+    
+    account_type: str = Field(..., description="Account type (DEPOSIT or TERM_DEPOSIT)")
+    account_count: int = Field(..., description="Number of accounts of this type")
+    total_value: float = Field(..., description="Sum of current balances / values")
+    last_month_total_credit: float = Field(..., description="Total credit transactions in last month")
+    last_month_total_debit: float = Field(..., description="Total debit transactions in last month")
+
+
+class PortfolioOverviewResponse(BaseModel):
+    """Schema for the user-level portfolio overview."""
+    
+    accounts: List[PortfolioAccount] = Field(..., description="Every deposit and term deposit account")
+    totals: List[PortfolioTypeTotal] = Field(..., description="Totals per account type")
+    total_value: float = Field(..., description="Total value across all accounts")
+
+    class Config:
+        from_attributes = True
+
+
+class TermDepositProjectionItem(BaseModel):
+    """Schema for the projection of a single term deposit."""
+    
+    account_id: int = Field(..., description="Account ID")
+    principal: float = Field(..., description="Principal amount")
+    interest_rate: float = Field(..., description="Annual interest rate in percent")
+    maturity_date: str = Field(..., description="Maturity date (YYYY-MM-DD)")
+    days_to_maturity: int = Field(..., description="Days left until maturity")
+    accrued_interest: float = Field(..., description="Interest accrued up to the valuation date")
+    current_value: float = Field(..., description="Value on the valuation date")
+    projected_maturity_value: float = Field(..., description="Projected value at maturity")
+
+
+class MaturityLadderEntry(BaseModel):
+    """Schema for the deposits maturing in one calendar month."""
+    
+    month: str = Field(..., description="Maturity month (YYYY-MM)")
+    deposit_count: int = Field(..., description="Number of deposits maturing in the month")
+    maturity_value: float = Field(..., description="Total projected maturity value")
+
+
+class TermDepositProjectionResponse(BaseModel):
+    """Schema for the term deposit projections of a user."""
+    
+    as_of_date: str = Field(..., description="Valuation date (YYYY-MM-DD)")
+    deposits: List[TermDepositProjectionItem] = Field(..., description="Projection per term deposit")
+    maturity_ladder: List[MaturityLadderEntry] = Field(..., description="Projected maturity value per month")
+    total_principal: float = Field(..., description="Total principal")
+    total_accrued_interest: float = Field(..., description="Total interest accrued to date")
+    total_projected_maturity_value: float = Field(..., description="Total projected maturity value")
+
+    class Config:
+        from_attributes = True
+
+
 class PaymentTypeStatistic(BaseModel):
     """Schema for individual payment type statistic."""
     
@@ -70,6 +139,43 @@ class PaymentTypeStatisticsResponse(BaseModel):
         from_attributes = True
 
 
+class CategorySpendStatistic(BaseModel):
+    """Schema for individual category spend statistic."""
+    
+    category: str = Field(..., description="Category code (FOOD_DINING, SHOPPING, etc.)")
+    name: str = Field(..., description="Category display name")
+    amount: float = Field(..., description="Total amount for this category")
+    count: int = Field(..., description="Number of transactions in this category")
+    percentage: float = Field(..., description="Percentage of total amount")
+
+
+class CategorySpendStatisticsResponse(BaseModel):
+    """Schema for category spend statistics response."""
+    
+    categories: List[CategorySpendStatistic] = Field(..., description="List of categories with statistics")
+    total_amount: float = Field(..., description="Total amount across all categories")
+
+    class Config:
+        from_attributes = True
+
+
+class BalanceHistoryPoint(BaseModel):
+    """Schema for a single end-of-day balance point."""
+    
+    date: str = Field(..., description="Day (YYYY-MM-DD)")
+    balance: float = Field(..., description="Closing balance of the day")
+
+
+class BalanceHistoryResponse(BaseModel):
+    """Schema for balance history response."""
+    
+    points: List[BalanceHistoryPoint] = Field(..., description="Downsampled end-of-day balances in date order")
+    total_points: int = Field(..., description="Number of days with a balance before downsampling")
+
+    class Config:
+        from_attributes = True
+
+
 class MonthlyCreditDebitData(BaseModel):
     """Schema for monthly credit/debit data."""
     
@@ -87,3 +193,23 @@ class MonthlyCreditDebitStatisticsResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+class RecurringPaymentResponse(BaseModel):
+    """Schema for a detected recurring payment (EMI, SIP, rent, subscription, salary)."""
+    
+    id: int = Field(..., description="Recurring payment ID")
+    counterparty: str = Field(..., description="Normalised counterparty name")
+    category_id: Optional[int] = Field(None, description="Transaction category of the series")
+    transaction_type: str = Field(..., description="Transaction type (CREDIT or DEBIT)")
+    frequency: str = Field(..., description="Billing cycle (WEEKLY, MONTHLY, QUARTERLY, etc.)")
+    average_interval_days: float = Field(..., description="Mean days between payments")
+    average_amount: float = Field(..., description="Mean payment amount")
+    last_amount: float = Field(..., description="Amount of the most recent payment")
+    occurrences: int = Field(..., description="Number of payments in the series")
+    first_seen_at: datetime = Field(..., description="First payment timestamp")
+    last_seen_at: datetime = Field(..., description="Most recent payment timestamp")
+    next_expected_at: datetime = Field(..., description="Expected timestamp of the next payment")
+    confidence: float = Field(..., description="Detection confidence between 0 and 1")
+
+    class Config:
+        from_attributes = True
@@ -19,3 +19,10 @@ class PaginatedResponse(BaseModel, Generic[T]):
     page: int = Field(..., description="Current page number (1-indexed)")
     size: int = Field(..., description="Number of items per page")
 
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Generic keyset-paginated response schema."""
+    items: List[T] = Field(..., description="List of items in the current page")
+    size: int = Field(..., description="Number of items per page")
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, null on the last page")
@@ -1,5 +1,7 @@
-from datetime import datetime
-from pydantic import BaseModel, Field, field_serializer
+from datetime import datetime, date
+from enum import Enum
+from typing import Optional, List, Literal, Dict, Any
+from pydantic import BaseModel, Field, field_serializer, field_validator, model_validator
 from decimal import Decimal
 from app.schemas.pagination import BasePaginationRequest
 
@@ -7,6 +9,50 @@ from app.schemas.pagination import BasePaginationRequest
 class TransactionPaginationRequest(BasePaginationRequest):
     """Schema for transaction pagination request."""
     account_id: int = Field(..., ge=1, description="Account ID to filter transactions")
+    search: Optional[str] = Field(
+        None,
+        min_length=2,
+        max_length=100,
+        description="Search narrations and transaction IDs; results are ranked and keyset-paginated"
+    )
+    cursor: Optional[str] = Field(None, description="next_cursor of the previous search page")
+    from_date: Optional[date] = Field(None, description="Only transactions on or after this date")
+    to_date: Optional[date] = Field(None, description="Only transactions on or before this date")
+    min_amount: Optional[float] = Field(None, ge=0, description="Minimum amount (inclusive)")
+    max_amount: Optional[float] = Field(None, ge=0, description="Maximum amount (inclusive)")
+    transaction_type: Optional[Literal["CREDIT", "DEBIT"]] = Field(None, description="Transaction type: 'CREDIT' or 'DEBIT'")
+    modes: Optional[List[str]] = Field(None, min_length=1, max_length=10, description="Transaction modes (UPI, NEFT, IMPS, ...)")
+    category_ids: Optional[List[int]] = Field(None, min_length=1, max_length=20, description="Transaction category IDs")
+
+    @field_validator("transaction_type", mode="before")
+    def normalize_transaction_type(cls, value):
+        """Normalize transaction type to uppercase before validation."""
+        return value.upper() if isinstance(value, str) else value
+
+    @field_validator("modes", mode="before")
+    def normalize_modes(cls, value):
+        """Normalize modes to uppercase and drop duplicates."""
+        if isinstance(value, list):
+            return list(dict.fromkeys(
+                mode.strip().upper() if isinstance(mode, str) else mode for mode in value
+            ))
+        return value
+
+    @model_validator(mode="after")
+    def validate_ranges(self):
+        """Reject ranges that can never match."""
+        if self.from_date and self.to_date and self.from_date > self.to_date:
+            raise ValueError("from_date must be on or before to_date")
+        if self.min_amount is not None and self.max_amount is not None and self.min_amount > self.max_amount:
+            raise ValueError("min_amount must be less than or equal to max_amount")
+        return self
+
+    def filters(self) -> Dict[str, Any]:
+        """Filter fields as keyword arguments for TransactionService."""
+        return self.model_dump(include={
+            "from_date", "to_date", "min_amount", "max_amount",
+            "transaction_type", "modes", "category_ids",
+        })
 
 
 class TransactionResponse(BaseModel):
@@ -19,6 +65,7 @@ class TransactionResponse(BaseModel):
     transaction_timestamp: datetime = Field(..., description="Transaction timestamp")
     transaction_id: str = Field(..., description="Transaction identifier")
     transaction_type: str = Field(..., description="Transaction type (CREDIT or DEBIT)")
+    narration: Optional[str] = Field(None, description="Transaction narration")
 
     @field_serializer('amount')
     def serialize_amount(self, value: Decimal | float) -> float:
@@ -32,3 +79,15 @@ class TransactionResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class TransactionExportFormat(str, Enum):
+    """Supported transaction export formats."""
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
+class TransactionExportRequest(BaseModel):
+    """Schema for requesting an asynchronous transaction export."""
+    account_id: int = Field(..., ge=1, description="Account ID to export transactions for")
+    format: TransactionExportFormat = Field(TransactionExportFormat.CSV, description="Export format: 'csv' or 'parquet'")
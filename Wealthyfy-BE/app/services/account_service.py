@@ -1,4 +1,6 @@
 from typing import List, Optional, Dict, Any
+from fastapi import HTTPException, status
+from sqlalchemy import func, case
 from sqlalchemy.orm import selectinload, load_only, joinedload
 from app.services.base_service import BaseService
 from app.models.financial_accounts import FinancialAccount
@@ -6,6 +8,14 @@ from app.models.accounts_holder import AccountHolder
 from app.models.consent_request import ConsentRequest
 from app.models.consent_fI_type import FITypeEnum
 from app.models.account_summary import AccountSummary
+from app.models.consent_data_session import DataSession
+from app.models.banking_account_details import BankingAccountDetails
+from app.models.term_deposit_details import TermDepositDetails
+from app.models.bank_transaction import BankTransaction
+from app.models.financial_institutions import FinancialInstitutions
+from app.constants.constant import TRANSACTION_TYPE_CREDIT, TRANSACTION_TYPE_DEBIT
+from app.services.transaction_service import last_month_range
+from app.constants.message import Messages
 
 
 class AccountService(BaseService):
@@ -46,6 +56,151 @@ class AccountService(BaseService):
         
         return query.all()
 
+    def get_portfolio_overview(self, user_id: int) -> Dict[str, Any]:
+        """
+        Returns every DEPOSIT and TERM_DEPOSIT account of a user with its current
+        balance (or current value), last month's flows and totals per account type.
+        Everything comes from one statement, so latency does not grow with the
+        number of linked accounts.
+        
+        Args:
+            user_id: The user ID owning the accounts
+            
+        Returns:
+            Dictionary containing accounts, per-type totals and the overall total
+        """
+        first_day_last_month, first_day_this_month = last_month_range()
+        portfolio_types = (FITypeEnum.DEPOSIT, FITypeEnum.TERM_DEPOSIT)
+
+        # Last month's credit/debit per account, aggregated in the same statement
+        flows = self.db.query(
+            BankTransaction.account_id.label("account_id"),
+            func.sum(
+                case((BankTransaction.transaction_type == TRANSACTION_TYPE_CREDIT, BankTransaction.amount), else_=0)
+            ).label("credit"),
+            func.sum(
+                case((BankTransaction.transaction_type == TRANSACTION_TYPE_DEBIT, BankTransaction.amount), else_=0)
+            ).label("debit")
+        ).join(
+            FinancialAccount,
+            BankTransaction.account_id == FinancialAccount.id
+        ).join(
+            ConsentRequest,
+            FinancialAccount.consent_id == ConsentRequest.id
+        ).filter(
+            ConsentRequest.user_id == user_id,
+            BankTransaction.transaction_timestamp >= first_day_last_month,
+            BankTransaction.transaction_timestamp < first_day_this_month
+        ).group_by(
+            BankTransaction.account_id
+        ).subquery()
+
+        rows = self.db.query(
+            FinancialAccount.id,
+            FinancialAccount.account_type,
+            FinancialAccount.masked_account_number,
+            FinancialInstitutions.name.label("institution_name"),
+            BankingAccountDetails.current_balance,
+            TermDepositDetails.current_value,
+            TermDepositDetails.maturity_date,
+            func.coalesce(flows.c.credit, 0).label("credit"),
+            func.coalesce(flows.c.debit, 0).label("debit")
+        ).join(
+            ConsentRequest,
+            FinancialAccount.consent_id == ConsentRequest.id
+        ).outerjoin(
+            FinancialInstitutions,
+            FinancialInstitutions.fip_id == FinancialAccount.fip_id
+        ).outerjoin(
+            AccountSummary,
+            AccountSummary.account_id == FinancialAccount.id
+        ).outerjoin(
+            BankingAccountDetails,
+            BankingAccountDetails.summary_id == AccountSummary.id
+        ).outerjoin(
+            TermDepositDetails,
+            TermDepositDetails.summary_id == AccountSummary.id
+        ).outerjoin(
+            flows,
+            flows.c.account_id == FinancialAccount.id
+        ).filter(
+            ConsentRequest.user_id == user_id,
+            FinancialAccount.account_type.in_(portfolio_types)
+        ).order_by(
+            FinancialAccount.created_at.desc()
+        ).all()
+
+        totals = {
+            account_type.value: {
+                "account_type": account_type.value,
+                "account_count": 0,
+                "total_value": 0.0,
+                "last_month_total_credit": 0.0,
+                "last_month_total_debit": 0.0,
+            }
+            for account_type in portfolio_types
+        }
+
+        accounts = []
+        for row in rows:
+            account_type = FITypeEnum(row.account_type)
+            value = row.current_value if account_type == FITypeEnum.TERM_DEPOSIT else row.current_balance
+            value = float(value) if value is not None else None
+
+            accounts.append({
+                "id": row.id,
+                "account_type": account_type.value,
+                "masked_account_number": row.masked_account_number,
+                "institution_name": row.institution_name,
+                "current_value": value,
+                "maturity_date": row.maturity_date,
+                "last_month_total_credit": float(row.credit),
+                "last_month_total_debit": float(row.debit),
+            })
+
+            type_totals = totals[account_type.value]
+            type_totals["account_count"] += 1
+            type_totals["total_value"] += value or 0.0
+            type_totals["last_month_total_credit"] += float(row.credit)
+            type_totals["last_month_total_debit"] += float(row.debit)
+
+        return {
+            "accounts": accounts,
+            "totals": list(totals.values()),
+            "total_value": sum(type_totals["total_value"] for type_totals in totals.values()),
+        }
+
+    def is_account_owned_by_user(
+        self,
+        account_id: int,
+        user_id: int
+    ) -> bool:
+        """
+        Returns True if the account belongs to one of the user's consents.
+        """
+        return self.db.query(FinancialAccount.id).join(
+            ConsentRequest,
+            FinancialAccount.consent_id == ConsentRequest.id
+        ).filter(
+            FinancialAccount.id == account_id,
+            ConsentRequest.user_id == user_id
+        ).first() is not None
+
+    def ensure_account_owned_by_user(
+        self,
+        account_id: int,
+        user_id: int
+    ):
+        """
+        Raises 404 unless the account belongs to the user; for endpoints taking
+        an account_id from the request.
+        """
+        if not self.is_account_owned_by_user(account_id, user_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=Messages.ACCOUNT_NOT_FOUND
+            )
+
     def get_account_details(
         self,
         account_id: int,
@@ -98,3 +253,41 @@ class AccountService(BaseService):
         
         return details
 
+    def get_data_version(
+        self,
+        user_id: int,
+        account_id: Optional[int] = None
+    ) -> str:
+        """
+        Returns a version token that changes whenever a data session of the
+        account (or, without account_id, of any of the user's consents) is
+        updated, e.g. when new data is fetched or an ingest completes.
+        Used to answer conditional GETs before running any aggregate query.
+        
+        Args:
+            user_id: The user ID owning the data
+            account_id: Optional account ID to scope the version to
+            
+        Returns:
+            Opaque version string
+        """
+        query = self.db.query(
+            func.max(func.coalesce(DataSession.updated_at, DataSession.created_at)),
+            func.count(DataSession.id)
+        ).join(
+            ConsentRequest,
+            DataSession.consent_request_id == ConsentRequest.id
+        ).filter(
+            ConsentRequest.user_id == user_id
+        )
+
+        if account_id is not None:
+            query = query.join(
+                FinancialAccount,
+                FinancialAccount.consent_id == ConsentRequest.id
+            ).filter(
+                FinancialAccount.id == account_id
+            )
+
+        latest, count = query.one()
+        return f"{latest.timestamp() if latest else 0}:{count}"
@@ -0,0 +1,153 @@
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+from sqlalchemy import select, update
+from app.services.base_service import BaseService
+from app.services.pusher_service import PusherService
+from app.models.notification_outbox import NotificationOutbox, NotificationStatusEnum
+from app.utils.logger_util import logger_info, logger_warning
+
+
+class NotificationService(BaseService):
+    """
+    Service class responsible for the notification outbox.
+    Events are recorded with enqueue() inside the caller's transaction and
+    delivered later by dispatch_pending(), so a slow or failing Pusher call
+    can never delay or roll back the data it announces.
+    """
+
+    MAX_ATTEMPTS = 8
+    # Retry backoff: 2, 4, 8, ... seconds, capped at 5 minutes (due rows are
+    # picked up by the notification-outbox-sweep beat entry)
+    MAX_BACKOFF_SECONDS = 300
+
+    def enqueue(self, user_id: int, event: str, data: dict) -> NotificationOutbox:
+        """
+        Records a Pusher event for a user. Not committed here: it becomes
+        visible to the dispatcher together with the caller's changes.
+
+        Args:
+            user_id: Recipient user ID (their private channel)
+            event: Pusher event name (see app.constants.pusher_events)
+            data: Event payload
+        """
+        notification = NotificationOutbox(
+            user_id=user_id,
+            event=event,
+            payload=data,
+            status=NotificationStatusEnum.PENDING,
+            attempts=0
+        )
+        self.db.add(notification)
+        return notification
+
+    def dispatch_pending(
+        self,
+        pusher_service: PusherService,
+        batch_size: int = 500
+    ) -> Dict[str, int]:
+        """
+        Delivers due pending notifications, coalesced per user.
+
+        Rows are claimed with FOR UPDATE SKIP LOCKED, so concurrent dispatchers
+        never send the same event twice. Repeats of an identical event for a
+        user are sent once and the rest marked SUPERSEDED. Each user's events
+        are sent together through Pusher's batch trigger, up to MAX_BATCH_EVENTS
+        per call. A failed call is retried with exponential backoff, up to
+        MAX_ATTEMPTS times.
+
+        Returns:
+            Counts of sent, superseded and retried / failed notifications
+        """
+        now = datetime.now(timezone.utc)
+        notifications = self.db.execute(
+            select(NotificationOutbox).where(
+                NotificationOutbox.status == NotificationStatusEnum.PENDING,
+                NotificationOutbox.available_at <= now
+            ).order_by(
+                NotificationOutbox.id
+            ).limit(batch_size).with_for_update(skip_locked=True)
+        ).scalars().all()
+
+        counts = {"sent": 0, "superseded": 0, "retried": 0, "failed": 0}
+        if not notifications:
+            return counts
+
+        latest, superseded = self._coalesce(notifications)
+        if superseded:
+            self._mark(superseded, NotificationStatusEnum.SUPERSEDED, now)
+            counts["superseded"] = len(superseded)
+
+        # Keep each user's events together and in order across batch calls
+        pending = sorted(latest, key=lambda n: (n.user_id, n.id))
+        for start in range(0, len(pending), PusherService.MAX_BATCH_EVENTS):
+            batch = pending[start:start + PusherService.MAX_BATCH_EVENTS]
+            try:
+                pusher_service.trigger_batch([(n.user_id, n.event, n.payload) for n in batch])
+            except Exception as e:
+                retried, failed = self._schedule_retry(batch, str(e), now)
+                counts["retried"] += retried
+                counts["failed"] += failed
+            else:
+                self._mark(batch, NotificationStatusEnum.SENT, now)
+                counts["sent"] += len(batch)
+
+        self.commit()
+        logger_info("Notification outbox dispatched", **counts)
+        return counts
+
+    @staticmethod
+    def _coalesce(
+        notifications: List[NotificationOutbox]
+    ) -> Tuple[List[NotificationOutbox], List[NotificationOutbox]]:
+        """Splits rows into the latest per (user, event, payload) and the older repeats."""
+        latest: Dict[Tuple[int, str, str], NotificationOutbox] = {}
+        superseded = []
+        for notification in notifications:
+            key = (
+                notification.user_id,
+                notification.event,
+                json.dumps(notification.payload, sort_keys=True, default=str)
+            )
+            if key in latest:
+                superseded.append(latest[key])
+            latest[key] = notification
+        return list(latest.values()), superseded
+
+    def _mark(
+        self,
+        notifications: List[NotificationOutbox],
+        status: NotificationStatusEnum,
+        now: datetime
+    ):
+        self.db.execute(
+            update(NotificationOutbox).where(
+                NotificationOutbox.id.in_([n.id for n in notifications])
+            ).values(status=status, sent_at=now if status == NotificationStatusEnum.SENT else None),
+            execution_options={"synchronize_session": False}
+        )
+
+    def _schedule_retry(
+        self,
+        notifications: List[NotificationOutbox],
+        error: str,
+        now: datetime
+    ) -> Tuple[int, int]:
+        retried = failed = 0
+        for notification in notifications:
+            notification.attempts += 1
+            notification.last_error = error[:1000]
+            if notification.attempts >= self.MAX_ATTEMPTS:
+                notification.status = NotificationStatusEnum.FAILED
+                failed += 1
+                logger_warning(
+                    "Notification dropped after max attempts",
+                    notification_id=notification.id,
+                    user_id=notification.user_id,
+                    event=notification.event
+                )
+            else:
+                backoff = min(2 ** notification.attempts, self.MAX_BACKOFF_SECONDS)
+                notification.available_at = now + timedelta(seconds=backoff)
+                retried += 1
+        return retried, failed
@@ -1,3 +1,4 @@
+from typing import List, Tuple
 from pusher import Pusher
 from app.config.setting import settings
 from app.utils.logger_util import (
@@ -8,6 +9,9 @@ from app.utils.logger_util import (
 # Pusher Service
 # ===========================================================================
 class PusherService:
+    # Pusher accepts at most 10 events per batch trigger
+    MAX_BATCH_EVENTS = 10
+
     # -----------------------------------------------------------------------
     # Initialization
     # -----------------------------------------------------------------------
@@ -19,8 +23,15 @@ class PusherService:
             secret=settings.pusher.PUSHER_SECRET,
             cluster=settings.pusher.PUSHER_CLUSTER,
             ssl=settings.pusher.PUSHER_SSL,
+            host=settings.pusher.PUSHER_HOST,
+            port=settings.pusher.PUSHER_PORT,
         )
     
+    @staticmethod
+    def user_channel(user_id: int) -> str:
+        """Private channel of a user."""
+        return f"private-user-{user_id}"
+
     # -----------------------------------------------------------------------
     # Authentication for Private Channels
     # -----------------------------------------------------------------------
@@ -34,7 +45,7 @@ class PusherService:
         Returns:
             dict: Authentication payload for Pusher.
         """
-        expected_channel = f"private-user-{user_id}"
+        expected_channel = self.user_channel(user_id)
         if channel != expected_channel:
             raise PermissionError("Unauthorized channel access")
         return self._client.authenticate(channel=channel, socket_id=socket_id)
@@ -48,10 +59,28 @@ class PusherService:
 
         Logs success or captures and logs any exceptions.
         """
-        channel = f"private-user-{user_id}"
+        channel = self.user_channel(user_id)
         try:
             self._client.trigger(channel, event, data)
             logger_info(f"Triggered event '{event}' for user {user_id}")
         except Exception as e:
             logger_exception("Failed to trigger pusher event", exc_info=e)
             raise
+
+    def trigger_batch(self, events: List[Tuple[int, str, dict]]):
+        """
+        Trigger up to MAX_BATCH_EVENTS (user_id, event, data) events in a
+        single Pusher API call.
+
+        Raises on failure so the caller can retry the whole batch.
+        """
+        batch = [
+            {"channel": self.user_channel(user_id), "name": event, "data": data}
+            for user_id, event, data in events
+        ]
+        try:
+            self._client.trigger_batch(batch)
+            logger_info(f"Triggered {len(batch)} batched events")
+        except Exception as e:
+            logger_exception("Failed to trigger pusher batch", exc_info=e)
+            raise
@@ -0,0 +1,153 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+import numpy as np
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.services.base_service import BaseService
+from app.models.bank_transaction import BankTransaction
+from app.models.recurring_payment import RecurringPayment
+from app.models.recurring_detection_state import RecurringDetectionState
+from app.constants.constant import TRANSACTION_TYPE_CREDIT, TRANSACTION_TYPE_DEBIT
+from app.utils.recurring import detect_recurring_series, normalise_counterparty
+
+
+def _to_datetime(epoch_seconds: float) -> datetime:
+    return datetime.fromtimestamp(epoch_seconds, tz=timezone.utc)
+
+
+class RecurringPaymentService(BaseService):
+    """
+    Service class responsible for detecting and reading recurring payments
+    (EMIs, SIPs, rent, subscriptions, salary).
+    Uses BaseService for safe DB execution and transaction handling.
+    """
+
+    def refresh_account(self, account_id: int) -> Optional[int]:
+        """
+        Re-detects the recurring series of an account and replaces the stored ones,
+        unless its transactions are unchanged since the last detection (watermark).
+        Does not commit; the caller owns the transaction.
+
+        A change is detected over the full history rather than merged into the
+        stored series: band clustering, interval/amount regularity and whether a
+        series is still active are properties of all of a counterparty's rows
+        (and of the account's latest row), which the stored series do not keep.
+
+        Args:
+            account_id: The account ID to analyse
+
+        Returns:
+            Number of recurring series stored, or None when detection was skipped
+        """
+        last_transaction_id, transaction_count = self.db.execute(
+            select(
+                func.max(BankTransaction.id),
+                func.count(BankTransaction.id)
+            ).where(
+                BankTransaction.account_id == account_id
+            )
+        ).one()
+
+        state = self.db.get(RecurringDetectionState, account_id)
+        if state is not None and (state.last_transaction_id, state.transaction_count) == (
+            last_transaction_id or 0, transaction_count
+        ):
+            return None
+
+        statement = pg_insert(RecurringDetectionState).values(
+            account_id=account_id,
+            last_transaction_id=last_transaction_id or 0,
+            transaction_count=transaction_count,
+        )
+        self.db.execute(statement.on_conflict_do_update(
+            index_elements=[RecurringDetectionState.account_id],
+            set_={
+                "last_transaction_id": statement.excluded.last_transaction_id,
+                "transaction_count": statement.excluded.transaction_count,
+                "detected_at": func.now(),
+            }
+        ))
+
+        rows = self.db.execute(
+            select(
+                BankTransaction.transaction_timestamp,
+                BankTransaction.amount,
+                BankTransaction.transaction_type,
+                BankTransaction.narration,
+                BankTransaction.category_id,
+            ).where(
+                BankTransaction.account_id == account_id
+            )
+        ).all()
+
+        self.db.query(RecurringPayment).filter(
+            RecurringPayment.account_id == account_id
+        ).delete(synchronize_session=False)
+
+        if not rows:
+            return 0
+
+        # Columnar arrays; counterparties are interned to integer codes
+        counterparties = [normalise_counterparty(row.narration) for row in rows]
+        names, codes = np.unique(np.array([name or "" for name in counterparties]), return_inverse=True)
+        codes = codes.ravel()
+
+        timestamps = np.fromiter((row.transaction_timestamp.timestamp() for row in rows), dtype=np.float64, count=len(rows))
+        amounts = np.fromiter((abs(float(row.amount)) for row in rows), dtype=np.float64, count=len(rows))
+        debit_flags = np.fromiter((row.transaction_type == TRANSACTION_TYPE_DEBIT for row in rows), dtype=bool, count=len(rows))
+
+        recurring_payments = []
+        for series in detect_recurring_series(timestamps, amounts, codes, debit_flags):
+            last_index = series["rows"][-1]
+            last_row = rows[last_index]
+            counterparty = names[codes[last_index]]
+            if not counterparty:
+                # Rows without a narration have nothing to group on
+                continue
+
+            recurring_payments.append({
+                "account_id": account_id,
+                "counterparty": str(counterparty),
+                "category_id": last_row.category_id,
+                "transaction_type": TRANSACTION_TYPE_DEBIT if debit_flags[last_index] else TRANSACTION_TYPE_CREDIT,
+                "frequency": series["frequency"],
+                "average_interval_days": series["average_interval_days"],
+                "average_amount": round(series["average_amount"], 2),
+                "last_amount": round(series["last_amount"], 2),
+                "occurrences": series["occurrences"],
+                "first_seen_at": _to_datetime(series["first_seen_at"]),
+                "last_seen_at": _to_datetime(series["last_seen_at"]),
+                "next_expected_at": _to_datetime(series["next_expected_at"]),
+                "confidence": series["confidence"],
+            })
+
+        if recurring_payments:
+            self.db.bulk_insert_mappings(RecurringPayment, recurring_payments)
+
+        return len(recurring_payments)
+
+    def get_recurring_payments(self, account_id: int) -> List[RecurringPayment]:
+        """
+        Returns the stored recurring series of an account, soonest next payment first.
+        """
+        def _fn():
+            return self.db.query(RecurringPayment).filter(
+                RecurringPayment.account_id == account_id
+            ).order_by(
+                RecurringPayment.next_expected_at
+            ).all()
+
+        return self.execute_safely(_fn)
+
+    def get_version(self, account_id: int) -> str:
+        """
+        Returns a value that changes whenever detection rewrites the account's series.
+        Detection runs after ingest, so the data-session version alone is not enough for ETags.
+        """
+        row = self.db.query(
+            func.max(RecurringPayment.id),
+            func.count(RecurringPayment.id)
+        ).filter(
+            RecurringPayment.account_id == account_id
+        ).one()
+        return f"{row[0]}:{row[1]}"
@@ -1,4 +1,5 @@
 import requests
+import time
 from typing import Dict, Any, Optional, List
 from sqlalchemy.orm import Session
 from fastapi import status
@@ -17,6 +18,81 @@ from app.utils.logger_util import (
 )
 from app.constants.message import Messages
 from app.utils.helper import to_utc_z_format
+from app.utils.resilience import (
+    Bulkhead, TokenBucket, CircuitBreaker, UpstreamUnavailableError, backoff_delays
+)
+
+# ===========================================================================================
+#   OUTBOUND CALL PROTECTION
+#   Shared by every SetuService in the process. Each endpoint gets its own bulkhead, so a
+#   slow endpoint holds at most SETU_MAX_CONCURRENT_CALLS_PER_ENDPOINT threads; rate limits
+#   and circuit breakers apply per Setu product.
+# ===========================================================================================
+SETU_PAN = "setu-pan"
+SETU_AA = "setu-aa"
+
+# endpoint -> Setu product
+SETU_ENDPOINTS = {
+    "verify_pan": SETU_PAN,
+    "aa_token": SETU_AA,
+    "create_consent": SETU_AA,
+    "create_session": SETU_AA,
+    "fetch_session": SETU_AA,
+    "fetch_fips": SETU_AA,
+}
+
+_cfg = settings.setu
+_breakers = {
+    product: CircuitBreaker(
+        product,
+        failure_rate=_cfg.SETU_BREAKER_FAILURE_RATE,
+        minimum_calls=_cfg.SETU_BREAKER_MINIMUM_CALLS,
+        window_calls=_cfg.SETU_BREAKER_WINDOW_CALLS,
+        open_seconds=_cfg.SETU_BREAKER_OPEN_SECONDS,
+    )
+    for product in (SETU_PAN, SETU_AA)
+}
+# Bursts of up to one second's quota
+_rate_limiters = {
+    product: TokenBucket(product, rate, burst=max(1, round(rate)), wait_seconds=_cfg.SETU_RATE_LIMIT_WAIT_SECONDS)
+    for product, rate in (
+        (SETU_PAN, _cfg.SETU_PAN_RATE_LIMIT_PER_SECOND),
+        (SETU_AA, _cfg.SETU_AA_RATE_LIMIT_PER_SECOND),
+    )
+}
+_bulkheads = {
+    endpoint: Bulkhead(
+        f"{product}:{endpoint}",
+        max_concurrent=_cfg.SETU_MAX_CONCURRENT_CALLS_PER_ENDPOINT,
+        wait_seconds=_cfg.SETU_BULKHEAD_WAIT_SECONDS,
+    )
+    for endpoint, product in SETU_ENDPOINTS.items()
+}
+
+
+def _is_upstream_failure(status_code: int) -> bool:
+    """Responses that count against the circuit breaker and are worth a retry."""
+    return status_code >= 500 or status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+
+def _guarded_request(endpoint: str, method: str, url: str, **kwargs) -> requests.Response:
+    """One HTTP call through the endpoint's circuit breaker, rate limiter and bulkhead."""
+    breaker = _breakers[SETU_ENDPOINTS[endpoint]]
+    breaker.before_call()
+    try:
+        _rate_limiters[SETU_ENDPOINTS[endpoint]].acquire()
+        with _bulkheads[endpoint].slot():
+            try:
+                response = requests.request(method, url, **kwargs)
+            except RequestException:
+                breaker.record(success=False)
+                raise
+    except UpstreamUnavailableError:
+        breaker.release_trial()
+        raise
+
+    breaker.record(success=not _is_upstream_failure(response.status_code))
+    return response
 
 
 class SetuService:
@@ -45,25 +121,51 @@ class SetuService:
         method: str,
         url: str,
         *,
+        endpoint: str,
         headers: Optional[dict] = None,
         json: Optional[dict] = None,
-        timeout: int = 10,
+        timeout: Optional[float] = None,
         expected_status: Optional[int] = None,
+        retry: bool = False,
     ) -> Dict[str, Any]:
         """
         A safe wrapper around requests to enforce consistent error handling and logging.
+
+        Calls go through the endpoint's circuit breaker, rate limiter and bulkhead, which
+        raise UpstreamUnavailableError instead of waiting on a degraded Setu. With retry
+        (idempotent requests only), connection errors, 429 and 5xx responses are retried
+        with jittered exponential backoff.
         """
-        try:
-            response = requests.request(
-                method.upper(),
-                url,
-                headers=headers,
-                json=json,
-                timeout=timeout
-            )
-        except RequestException as exc:
-            logger_exception(f"HTTP {method} {url} failed: {exc}")
-            raise RuntimeError(f"Connection failed: {exc}") from exc
+        cfg = settings.setu
+        attempts = cfg.SETU_RETRY_ATTEMPTS if retry else 1
+        delays = backoff_delays(attempts, cfg.SETU_RETRY_BASE_DELAY_SECONDS, cfg.SETU_RETRY_MAX_DELAY_SECONDS)
+
+        for attempt in range(1, attempts + 1):
+            try:
+                response = _guarded_request(
+                    endpoint,
+                    method.upper(),
+                    url,
+                    headers=headers,
+                    json=json,
+                    timeout=timeout or (cfg.SETU_CONNECT_TIMEOUT_SECONDS, cfg.SETU_READ_TIMEOUT_SECONDS)
+                )
+            except RequestException as exc:
+                if attempt < attempts:
+                    logger_warning(f"HTTP {method} {url} failed, retrying: {exc}", attempt=attempt)
+                    time.sleep(next(delays))
+                    continue
+                logger_exception(f"HTTP {method} {url} failed: {exc}")
+                raise RuntimeError(f"Connection failed: {exc}") from exc
+
+            if _is_upstream_failure(response.status_code) and attempt < attempts:
+                logger_warning(
+                    f"HTTP {method} {url} returned {response.status_code}, retrying",
+                    attempt=attempt
+                )
+                time.sleep(next(delays))
+                continue
+            break
 
         if expected_status and response.status_code != expected_status:
             logger_error(
@@ -98,6 +200,7 @@ class SetuService:
         data = self._request(
             "POST",
             SetuAPI.PAN_VERIFICATION_API,
+            endpoint="verify_pan",
             json=payload,
             headers=headers,
             expected_status=status.HTTP_200_OK,
@@ -128,7 +231,10 @@ class SetuService:
 
         headers = {"client": "bridge", "Content-Type": "application/json"}
 
-        data = self._request("POST", SetuAPI.AA_AUTH_TOKEN, json=payload, headers=headers)
+        # A client-credentials token request has no side effects, so it is retried like the GETs
+        data = self._request(
+            "POST", SetuAPI.AA_AUTH_TOKEN, endpoint="aa_token", json=payload, headers=headers, retry=True
+        )
 
         if not data.get("success"):
             raise RuntimeError("AA Auth returned unsuccessful response")
@@ -185,7 +291,9 @@ class SetuService:
             "Authorization": f"Bearer {token}",
         }
 
-        data = self._request("POST", SetuAPI.CREATE_CONSENT_API, json=payload, headers=headers)
+        data = self._request(
+            "POST", SetuAPI.CREATE_CONSENT_API, endpoint="create_consent", json=payload, headers=headers
+        )
 
         logger_success("Consent created", phone=phone)
         return data
@@ -297,6 +405,7 @@ class SetuService:
         data = self._request(
             "POST",
             SetuAPI.CREATE_DATA_SESSION_API,
+            endpoint="create_session",
             json=payload,
             headers=headers,
             expected_status=status.HTTP_201_CREATED
@@ -318,7 +427,7 @@ class SetuService:
         token = self.get_aa_token()
         headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
 
-        data = self._request("GET", SetuAPI.FETCH_FIP_ID_API, headers=headers)
+        data = self._request("GET", SetuAPI.FETCH_FIP_ID_API, endpoint="fetch_fips", headers=headers, retry=True)
 
         fips = data.get("data")
 
@@ -340,7 +449,7 @@ class SetuService:
 
         url = SetuAPI.FETCH_SESSION_DATA_API.format(session_id=session_id)
 
-        return self._request("GET", url, headers=headers)
+        return self._request("GET", url, endpoint="fetch_session", headers=headers, retry=True)
 
     # ===========================================================================================
     #   PRIVATE HELPERS
@@ -0,0 +1,296 @@
+from datetime import date
+from typing import Dict, Any, List, Optional, Sequence
+import numpy as np
+from sqlalchemy import select, func, cast, and_, Float, Date
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql import Select
+from app.services.base_service import BaseService
+from app.models.term_deposit_details import TermDepositDetails
+from app.models.term_deposit_projection import TermDepositProjection
+from app.models.account_summary import AccountSummary
+from app.models.financial_accounts import FinancialAccount
+from app.models.consent_request import ConsentRequest
+from app.constants.constant import BALANCE_SNAPSHOT_TIMEZONE
+from app.utils.deposit_projection import (
+    DAYS_PER_MONTH,
+    DAYS_PER_YEAR,
+    compounding_periods,
+    is_payout,
+    project_deposits,
+    maturity_ladder,
+    to_epoch_day,
+    from_epoch_day,
+)
+
+
+
+def _local_date(column):
+    """Calendar date of a timestamptz column in the timezone FIPs report dates in."""
+    return cast(func.timezone(BALANCE_SNAPSHOT_TIMEZONE, column), Date)
+
+
+def _epoch_days(values: Sequence[Optional[date]]) -> np.ndarray:
+    """Dates -> days since epoch as float, NaN where missing."""
+    days = np.array(values, dtype="datetime64[D]")
+    return np.where(np.isnat(days), np.nan, days.view(np.int64).astype(np.float64))
+
+
+class TermDepositService(BaseService):
+    """
+    Service class responsible for term deposit projections.
+    Uses BaseService for safe DB execution and transaction handling.
+    """
+
+    def _deposits_statement(self) -> Select:
+        """
+        Term deposit columns in the order _to_arrays expects. Numbers are cast to
+        float in SQL so rows go straight into NumPy.
+        """
+        return select(
+            TermDepositDetails.summary_id,
+            AccountSummary.account_id,
+            cast(TermDepositDetails.principal_amount, Float),
+            cast(TermDepositDetails.interest_rate, Float),
+            TermDepositDetails.tenure_years,
+            TermDepositDetails.tenure_months,
+            TermDepositDetails.tenure_days,
+            TermDepositDetails.compounding_frequency,
+            TermDepositDetails.interest_computation,
+            TermDepositDetails.interest_payout,
+            _local_date(AccountSummary.opening_date),
+            _local_date(TermDepositDetails.maturity_date),
+        ).join(
+            AccountSummary,
+            TermDepositDetails.summary_id == AccountSummary.id
+        )
+
+    @staticmethod
+    def _to_arrays(rows: Sequence[tuple]) -> Dict[str, np.ndarray]:
+        """Turn deposit rows into the column arrays the projection engine takes."""
+        numeric = np.array([row[:7] for row in rows], dtype=np.float64)
+        opening_day = _epoch_days([row[10] for row in rows])
+        maturity_day = _epoch_days([row[11] for row in rows])
+
+        # Few distinct (frequency, computation, payout) combinations: map each once
+        terms = [(row[7], row[8], row[9]) for row in rows]
+        distinct_terms = {term: index for index, term in enumerate(dict.fromkeys(terms))}
+        term_codes = np.fromiter((distinct_terms[term] for term in terms), dtype=np.int64, count=len(terms))
+        periods_by_code = np.array([compounding_periods(*term) for term in distinct_terms], dtype=np.int64)
+        payout_by_code = np.array([is_payout(term[2]) for term in distinct_terms], dtype=bool)
+
+        # Without an opening date, derive the start from the tenure
+        tenure_days = (
+            np.nan_to_num(numeric[:, 4]) * DAYS_PER_YEAR
+            + np.nan_to_num(numeric[:, 5]) * DAYS_PER_MONTH
+            + np.nan_to_num(numeric[:, 6])
+        )
+        derived_start = np.where(tenure_days > 0, maturity_day - tenure_days, np.nan)
+        start_day = np.where(np.isfinite(opening_day), opening_day, derived_start)
+
+        return {
+            "summary_id": numeric[:, 0].astype(np.int64),
+            "account_id": numeric[:, 1].astype(np.int64),
+            "principal": numeric[:, 2],
+            "annual_rate_percent": numeric[:, 3],
+            "start_day": np.ceil(start_day),
+            "maturity_day": maturity_day,
+            "periods": periods_by_code[term_codes],
+            "payout": payout_by_code[term_codes],
+        }
+
+    def get_user_projections(
+        self,
+        user_id: int,
+        as_of: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Projects all of a user's term deposits as of a date (default: today).
+        Valuations stored by the nightly refresh for that date are served as
+        they are; only deposits without one (added or re-ingested since the
+        refresh, or the refresh has not run yet) are projected here.
+
+        Args:
+            user_id: The user ID owning the deposits
+            as_of: Valuation date
+
+        Returns:
+            Dictionary with per-deposit projections, a monthly maturity ladder and totals
+        """
+        as_of = as_of or date.today()
+        as_of_day = to_epoch_day(as_of)
+
+        def _fn():
+            return self.db.execute(
+                self._deposits_statement().add_columns(
+                    cast(TermDepositProjection.accrued_interest, Float),
+                    cast(TermDepositProjection.current_value, Float),
+                    cast(TermDepositProjection.projected_maturity_value, Float),
+                    TermDepositProjection.days_to_maturity,
+                ).outerjoin(
+                    TermDepositProjection,
+                    and_(
+                        TermDepositProjection.summary_id == TermDepositDetails.summary_id,
+                        TermDepositProjection.as_of_date == as_of,
+                        TermDepositProjection.computed_at >= TermDepositDetails.updated_at,
+                    )
+                ).join(
+                    FinancialAccount,
+                    AccountSummary.account_id == FinancialAccount.id
+                ).join(
+                    ConsentRequest,
+                    FinancialAccount.consent_id == ConsentRequest.id
+                ).where(
+                    ConsentRequest.user_id == user_id
+                )
+            ).all()
+
+        rows = self.execute_safely(_fn)
+        if not rows:
+            return {
+                "as_of_date": as_of.isoformat(),
+                "deposits": [],
+                "maturity_ladder": [],
+                "total_principal": 0.0,
+                "total_accrued_interest": 0.0,
+                "total_projected_maturity_value": 0.0,
+            }
+
+        arrays = self._to_arrays(rows)
+        # Stored valuations (NaN where the deposit has none for as_of)
+        stored = np.array([row[12:16] for row in rows], dtype=np.float64)
+        accrued_interest = stored[:, 0]
+        current_value = stored[:, 1]
+        projected_maturity_value = stored[:, 2]
+        days_to_maturity = stored[:, 3]
+        valid = ~np.isnan(accrued_interest)
+
+        pending = np.flatnonzero(~valid)
+        if pending.size:
+            projection = project_deposits(
+                arrays["principal"][pending],
+                arrays["annual_rate_percent"][pending],
+                arrays["start_day"][pending],
+                arrays["maturity_day"][pending],
+                arrays["periods"][pending],
+                arrays["payout"][pending],
+                as_of_day
+            )
+            valid[pending] = projection.valid
+            accrued_interest[pending] = projection.accrued_interest
+            current_value[pending] = projection.current_value
+            projected_maturity_value[pending] = projection.projected_maturity_value
+            days_to_maturity[pending] = projection.days_to_maturity
+
+        deposits = []
+        for index in np.flatnonzero(valid):
+            deposits.append({
+                "account_id": int(arrays["account_id"][index]),
+                "principal": float(arrays["principal"][index]),
+                "interest_rate": float(arrays["annual_rate_percent"][index]),
+                "maturity_date": from_epoch_day(arrays["maturity_day"][index]).isoformat(),
+                "days_to_maturity": int(days_to_maturity[index]),
+                "accrued_interest": float(accrued_interest[index]),
+                "current_value": float(current_value[index]),
+                "projected_maturity_value": float(projected_maturity_value[index]),
+            })
+
+        return {
+            "as_of_date": as_of.isoformat(),
+            "deposits": deposits,
+            "maturity_ladder": maturity_ladder(
+                arrays["maturity_day"][valid],
+                projected_maturity_value[valid],
+                as_of_day
+            ),
+            "total_principal": round(float(arrays["principal"][valid].sum()), 2),
+            "total_accrued_interest": round(float(accrued_interest[valid].sum()), 2),
+            "total_projected_maturity_value": round(float(projected_maturity_value[valid].sum()), 2),
+        }
+
+    def refresh_all_projections(
+        self,
+        as_of: Optional[date] = None,
+        batch_size: int = 100_000
+    ) -> int:
+        """
+        Projects every term deposit and upserts the results, one batch at a time.
+        Batches are keyset pages on summary_id, each read and committed on its
+        own, so memory and transaction size stay bounded (a server-side cursor
+        would not survive the per-batch commit).
+
+        Args:
+            as_of: Valuation date (default: today)
+            batch_size: Deposits loaded, projected and written per batch
+
+        Returns:
+            Number of projections written
+        """
+        as_of = as_of or date.today()
+        as_of_day = to_epoch_day(as_of)
+        written = 0
+
+        last_summary_id = None
+        while True:
+            page = self._deposits_statement()
+            if last_summary_id is not None:
+                page = page.where(TermDepositDetails.summary_id > last_summary_id)
+            rows = self.db.execute(
+                page.order_by(TermDepositDetails.summary_id).limit(batch_size)
+            ).all()
+            if not rows:
+                break
+            last_summary_id = rows[-1][0]
+
+            arrays = self._to_arrays(rows)
+            projection = project_deposits(
+                arrays["principal"],
+                arrays["annual_rate_percent"],
+                arrays["start_day"],
+                arrays["maturity_day"],
+                arrays["periods"],
+                arrays["payout"],
+                as_of_day
+            )
+
+            records = self._projection_records(arrays, projection, as_of)
+            if records:
+                statement = pg_insert(TermDepositProjection).values(records)
+                self.db.execute(statement.on_conflict_do_update(
+                    index_elements=[TermDepositProjection.summary_id],
+                    set_={
+                        column: statement.excluded[column]
+                        for column in (
+                            "account_id", "as_of_date", "accrued_interest", "current_value",
+                            "projected_maturity_value", "maturity_date", "days_to_maturity",
+                        )
+                    } | {"computed_at": func.now()}
+                ))
+                self.commit()
+                written += len(records)
+
+        return written
+
+    @staticmethod
+    def _projection_records(arrays, projection, as_of: date) -> List[Dict[str, Any]]:
+        valid = np.flatnonzero(projection.valid)
+        summary_ids = arrays["summary_id"][valid].tolist()
+        account_ids = arrays["account_id"][valid].tolist()
+        maturity_days = arrays["maturity_day"][valid].tolist()
+        accrued = projection.accrued_interest[valid].tolist()
+        current = projection.current_value[valid].tolist()
+        maturity_values = projection.projected_maturity_value[valid].tolist()
+        days_left = projection.days_to_maturity[valid].astype(np.int64).tolist()
+
+        return [
+            {
+                "summary_id": summary_ids[i],
+                "account_id": account_ids[i],
+                "as_of_date": as_of,
+                "accrued_interest": accrued[i],
+                "current_value": current[i],
+                "projected_maturity_value": maturity_values[i],
+                "maturity_date": from_epoch_day(maturity_days[i]),
+                "days_to_maturity": days_left[i],
+            }
+            for i in range(len(valid))
+        ]
@@ -1,12 +1,92 @@
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+from datetime import datetime, timedelta, date, time
+from zoneinfo import ZoneInfo
+import base64
+import json
+import re
+import numpy as np
 from sqlalchemy.orm import Query
-from sqlalchemy import desc, asc, func, and_, extract, case
+from sqlalchemy import desc, asc, func, and_, or_, extract, case, select, literal, tuple_, Float
 from app.services.base_service import BaseService
 from app.models.bank_transaction import BankTransaction
 from app.models.banking_account_details import BankingAccountDetails
 from app.models.account_summary import AccountSummary
-from app.constants.constant import TRANSACTION_TYPE_CREDIT, TRANSACTION_TYPE_DEBIT
+from app.models.transaction_category import TransactionCategory
+from app.models.daily_balance_snapshot import DailyBalanceSnapshot
+from app.constants.constant import (
+    TRANSACTION_TYPE_CREDIT,
+    TRANSACTION_TYPE_DEBIT,
+    TRANSACTION_SEARCH_CONFIG,
+    BALANCE_SNAPSHOT_TIMEZONE,
+)
+from app.constants.transaction_categories import OTHERS
+from app.utils.analytics_cache import cached_analytics
+from app.utils.downsampling import lttb_indices, min_max_indices
+
+
+def _current_month() -> str:
+    """Cache key suffix for metrics relative to the current month."""
+    return datetime.now().strftime("%Y-%m")
+
+
+def last_month_range() -> Tuple[datetime, datetime]:
+    """Returns [first day of last month, first day of this month), both at midnight."""
+    first_day_this_month = datetime.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    first_day_last_month = (first_day_this_month - timedelta(days=1)).replace(day=1)
+    return first_day_last_month, first_day_this_month
+
+
+def _encode_search_cursor(rank: float, transaction_id: int) -> str:
+    """Opaque keyset cursor: the (rank, id) of the last row of a page."""
+    payload = json.dumps([rank, transaction_id]).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def _decode_search_cursor(cursor: str) -> Tuple[float, int]:
+    """Raises ValueError for a cursor that was not produced by _encode_search_cursor."""
+    try:
+        rank, transaction_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return float(rank), int(transaction_id)
+    except Exception as e:
+        raise ValueError("Invalid search cursor") from e
+
+
+def _day_start(day: date) -> datetime:
+    """Midnight of a calendar day in the timezone AA data is reported in."""
+    return datetime.combine(day, time.min, tzinfo=ZoneInfo(BALANCE_SNAPSHOT_TIMEZONE))
+
+
+def transaction_filter_conditions(
+    from_date: Optional[date] = None,
+    to_date: Optional[date] = None,
+    min_amount: Optional[float] = None,
+    max_amount: Optional[float] = None,
+    transaction_type: Optional[str] = None,
+    modes: Optional[List[str]] = None,
+    category_ids: Optional[List[int]] = None
+) -> List:
+    """
+    WHERE conditions for the optional transaction filters. Each one matches an
+    index that leads with account_id (see BankTransaction.__table_args__).
+    transaction_type must stay an equality on a literal so the planner can use
+    the per-type partial indexes.
+    """
+    conditions = []
+    if from_date:
+        conditions.append(BankTransaction.transaction_timestamp >= _day_start(from_date))
+    if to_date:
+        conditions.append(BankTransaction.transaction_timestamp < _day_start(to_date + timedelta(days=1)))
+    if min_amount is not None:
+        conditions.append(BankTransaction.amount >= min_amount)
+    if max_amount is not None:
+        conditions.append(BankTransaction.amount <= max_amount)
+    if transaction_type:
+        conditions.append(BankTransaction.transaction_type == transaction_type)
+    if modes:
+        conditions.append(BankTransaction.mode.in_(modes))
+    if category_ids:
+        conditions.append(BankTransaction.category_id.in_(category_ids))
+    return conditions
 
 
 class TransactionService(BaseService):
@@ -25,7 +105,8 @@ class TransactionService(BaseService):
         self,
         account_id: int,
         sort_by: Optional[str] = None,
-        sort_order: Optional[str] = "desc"
+        sort_order: Optional[str] = "desc",
+        filters: Optional[Dict[str, Any]] = None
     ) -> Query:
         """
         Returns a query object for transactions filtered by account_id.
@@ -35,12 +116,14 @@ class TransactionService(BaseService):
             account_id: The account ID to filter transactions
             sort_by: Field name to sort by (must be in ALLOWED_SORT_FIELDS)
             sort_order: Sort order - 'asc' or 'desc' (default: 'desc')
+            filters: Keyword arguments for transaction_filter_conditions
             
         Returns:
             SQLAlchemy Query object ready for pagination
         """
         query = self.db.query(BankTransaction).filter(
-            BankTransaction.account_id == account_id
+            BankTransaction.account_id == account_id,
+            *transaction_filter_conditions(**(filters or {}))
         )
 
         # Apply sorting
@@ -56,6 +139,124 @@ class TransactionService(BaseService):
 
         return query
 
+    def search_transactions(
+        self,
+        account_id: int,
+        search: str,
+        size: int,
+        cursor: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Ranked search over an account's narrations and transaction IDs.
+
+        Words are matched as prefixes through the narration_search tsvector
+        ("swig" finds SWIGGY); pg_trgm word similarity adds typo-tolerant and
+        partial matches. Rows are ordered by rank, then id, and paginated with
+        a (rank, id) keyset so deep pages cost the same as the first.
+
+        Args:
+            account_id: The account ID to search in
+            search: Free-text search string
+            size: Page size
+            cursor: next_cursor of the previous page
+            filters: Keyword arguments for transaction_filter_conditions
+
+        Returns:
+            Dictionary with items, size and next_cursor (None on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        search = search.strip()
+        terms = re.findall(r"[0-9a-z]+", search.lower())
+
+        conditions = [
+            literal(search).op("<%")(BankTransaction.narration),
+            literal(search).op("<%")(BankTransaction.transaction_id),
+        ]
+        scores = [
+            func.word_similarity(search, BankTransaction.narration),
+            func.word_similarity(search, BankTransaction.transaction_id),
+        ]
+        if terms:
+            # Terms are alphanumeric only, so the tsquery syntax cannot be injected
+            ts_query = func.to_tsquery(
+                TRANSACTION_SEARCH_CONFIG,
+                " & ".join(f"{term}:*" for term in terms)
+            )
+            conditions.append(BankTransaction.narration_search.op("@@")(ts_query))
+            # Normalisation 32 scales the rank into [0, 1) like the similarities
+            scores.append(func.ts_rank_cd(BankTransaction.narration_search, ts_query, 32))
+
+        rank = func.greatest(*scores).cast(Float)
+
+        statement = select(BankTransaction, rank).where(
+            BankTransaction.account_id == account_id,
+            or_(*conditions),
+            *transaction_filter_conditions(**(filters or {}))
+        )
+        if cursor:
+            last_rank, last_id = _decode_search_cursor(cursor)
+            statement = statement.where(
+                tuple_(rank, BankTransaction.id) < tuple_(literal(last_rank, Float), literal(last_id))
+            )
+
+        def _fn():
+            return self.db.execute(
+                statement.order_by(desc(rank), desc(BankTransaction.id)).limit(size + 1)
+            ).all()
+
+        rows = self.execute_safely(_fn)
+        page = rows[:size]
+
+        next_cursor = None
+        if len(rows) > size:
+            last_transaction, last_rank = page[-1]
+            next_cursor = _encode_search_cursor(last_rank, last_transaction.id)
+
+        return {
+            "items": [transaction for transaction, _ in page],
+            "size": size,
+            "next_cursor": next_cursor,
+        }
+
+    def iter_transaction_batches(
+        self,
+        account_id: int,
+        batch_size: int = 5000
+    ) -> Iterator[List[tuple]]:
+        """
+        Streams every transaction of an account in chronological order through a
+        server-side cursor, so memory use is bounded by batch_size.
+        
+        Args:
+            account_id: The account ID to export transactions for
+            batch_size: Number of rows fetched from the cursor per batch
+            
+        Yields:
+            Lists of row tuples in app.utils.export.EXPORT_COLUMNS order
+        """
+        statement = select(
+            BankTransaction.transaction_id,
+            BankTransaction.transaction_timestamp,
+            BankTransaction.transaction_type,
+            BankTransaction.mode,
+            BankTransaction.amount,
+            BankTransaction.balance,
+            BankTransaction.narration,
+        ).where(
+            BankTransaction.account_id == account_id
+        ).order_by(
+            BankTransaction.transaction_timestamp,
+            BankTransaction.id
+        ).execution_options(yield_per=batch_size)
+
+        result = self.db.execute(statement)
+        for partition in result.partitions():
+            yield [tuple(row) for row in partition]
+
+    @cached_analytics(key_suffix=_current_month)
     def get_account_metrics(
         self,
         account_id: int
@@ -70,9 +271,7 @@ class TransactionService(BaseService):
             Dictionary containing current_balance, last_month_total_credit, last_month_total_debit
         """
         # Calculate last month date range
-        today = datetime.now()
-        first_day_last_month = (today.replace(day=1) - timedelta(days=1)).replace(day=1)
-        first_day_this_month = today.replace(day=1)
+        first_day_last_month, first_day_this_month = last_month_range()
         
         # Get current balance from BankingAccountDetails via AccountSummary
         current_balance = None
@@ -113,6 +312,7 @@ class TransactionService(BaseService):
             "last_month_total_debit": float(last_month_debit),
         }
 
+    @cached_analytics()
     def get_payment_type_statistics(
         self,
         account_id: int
@@ -162,6 +362,133 @@ class TransactionService(BaseService):
             "total_amount": total_amount
         }
 
+    @cached_analytics()
+    def get_category_spend_statistics(
+        self,
+        account_id: int,
+        transaction_type: str = TRANSACTION_TYPE_DEBIT
+    ) -> Dict[str, Any]:
+        """
+        Returns spend (or income) grouped by transaction category.
+        Served by the (account_id, category_id) index instead of scanning narrations.
+        
+        Args:
+            account_id: The account ID to fetch statistics for
+            transaction_type: CREDIT or DEBIT (default: DEBIT)
+            
+        Returns:
+            Dictionary containing list of categories with amounts and percentages
+        """
+        # Rows ingested before categorisation existed count as OTHERS
+        category_id = func.coalesce(BankTransaction.category_id, OTHERS)
+
+        totals = self.db.query(
+            category_id.label('category_id'),
+            func.sum(BankTransaction.amount).label('total_amount'),
+            func.count(BankTransaction.id).label('count')
+        ).filter(
+            and_(
+                BankTransaction.account_id == account_id,
+                BankTransaction.transaction_type == transaction_type
+            )
+        ).group_by(
+            category_id
+        ).subquery()
+
+        results = self.db.query(
+            TransactionCategory.code,
+            TransactionCategory.name,
+            totals.c.total_amount,
+            totals.c.count
+        ).join(
+            totals, totals.c.category_id == TransactionCategory.id
+        ).order_by(
+            desc(totals.c.total_amount)
+        ).all()
+
+        total_amount = sum(float(result.total_amount) for result in results)
+
+        categories = []
+        for result in results:
+            amount = float(result.total_amount)
+            percentage = (amount / total_amount * 100) if total_amount > 0 else 0
+
+            categories.append({
+                "category": result.code,
+                "name": result.name,
+                "amount": amount,
+                "count": result.count,
+                "percentage": round(percentage, 2)
+            })
+
+        return {
+            "categories": categories,
+            "total_amount": total_amount
+        }
+
+    @cached_analytics()
+    def get_balance_history(
+        self,
+        account_id: int,
+        points: int = 365,
+        method: str = "lttb",
+        from_date: Optional[date] = None,
+        to_date: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        Returns the end-of-day balance series of an account, downsampled on the
+        server so a multi-year chart needs only a few hundred points.
+        
+        Args:
+            account_id: The account ID to fetch the balance history for
+            points: Maximum number of points to return
+            method: 'lttb' (shape preserving) or 'minmax' (keeps every peak and trough)
+            from_date: Optional first day (inclusive)
+            to_date: Optional last day (inclusive)
+            
+        Returns:
+            Dictionary containing the kept points and the size of the full series
+        """
+        # Single range scan over the (account_id, snapshot_date) primary key
+        query = self.db.query(
+            DailyBalanceSnapshot.snapshot_date,
+            DailyBalanceSnapshot.closing_balance
+        ).filter(
+            DailyBalanceSnapshot.account_id == account_id
+        )
+        if from_date is not None:
+            query = query.filter(DailyBalanceSnapshot.snapshot_date >= from_date)
+        if to_date is not None:
+            query = query.filter(DailyBalanceSnapshot.snapshot_date <= to_date)
+
+        rows = query.order_by(DailyBalanceSnapshot.snapshot_date).all()
+
+        if not rows:
+            return {
+                "points": [],
+                "total_points": 0,
+            }
+
+        days = np.fromiter((row.snapshot_date.toordinal() for row in rows), dtype=np.float64, count=len(rows))
+        balances = np.fromiter((float(row.closing_balance) for row in rows), dtype=np.float64, count=len(rows))
+
+        if method == "minmax":
+            keep = min_max_indices(balances, points)
+        else:
+            keep = lttb_indices(days, balances, points)
+
+        return {
+            "points": [
+                {
+                    "date": rows[index].snapshot_date.isoformat(),
+                    "balance": float(balances[index])
+                }
+                for index in keep
+            ],
+            "total_points": len(rows),
+        }
+
+    @cached_analytics()
     def get_monthly_credit_debit_statistics(
         self,
         account_id: int,
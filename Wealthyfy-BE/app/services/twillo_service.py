@@ -1,9 +1,24 @@
 from fastapi import HTTPException, status
+import re
+from typing import Optional
 from twilio.rest import Client
+from twilio.http.http_client import TwilioHttpClient
 from app.config.setting import settings
 from app.constants.message import Messages
 from app.constants.constant import APPROVED
 
+class _BaseUrlHttpClient(TwilioHttpClient):
+    """Sends every Twilio API request to base_url instead of *.twilio.com."""
+
+    def __init__(self, base_url: str):
+        super().__init__()
+        self._base_url = base_url.rstrip("/")
+
+    def request(self, method: str, url: str, *args, **kwargs):
+        url = re.sub(r"^https://[^/]+\.twilio\.com", self._base_url, url)
+        return super().request(method, url, *args, **kwargs)
+
+
 class TwilioService:
     """Twilio OTP service with clean phone normalization and error handling."""
 
@@ -11,7 +26,12 @@ class TwilioService:
         self.account_sid = settings.twillo.TWILIO_ACCOUNT_SID
         self.auth_token = settings.twillo.TWILIO_AUTH_TOKEN
         self.verify_sid = settings.twillo.TWILIO_VERIFICATION_SERVICE_SID
-        self.client = Client(self.account_sid, self.auth_token)
+        base_url: Optional[str] = settings.twillo.TWILIO_API_BASE_URL
+        self.client = Client(
+            self.account_sid,
+            self.auth_token,
+            http_client=_BaseUrlHttpClient(base_url) if base_url else None
+        )
 
     # -----------------------------------------------------------------------
     # PRIVATE: FORMAT PHONE NUMBER
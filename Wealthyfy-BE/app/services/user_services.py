@@ -3,7 +3,7 @@ from app.schemas.user import UserCreate
 from app.constants.message import Messages
 from fastapi import HTTPException, status
 from app.services.base_service import BaseService
-from app.constants.constant import CAP_ACTIVE
+from app.constants.constant import CAP_ACTIVE, QUEUE_REFRESH
 from app.models.pancard import Pancard
 from app.models.consent_request import ConsentRequest, ConsentStatus, FetchType, UnitEnum
 from app.models.consent_fI_type import ConsentFIType, FITypeEnum, ConsentFITypeStatus
@@ -12,12 +12,25 @@ from app.models.consent_data_session import DataSession, DataSessionStatusEnum
 from app.utils.logger_util import (
     logger_info, logger_error, logger_success, logger_warning
 )
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Tuple
+from sqlalchemy import select, update, insert, func, literal, cast, values, column, true, and_, String
 from sqlalchemy.orm import joinedload
 from datetime import datetime, timezone
 import json
 from pathlib import Path
-from app.config.celery_app import celery_app
+from app.config.celery_client import get_celery_client, session_ingest_route
+from app.utils.session_events import session_status_payload, publish_session_status
+from app.utils.session_payload import count_session_transactions
+from app.utils.principal_cache import invalidate_principal
+from app.utils.cache import LRUCache, MISS
+from app.config.setting import settings
+
+# consent_id -> (consent_request.id, user_id). Neither changes once the consent
+# is stored, so session polling and webhooks skip the consent_request lookup.
+_consent_requests = LRUCache(
+    max_entries=settings.redis.CONSENT_REQUEST_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.redis.CACHE_TTL_SECONDS
+)
 
 
 class UserService(BaseService):
@@ -72,6 +85,7 @@ class UserService(BaseService):
             user.status = CAP_ACTIVE
             self.commit()
             self.db.refresh(user)
+            invalidate_principal(user.keycloak_user_id)
             return user
 
         return self.execute_safely(_update)
@@ -123,6 +137,7 @@ class UserService(BaseService):
                 record.consent = consent
                 self.db.commit()
                 self.db.refresh(record)
+                invalidate_principal(record.user.keycloak_user_id)
                 return record
 
             # Insert a new pancard record
@@ -134,6 +149,7 @@ class UserService(BaseService):
             self.db.add(new_record)
             self.db.commit()
             self.db.refresh(new_record)
+            invalidate_principal(new_record.user.keycloak_user_id)
             return new_record
 
         return self.execute_safely(_save)
@@ -155,6 +171,7 @@ class UserService(BaseService):
             user.phone_number = phone_number
             self.commit()
             self.db.refresh(user)
+            invalidate_principal(user.keycloak_user_id)
             return user
 
         return self.execute_safely(_update)
@@ -188,6 +205,7 @@ class UserService(BaseService):
             user.is_setup_complete = True
             self.commit()
             self.db.refresh(user)
+            invalidate_principal(user.keycloak_user_id)
             return user
 
         return self.execute_safely(_update)
@@ -211,6 +229,7 @@ class UserService(BaseService):
         """
         Marks all pending and non-expired consent requests for a user as EXPIRED.
         Also expires all associated FI types and logs the cancellation reason.
+        Runs as a single UPDATE ... RETURNING statement.
         
         Args:
             user_id: User ID
@@ -219,31 +238,10 @@ class UserService(BaseService):
             int: Number of consents expired
         """
         def _expire():
-            # Find all pending consents for the user and mark them as expired
-            pending_consents = (
-                self.db.query(ConsentRequest)
-                .filter(
-                    ConsentRequest.user_id == user_id,
-                    ConsentRequest.status == ConsentStatus.PENDING
-                )
-                .all()
-            )
-            
-            expired_count = 0
-            for consent in pending_consents:
-                consent.status = ConsentStatus.EXPIRED
-                # Expire all associated FI types
-                for fi_type in consent.fi_types:
-                    fi_type.status = ConsentFITypeStatus.EXPIRE
-                
-                # Create cancellation log entry
-                cancellation_log = ConsentCancellationLog(
-                    consent_request_id=consent.id,
-                    reason=Messages.CONSENT_CANCELLED_NEW_CONSENT_CREATED,
-                    cancelled_by=CancelledBy.SYSTEM
-                )
-                self.db.add(cancellation_log)
-                expired_count += 1
+            expired, expired_fi_types, cancellation_logs = self._expire_pending_consents_ctes(user_id)
+            expired_count = self.db.execute(
+                select(func.count()).select_from(expired).add_cte(expired_fi_types, cancellation_logs)
+            ).scalar_one()
             
             if expired_count > 0:
                 self.commit()
@@ -252,6 +250,43 @@ class UserService(BaseService):
         
         return self.execute_safely(_expire)
 
+    @staticmethod
+    def _expire_pending_consents_ctes(user_id: int):
+        """
+        Data-modifying CTEs expiring a user's pending consents: the consent
+        UPDATE ... RETURNING id, and the FI type update and cancellation log
+        insert driven by the returned ids.
+        """
+        expired = (
+            update(ConsentRequest)
+            .where(
+                ConsentRequest.user_id == user_id,
+                ConsentRequest.status == ConsentStatus.PENDING
+            )
+            .values(status=ConsentStatus.EXPIRED)
+            .returning(ConsentRequest.id)
+            .cte("expired_consents")
+        )
+        expired_fi_types = (
+            update(ConsentFIType)
+            .where(ConsentFIType.consent_request_id.in_(select(expired.c.id)))
+            .values(status=ConsentFITypeStatus.EXPIRE)
+            .cte("expired_fi_types")
+        )
+        cancellation_logs = (
+            insert(ConsentCancellationLog)
+            .from_select(
+                ["consent_request_id", "reason", "cancelled_by"],
+                select(
+                    expired.c.id,
+                    literal(Messages.CONSENT_CANCELLED_NEW_CONSENT_CREATED),
+                    cast(literal(CancelledBy.SYSTEM.name), ConsentCancellationLog.cancelled_by.type)
+                )
+            )
+            .cte("consent_cancellation_logs")
+        )
+        return expired, expired_fi_types, cancellation_logs
+
     # ======================================================================
     # Create Consent Request
     # ======================================================================
@@ -260,9 +295,11 @@ class UserService(BaseService):
         user_id: int,
         pan_id: int,
         consent_data: Dict[str, Any]
-    ) -> ConsentRequest:
+    ) -> int:
         """
-        Creates and stores a consent request record from Setu API response.
+        Stores a consent request from the Setu API response together with its
+        FI types, after expiring the user's pending consents (see
+        expire_pending_consents). Everything is one statement and one commit.
         
         Args:
             user_id: User ID
@@ -270,123 +307,125 @@ class UserService(BaseService):
             consent_data: Response data from Setu create_consent API
         
         Returns:
-            ConsentRequest: Created consent request record
+            int: ID of the created consent request record
         """
         def _create():
-            # Extract data from response
-            consent_id = consent_data.get("id")
-            if not consent_id:
-                raise ValueError("Missing consent ID in response")
-            
-            try:
-                consent_status = ConsentStatus[consent_data.get("status", "PENDING")]
-            except KeyError:
-                consent_status = ConsentStatus.PENDING
-            
-            detail = consent_data.get("detail", {})
-            
-            # Get data life from response
-            data_life = detail.get("dataLife", {})
-            try:
-                data_life_unit = UnitEnum[data_life.get("unit", "INF")]
-                data_life_value = data_life.get("value", 0)
-            except KeyError:
-                data_life_unit = UnitEnum.INF
-                data_life_value = 0
-            
-            # Get frequency from response (if present)
-            frequency = detail.get("frequency")
-            frequency_unit = None
-            frequency_value = None
-            if frequency:
-                try:
-                    frequency_unit = UnitEnum[frequency.get("unit")]
-                    frequency_value = frequency.get("value")
-                except KeyError:
-                    pass
-            
-            # Get fetch type from response
-            try:
-                fetch_type = FetchType[detail.get("fetchType", "ONETIME")]
-            except KeyError:
-                fetch_type = FetchType.ONETIME
-            
-            # Extract datetime values directly from response
-            data_range = detail.get("dataRange", {})
-            
-            # Create ConsentRequest record
-            consent_request = ConsentRequest(
-                consent_id=consent_id,
-                user_id=user_id,
-                pan_id=pan_id,
-                status=consent_status,
-                consent_mode=detail.get("consentMode", "STORE"),
-                vua=detail.get("vua", ""),
-                purpose_code=detail.get("purpose", {}).get("code", "101"),
-                purpose_text=detail.get("purpose", {}).get("text", "Wealth management service"),
-                purpose_ref_uri=detail.get("purpose", {}).get("refUri"),
-                purpose_category_type=detail.get("purpose", {}).get("category", {}).get("type"),
-                fetch_type=fetch_type,
-                data_range_from=data_range.get("from"),
-                data_range_to=data_range.get("to"),
-                consent_start=detail.get("consentStart"),
-                consent_expiry=detail.get("consentExpiry"),
-                data_life_unit=data_life_unit,
-                data_life_value=data_life_value,
-                frequency_unit=frequency_unit,
-                frequency_value=frequency_value,
-                redirect_url=consent_data.get("redirectUrl"),
-                trace_id=consent_data.get("traceId"),
-                tags=consent_data.get("tags"),
-                consent_types=detail.get("consentTypes"),
-                context=consent_data.get("context")
+            expired, expired_fi_types, cancellation_logs = self._expire_pending_consents_ctes(user_id)
+            consent_request = (
+                insert(ConsentRequest)
+                .values(**self._consent_request_values(user_id, pan_id, consent_data))
+                .returning(ConsentRequest.id)
+                .cte("new_consent_request")
+            )
+            statement = (
+                select(consent_request.c.id)
+                .add_cte(expired, expired_fi_types, cancellation_logs)
             )
             
-            self.db.add(consent_request)
-            self.db.flush()  # Flush to get the consent_request.id (not committing yet)
-            self.db.refresh(consent_request)
-            return consent_request
+            # Skip invalid FI types
+            fi_types = [
+                fi_type for fi_type in consent_data.get("detail", {}).get("fiTypes", [])
+                if fi_type in FITypeEnum.__members__
+            ]
+            if fi_types:
+                requested_fi_types = (
+                    values(column("fi_type", String), name="requested_fi_types")
+                    .data([(fi_type,) for fi_type in fi_types])
+                )
+                consent_fi_types = (
+                    insert(ConsentFIType)
+                    .from_select(
+                        ["consent_request_id", "fi_type", "status"],
+                        select(
+                            consent_request.c.id,
+                            cast(requested_fi_types.c.fi_type, ConsentFIType.fi_type.type),
+                            cast(literal(ConsentFITypeStatus.ACTIVE.name), ConsentFIType.status.type)
+                        ).select_from(consent_request.join(requested_fi_types, true()))
+                    )
+                    .cte("new_consent_fi_types")
+                )
+                statement = statement.add_cte(consent_fi_types)
+            
+            consent_request_id = self.db.execute(statement).scalar_one()
+            self.commit()
+            return consent_request_id
         
         return self.execute_safely(_create)
 
-    # ======================================================================
-    # Create Consent FI Types
-    # ======================================================================
-    def create_consent_fi_types(
-        self,
-        consent_request_id: int,
-        fi_types: List[str]
-    ) -> List[ConsentFIType]:
-        """
-        Creates and stores consent FI type records for a consent request.
+    @staticmethod
+    def _consent_request_values(
+        user_id: int,
+        pan_id: int,
+        consent_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Column values of the consent request described by a Setu create_consent response."""
+        # Extract data from response
+        consent_id = consent_data.get("id")
+        if not consent_id:
+            raise ValueError("Missing consent ID in response")
         
-        Args:
-            consent_request_id: ID of the consent request
-            fi_types: List of FI type strings from Setu API response
+        try:
+            consent_status = ConsentStatus[consent_data.get("status", "PENDING")]
+        except KeyError:
+            consent_status = ConsentStatus.PENDING
         
-        Returns:
-            List[ConsentFIType]: List of created consent FI type records
-        """
-        def _create():
-            created_fi_types = []
-            for fi_type_str in fi_types:
-                try:
-                    fi_type_enum = FITypeEnum[fi_type_str]
-                    consent_fi_type = ConsentFIType(
-                        consent_request_id=consent_request_id,
-                        fi_type=fi_type_enum,
-                        status=ConsentFITypeStatus.ACTIVE
-                    )
-                    self.db.add(consent_fi_type)
-                    created_fi_types.append(consent_fi_type)
-                except KeyError:
-                    # Skip invalid FI types
-                    continue
-            
-            self.commit()
-            return created_fi_types
+        detail = consent_data.get("detail", {})
         
-        return self.execute_safely(_create)
+        # Get data life from response
+        data_life = detail.get("dataLife", {})
+        try:
+            data_life_unit = UnitEnum[data_life.get("unit", "INF")]
+            data_life_value = data_life.get("value", 0)
+        except KeyError:
+            data_life_unit = UnitEnum.INF
+            data_life_value = 0
+        
+        # Get frequency from response (if present)
+        frequency = detail.get("frequency")
+        frequency_unit = None
+        frequency_value = None
+        if frequency:
+            try:
+                frequency_unit = UnitEnum[frequency.get("unit")]
+                frequency_value = frequency.get("value")
+            except KeyError:
+                pass
+        
+        # Get fetch type from response
+        try:
+            fetch_type = FetchType[detail.get("fetchType", "ONETIME")]
+        except KeyError:
+            fetch_type = FetchType.ONETIME
+        
+        # Extract datetime values directly from response
+        data_range = detail.get("dataRange", {})
+        
+        return dict(
+            consent_id=consent_id,
+            user_id=user_id,
+            pan_id=pan_id,
+            status=consent_status,
+            consent_mode=detail.get("consentMode", "STORE"),
+            vua=detail.get("vua", ""),
+            purpose_code=detail.get("purpose", {}).get("code", "101"),
+            purpose_text=detail.get("purpose", {}).get("text", "Wealth management service"),
+            purpose_ref_uri=detail.get("purpose", {}).get("refUri"),
+            purpose_category_type=detail.get("purpose", {}).get("category", {}).get("type"),
+            fetch_type=fetch_type,
+            data_range_from=data_range.get("from"),
+            data_range_to=data_range.get("to"),
+            consent_start=detail.get("consentStart"),
+            consent_expiry=detail.get("consentExpiry"),
+            data_life_unit=data_life_unit,
+            data_life_value=data_life_value,
+            frequency_unit=frequency_unit,
+            frequency_value=frequency_value,
+            redirect_url=consent_data.get("redirectUrl"),
+            trace_id=consent_data.get("traceId"),
+            tags=consent_data.get("tags"),
+            consent_types=detail.get("consentTypes"),
+            context=consent_data.get("context")
+        )
 
     # ======================================================================
     # Create User Data Session
@@ -459,6 +498,56 @@ class UserService(BaseService):
         return self.execute_safely(_create)
     
 
+    # ======================================================================
+    # Find Consent Request and Data Session
+    # ======================================================================
+    def _find_consent_session(
+        self,
+        consent_id: str,
+        session_id: Optional[str] = None
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[DataSession]]:
+        """
+        Looks up a consent request by consent_id together with its data session
+        in one statement: the session with session_id if given, else the latest.
+        
+        A cached consent request costs a single consent_data_session probe on
+        (consent_request_id, id DESC); otherwise consent_request is outer joined
+        to its sessions and the result cached.
+        
+        Returns:
+            ((consent_request_id, user_id) or None, DataSession or None)
+        """
+        consent_request = _consent_requests.get(consent_id)
+        
+        if consent_request is not MISS:
+            session_filter = DataSession.consent_request_id == consent_request[0]
+            if session_id:
+                session_filter = and_(session_filter, DataSession.session_id == session_id)
+            data_session = self.db.execute(
+                select(DataSession)
+                .where(session_filter)
+                .order_by(DataSession.id.desc())
+                .limit(1)
+            ).scalar_one_or_none()
+            return consent_request, data_session
+        
+        join_condition = DataSession.consent_request_id == ConsentRequest.id
+        if session_id:
+            join_condition = and_(join_condition, DataSession.session_id == session_id)
+        row = self.db.execute(
+            select(ConsentRequest.id, ConsentRequest.user_id, DataSession)
+            .outerjoin(DataSession, join_condition)
+            .where(ConsentRequest.consent_id == consent_id)
+            .order_by(DataSession.id.desc())
+            .limit(1)
+        ).first()
+        if not row:
+            return None, None
+        
+        consent_request = (row.id, row.user_id)
+        _consent_requests.set(consent_id, consent_request)
+        return consent_request, row.DataSession
+
     # ======================================================================
     # Update Session Status
     # ======================================================================
@@ -482,29 +571,16 @@ class UserService(BaseService):
 
         def _update():
             # ------------------------------------------------
-            # 1. Fetch Consent Request
+            # 1. Fetch Consent Request and Data Session
             # ------------------------------------------------
-            consent_request = (
-                self.db.query(ConsentRequest)
-                .filter(ConsentRequest.consent_id == consent_id)
-                .first()
-            )
+            consent_request, data_session = self._find_consent_session(consent_id, session_id)
             if not consent_request:
                 logger_error(f"Consent request not found for consent_id: {consent_id}")
                 return
 
             # ------------------------------------------------
-            # 2. Fetch Data Session
+            # 2. Check Data Session
             # ------------------------------------------------
-            data_session = (
-                self.db.query(DataSession)
-                .filter(
-                    DataSession.consent_request_id == consent_request.id,
-                    DataSession.session_id == session_id
-                )
-                .order_by(DataSession.id.desc())
-                .first()
-            )
             if not data_session:
                 logger_error(f"Data session not found for consent_id: {consent_id}")
                 return
@@ -516,6 +592,7 @@ class UserService(BaseService):
                 new_status = DataSessionStatusEnum[session_status]
                 data_session.status = new_status
                 self.commit()
+                publish_session_status(consent_id, data_session)
 
                 # ------------------------------------------------
                 # 4. Handle COMPLETED Status
@@ -533,7 +610,7 @@ class UserService(BaseService):
                         # ---- Fetch full session data from Setu ----
                         session_json = setu_service.fetch_session_data(session_id)
 
-                        user_id = consent_request.user_id
+                        _, user_id = consent_request
 
                         # ---- Build file name ----
                         file_name = f"session_{session_id}_{consent_id}_{user_id}.json"
@@ -543,28 +620,44 @@ class UserService(BaseService):
                         with open(file_path, "w") as f:
                             json.dump(session_json, f, indent=2)
 
-                        # ---- Update DB with file path ----
+                        # ---- Update DB with file path and size (used to route the ingest) ----
                         data_session.consent_file_path = str(file_path)
+                        data_session.file_size_bytes = file_path.stat().st_size
+                        data_session.transaction_count = count_session_transactions(session_json)
                         data_session.last_fetched_at = datetime.now(timezone.utc)
                         self.commit()
 
                         logger_info(
                             "Completed session data stored to file",
                             file_path=str(file_path),
+                            file_size_bytes=data_session.file_size_bytes,
+                            transaction_count=data_session.transaction_count,
                             session_id=session_id,
                             consent_id=consent_id
                         )
 
                         # ---- Trigger background job to process session data ----
+                        # Users still onboarding are waiting on this data: jump the refresh queue.
+                        # Large sessions go to the high-memory worker either way.
+                        user = self.db.get(User, user_id)
+                        is_onboarding = bool(user and not user.is_setup_complete)
+                        route = session_ingest_route(
+                            data_session.file_size_bytes,
+                            data_session.transaction_count,
+                            is_onboarding
+                        )
                         try:
-                            celery_app.send_task(
+                            get_celery_client().send_task(
                                 "process_session_data",
-                                args=[data_session.id]
+                                args=[data_session.id],
+                                **route
                             )
                             logger_info(
                                 "Background job triggered for session data processing",
                                 data_session_id=data_session.id,
-                                session_id=session_id
+                                session_id=session_id,
+                                is_onboarding=is_onboarding,
+                                queue=route.get("queue", QUEUE_REFRESH)
                             )
                         except Exception as e:
                             logger_error(
@@ -618,20 +711,10 @@ class UserService(BaseService):
         """
         def _check():
             # Default response structure for not found cases
-            default_response = {
-                "session_id": None,
-                "consent_id": consent_id,
-                "status": None,
-                "exists": False,
-                "completed": False
-            }
+            default_response = session_status_payload(consent_id, None)
             
-            # Find the consent request by consent_id
-            consent_request = (
-                self.db.query(ConsentRequest)
-                .filter(ConsentRequest.consent_id == consent_id)
-                .first()
-            )
+            # Find the consent request by consent_id and its latest data session
+            consent_request, data_session = self._find_consent_session(consent_id)
             
             if not consent_request:
                 logger_warning(
@@ -639,15 +722,6 @@ class UserService(BaseService):
                 )
                 return default_response
             
-            # Find the latest data session for the consent request
-            data_session = (
-                self.db.query(DataSession)
-                .filter(
-                    DataSession.consent_request_id == consent_request.id
-                )
-                .order_by(DataSession.id.desc())
-                .first()
-            )
             
             if not data_session:
                 logger_info(
@@ -655,20 +729,6 @@ class UserService(BaseService):
                 )
                 return default_response
             
-            # Session found - return with actual data
-            is_completed = data_session.status == DataSessionStatusEnum.COMPLETED
-            usage_count = data_session.usage_count or 0
-            # Session is ready if it's completed AND usage_count is 1 (data processing is done)
-            is_ready = is_completed and usage_count == 1
-            
-            return {
-                "session_id": data_session.session_id,
-                "consent_id": consent_id,
-                "status": data_session.status.value,
-                "exists": True,
-                "completed": is_completed,
-                "usage_count": usage_count,
-                "is_ready": is_ready  # Green flag: completed and usage_count is 1
-            }
+            return session_status_payload(consent_id, data_session)
         
         return self.execute_safely(_check)
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+Result cache for per-account analytics computed by TransactionService.
+
+Entries are keyed by (account_id, method, args, data_version). The ingest job
+bumps an account's data_version once its data is committed, so an outdated
+entry can never be addressed again and simply ages out of both tiers.
+
+Misses are computed on the primary: a replica lagging behind the bump would
+otherwise store pre-ingest results under the new version.
+"""
+import json
+import time
+from functools import wraps
+from typing import Callable, Iterable, Optional
+from redis import RedisError
+from app.config.redis_client import redis_client
+from app.config.setting import settings
+from app.config.database import use_primary
+from app.utils.cache import TieredCache, MISS
+from app.utils.logger_util import logger_warning, logger_error
+
+DATA_VERSION_KEY = "analytics:data_version:{account_id}"
+
+analytics_cache = TieredCache(
+    redis=redis_client,
+    max_entries=settings.redis.CACHE_LRU_MAX_ENTRIES,
+    ttl_seconds=settings.redis.CACHE_TTL_SECONDS,
+    prefix="analytics:result",
+)
+
+
+def get_data_version(account_id: int) -> Optional[int]:
+    """
+    Returns the current data version of an account, or None when it cannot
+    be determined (Redis unavailable) and the cache must be bypassed.
+
+    A missing version (never bumped, evicted or flushed) is started at the
+    current time in microseconds rather than 0, so entries cached under an
+    earlier version of the key - still in some process's LRU - stay unreachable.
+    """
+    key = DATA_VERSION_KEY.format(account_id=account_id)
+    try:
+        raw = redis_client.get(key)
+        if raw is None:
+            redis_client.set(key, time.time_ns() // 1000, nx=True)
+            raw = redis_client.get(key)
+    except RedisError as e:
+        logger_warning(f"Data version lookup failed: {e}", account_id=account_id)
+        return None
+
+    return int(raw) if raw else None
+
+
+def bump_data_versions(account_ids: Iterable[int]):
+    """
+    Increments the data version of each account so cached analytics computed
+    before the latest ingest are no longer addressable.
+    """
+    account_ids = list(account_ids)
+    if not account_ids:
+        return
+
+    try:
+        pipe = redis_client.pipeline(transaction=False)
+        for account_id in account_ids:
+            pipe.incr(DATA_VERSION_KEY.format(account_id=account_id))
+        pipe.execute()
+    except RedisError as e:
+        logger_error(f"Failed to bump analytics data versions: {e}", account_ids=account_ids)
+
+
+def cached_analytics(key_suffix: Optional[Callable[[], str]] = None):
+    """
+    Decorator for TransactionService methods whose first argument is account_id.
+    Results are cached only when computed on the primary (see module docstring).
+
+    Args:
+        key_suffix: Optional callable adding a time-dependent part to the key
+                    (e.g. the current month for "last month" metrics)
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(self, account_id: int, *args, **kwargs):
+            version = get_data_version(account_id)
+            if version is None:
+                return func(self, account_id, *args, **kwargs)
+
+            call_args = json.dumps([args, sorted(kwargs.items())], default=str)
+            key = f"{account_id}:{func.__name__}:{call_args}:{version}"
+            if key_suffix is not None:
+                key = f"{key}:{key_suffix()}"
+
+            value = analytics_cache.get(key)
+            if value is not MISS:
+                return value
+
+            with use_primary(self.db):
+                value = func(self, account_id, *args, **kwargs)
+            analytics_cache.set(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,119 @@
+"""
+Two-tier cache: a bounded in-process LRU in front of Redis.
+
+Redis failures never break the caller - the cache degrades to the local
+tier (or to a miss) and logs a warning.
+"""
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+from redis import Redis, RedisError
+from app.utils.logger_util import logger_warning
+
+# Sentinel returned on cache misses (None is a valid cached value)
+MISS = object()
+
+
+class LRUCache:
+    """Thread-safe LRU cache with a per-entry TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISS
+
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return MISS
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None):
+        expires_at = time.monotonic() + (ttl_seconds or self._ttl_seconds)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class TieredCache:
+    """
+    LRU tier backed by Redis. Values must be JSON serialisable.
+
+    local_ttl_seconds, when shorter than ttl_seconds, bounds how long another
+    process's delete can go unnoticed by this process's local tier.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis],
+        max_entries: int,
+        ttl_seconds: int,
+        prefix: str,
+        local_ttl_seconds: Optional[int] = None
+    ):
+        self._redis = redis
+        self._local = LRUCache(max_entries, local_ttl_seconds or ttl_seconds)
+        self._ttl_seconds = ttl_seconds
+        self._prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    def get(self, key: str) -> Any:
+        value = self._local.get(key)
+        if value is not MISS or self._redis is None:
+            return value
+
+        try:
+            raw = self._redis.get(self._key(key))
+        except RedisError as e:
+            logger_warning(f"Cache read failed: {e}", key=key)
+            return MISS
+
+        if raw is None:
+            return MISS
+
+        value = json.loads(raw)
+        self._local.set(key, value)
+        return value
+
+    def set(self, key: str, value: Any):
+        self._local.set(key, value)
+        if self._redis is None:
+            return
+
+        try:
+            self._redis.set(self._key(key), json.dumps(value), ex=self._ttl_seconds)
+        except RedisError as e:
+            logger_warning(f"Cache write failed: {e}", key=key)
+
+    def delete(self, key: str):
+        self._local.delete(key)
+        if self._redis is None:
+            return
+
+        try:
+            self._redis.delete(self._key(key))
+        except RedisError as e:
+            logger_warning(f"Cache delete failed: {e}", key=key)
@@ -0,0 +1,99 @@
+"""
+Narration-based transaction categoriser.
+
+The whole rule set is compiled into one keyword index (word / phrase / prefix
+-> category). A narration is split into words once and every word costs a
+constant number of dict lookups, so throughput does not degrade as rules are
+added. This is the word-aligned equivalent of an Aho-Corasick automaton; a
+single alternation regex was measured slower than one regex per rule because
+Python's re engine tries every alternative at every position.
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from app.constants.transaction_categories import CATEGORY_RULES, OTHERS, TRANSFER
+
+_WORD = re.compile(r"[A-Z0-9]+")
+
+
+class NarrationCategoriser:
+    """Maps a transaction narration to a category id."""
+
+    def __init__(
+        self,
+        rules: Sequence[Tuple[int, Sequence[str]]],
+        default_category_id: int,
+        upi_handle_category_id: Optional[int] = None
+    ):
+        self.default_category_id = default_category_id
+
+        # keyword -> (priority, category id); lower priority value wins
+        self._words: Dict[str, Tuple[int, int]] = {}
+        self._phrases: Dict[Tuple[str, ...], Tuple[int, int]] = {}
+        self._prefixes: Dict[str, Tuple[int, int]] = {}
+        # First words of multi-word phrases, so n-grams are only built where they can match
+        self._phrase_starts: Set[str] = set()
+
+        for priority, (category_id, keywords) in enumerate(rules):
+            entry = (priority, category_id)
+            for keyword in keywords:
+                is_prefix = keyword.endswith("*")
+                words = tuple(_WORD.findall(keyword.upper()))
+                if is_prefix and len(words) == 1:
+                    self._prefixes.setdefault(words[0], entry)
+                elif len(words) == 1:
+                    self._words.setdefault(words[0], entry)
+                else:
+                    self._phrases.setdefault(words, entry)
+                    self._phrase_starts.add(words[0])
+
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._prefixes})
+        self._phrase_lengths = sorted({len(phrase) for phrase in self._phrases})
+
+        # A UPI handle (name@bank) with no stronger hit counts as this category
+        self._upi_entry = (len(rules), upi_handle_category_id) if upi_handle_category_id else None
+
+    def categorise(self, narration: Optional[str]) -> int:
+        """Return the category id for a single narration."""
+        if not narration:
+            return self.default_category_id
+
+        words = _WORD.findall(narration.upper())
+        best = self._upi_entry if "@" in narration else None
+
+        for index, word in enumerate(words):
+            hit = self._words.get(word)
+
+            if hit is None and self._prefix_lengths:
+                for length in self._prefix_lengths:
+                    if length > len(word):
+                        break
+                    hit = self._prefixes.get(word[:length])
+                    if hit is not None:
+                        break
+
+            if word in self._phrase_starts:
+                for length in self._phrase_lengths:
+                    phrase_hit = self._phrases.get(tuple(words[index:index + length]))
+                    if phrase_hit is not None and (hit is None or phrase_hit[0] < hit[0]):
+                        hit = phrase_hit
+
+            if hit is not None:
+                if hit[0] == 0:
+                    return hit[1]
+                if best is None or hit[0] < best[0]:
+                    best = hit
+
+        return best[1] if best else self.default_category_id
+
+    def categorise_many(self, narrations: Iterable[Optional[str]]) -> List[int]:
+        """Return category ids for a batch of narrations."""
+        categorise = self.categorise
+        return [categorise(narration) for narration in narrations]
+
+
+categoriser = NarrationCategoriser(
+    CATEGORY_RULES,
+    default_category_id=OTHERS,
+    upi_handle_category_id=TRANSFER
+)
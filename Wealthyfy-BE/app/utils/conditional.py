@@ -0,0 +1,43 @@
+"""
+Helpers for conditional GET (ETag / If-None-Match) handling.
+"""
+import hashlib
+from typing import Any
+from fastapi import Request, Response, status
+
+# Responses are per-user and must be revalidated on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+def build_etag(*parts: Any) -> str:
+    """Build a weak ETag from the parts that determine a response body."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'W/"{digest[:20]}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Return True if the request's If-None-Match header matches the ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    # Weak comparison: ignore the W/ prefix on both sides
+    opaque = etag.removeprefix("W/")
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    return opaque in candidates
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def with_cache_headers(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
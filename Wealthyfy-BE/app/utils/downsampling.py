@@ -0,0 +1,63 @@
+"""
+Downsampling of time series for charts.
+
+Both functions return the indices of the points to keep, always including
+the first and last point, so callers can slice any parallel arrays.
+"""
+import numpy as np
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: keeps the point of each bucket that forms
+    the largest triangle with the previously kept point and the next bucket's
+    average, which preserves the visual shape of the series.
+    """
+    n = x.size
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (threshold - 2)
+    sampled = np.empty(threshold, dtype=np.int64)
+    sampled[0] = 0
+    a = 0
+
+    for i in range(threshold - 2):
+        avg_start = int(np.floor((i + 1) * every)) + 1
+        avg_end = min(int(np.floor((i + 2) * every)) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+
+        range_start = int(np.floor(i * every)) + 1
+        range_end = int(np.floor((i + 1) * every)) + 1
+
+        areas = np.abs(
+            (x[a] - avg_x) * (y[range_start:range_end] - y[a])
+            - (x[a] - x[range_start:range_end]) * (avg_y - y[a])
+        )
+        a = range_start + int(np.argmax(areas))
+        sampled[i + 1] = a
+
+    sampled[-1] = n - 1
+    return sampled
+
+
+def min_max_indices(y: np.ndarray, threshold: int) -> np.ndarray:
+    """
+    Keeps the minimum and maximum of each of (threshold - 2) / 2 equal-width
+    buckets, so no peak or trough is lost. Fully vectorised.
+    """
+    n = y.size
+    if threshold >= n or threshold < 4:
+        return np.arange(n)
+
+    # Two slots are reserved for the first and last point
+    buckets = (threshold - 2) // 2
+    bucket_ids = (np.arange(n) * buckets) // n
+
+    # Within each bucket, sort by value: first is the min, last is the max
+    order = np.lexsort((y, bucket_ids))
+    starts = np.searchsorted(bucket_ids[order], np.arange(buckets))
+    ends = np.r_[starts[1:], n] - 1
+
+    return np.unique(np.r_[0, order[starts], order[ends], n - 1])
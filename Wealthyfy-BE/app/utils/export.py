@@ -0,0 +1,140 @@
+"""
+Chunked CSV / Parquet encoders for transaction exports.
+
+Both encoders consume an iterator of row batches (as produced by
+TransactionService.iter_transaction_batches) and yield encoded bytes batch by
+batch, so memory stays constant regardless of the account's history size.
+"""
+import csv
+import io
+import time
+from typing import Iterable, Iterator, Sequence
+from app.config.setting import settings
+
+# Column order of every export
+EXPORT_COLUMNS = [
+    "transaction_id",
+    "transaction_timestamp",
+    "transaction_type",
+    "mode",
+    "amount",
+    "balance",
+    "narration",
+]
+
+# Async exports are written here as <user_id>/<export_id>.<format>
+EXPORT_STORAGE_DIR = settings.app.APP_EXPORT_STORAGE_DIR
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def delete_expired_exports(max_age_seconds: float) -> int:
+    """
+    Delete exports (and abandoned .part files) last written more than
+    max_age_seconds ago. User directories are kept: a running export may be
+    about to write into one.
+
+    Returns:
+        Number of files deleted
+    """
+    if not EXPORT_STORAGE_DIR.is_dir():
+        return 0
+
+    cutoff = time.time() - max_age_seconds
+    deleted = 0
+    for path in EXPORT_STORAGE_DIR.glob("*/*"):
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+                deleted += 1
+        except FileNotFoundError:
+            # Deleted concurrently (e.g. by another cleanup run)
+            continue
+    return deleted
+
+
+def iter_csv_chunks(batches: Iterable[Sequence[Sequence]]) -> Iterator[bytes]:
+    """Yield a CSV header followed by one encoded chunk per row batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_COLUMNS)
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """
+    Write-only stream that hands written bytes back to the caller.
+    tell() keeps counting across drains because the Parquet footer records
+    absolute offsets.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_parquet_chunks(batches: Iterable[Sequence[Sequence]]) -> Iterator[bytes]:
+    """Yield a Parquet file one row group per batch."""
+    # pyarrow is heavy; only pay the import cost when a Parquet export runs
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ("transaction_id", pa.string()),
+        ("transaction_timestamp", pa.timestamp("us", tz="UTC")),
+        ("transaction_type", pa.string()),
+        ("mode", pa.string()),
+        ("amount", pa.decimal128(15, 2)),
+        ("balance", pa.decimal128(15, 2)),
+        ("narration", pa.string()),
+    ])
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        for batch in batches:
+            columns = list(zip(*batch)) if batch else [[] for _ in EXPORT_COLUMNS]
+            writer.write_table(pa.Table.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(columns, schema)],
+                schema=schema,
+            ))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+
+    yield sink.drain()
+
+
+def iter_export_chunks(batches: Iterable[Sequence[Sequence]], export_format: str) -> Iterator[bytes]:
+    if export_format == "parquet":
+        return iter_parquet_chunks(batches)
+    return iter_csv_chunks(batches)
@@ -0,0 +1,51 @@
+"""
+Stage timings and data-quality counters of one session ingest.
+
+Collected in memory while the ingest runs (a perf_counter read per stage and
+a dict increment per event), then stored on DataSession.ingest_stats and
+logged once per session, instead of a log line per bad value.
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+# Stages in the order they run; also the key order of the persisted JSON
+INGEST_STAGES = (
+    "read", "parse", "accounts", "holders", "summaries", "transactions", "commit", "notify"
+)
+
+
+class IngestStats:
+    """Per-stage wall time and named counters for one ingest attempt."""
+
+    def __init__(self):
+        self.stage_seconds: Dict[str, float] = dict.fromkeys(INGEST_STAGES, 0.0)
+        self.counters: Dict[str, int] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Adds the wall time of the block to a stage; stages repeat per account."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_seconds[name] = self.stage_seconds.get(name, 0.0) + time.perf_counter() - started
+
+    def incr(self, name: str, amount: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    @property
+    def has_data_issues(self) -> bool:
+        return any(
+            self.counters.get(name)
+            for name in ("invalid_dates", "invalid_decimals", "transactions_skipped", "accounts_failed")
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-ready summary, times in milliseconds."""
+        return {
+            "total_ms": round((time.perf_counter() - self._started) * 1000, 1),
+            "stages_ms": {name: round(seconds * 1000, 1) for name, seconds in self.stage_seconds.items()},
+            "counters": dict(sorted(self.counters.items())),
+        }
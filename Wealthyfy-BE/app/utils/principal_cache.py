@@ -0,0 +1,83 @@
+"""
+Cache of authenticated users (principals) keyed by Keycloak subject.
+
+authenticate_user resolves the token's subject to a Principal: the user's id,
+flags and pancard reference, loaded once and served from the cache until it
+expires or UserService invalidates it after changing one of those fields.
+The pancard is cached encrypted and decrypted only when read.
+"""
+from dataclasses import dataclass, asdict
+from typing import Optional
+from app.config.redis_client import redis_client
+from app.config.setting import settings
+from app.models.user import User
+from app.utils.cache import TieredCache, MISS
+from app.utils.encryption_helper import decrypt_value
+
+principal_cache = TieredCache(
+    redis=redis_client if settings.redis.PRINCIPAL_CACHE_REDIS else None,
+    max_entries=settings.redis.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.redis.PRINCIPAL_CACHE_TTL_SECONDS,
+    prefix="auth:principal",
+    local_ttl_seconds=(
+        settings.redis.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS if settings.redis.PRINCIPAL_CACHE_REDIS else None
+    ),
+)
+
+
+@dataclass
+class PrincipalPancard:
+    id: int
+    encrypted_pancard: str
+
+    @property
+    def pancard(self) -> str:
+        return decrypt_value(self.encrypted_pancard)
+
+
+@dataclass
+class Principal:
+    """The authenticated user as endpoints see it (current_user)."""
+    id: int
+    keycloak_user_id: str
+    phone_number: Optional[str]
+    email_verified: bool
+    is_setup_complete: bool
+    status: str
+    pancard: Optional[PrincipalPancard] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        """Builds the principal of a user loaded with its pancard."""
+        return cls(
+            id=user.id,
+            keycloak_user_id=user.keycloak_user_id,
+            phone_number=user.phone_number,
+            email_verified=bool(user.email_verified),
+            is_setup_complete=bool(user.is_setup_complete),
+            status=getattr(user.status, "value", user.status),
+            pancard=(
+                PrincipalPancard(id=user.pancard.id, encrypted_pancard=user.pancard._pancard)
+                if user.pancard else None
+            ),
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Principal":
+        pancard = data.get("pancard")
+        return cls(**{**data, "pancard": PrincipalPancard(**pancard) if pancard else None})
+
+
+def get_cached_principal(keycloak_user_id: str) -> Optional[Principal]:
+    data = principal_cache.get(keycloak_user_id)
+    return None if data is MISS else Principal.from_dict(data)
+
+
+def cache_principal(principal: Principal):
+    principal_cache.set(principal.keycloak_user_id, asdict(principal))
+
+
+def invalidate_principal(keycloak_user_id: Optional[str]):
+    """Drops a user's cached principal; call after committing a change to its fields."""
+    if keycloak_user_id:
+        principal_cache.delete(keycloak_user_id)
@@ -0,0 +1,269 @@
+"""
+Opt-in wall-clock sampling profiler for single requests and Celery tasks.
+
+A capture runs a background thread that reads the stacks of the profiled
+work every APP_PROFILING_INTERVAL_MS and counts them. The result is written
+to storage/profiles as collapsed stacks ("outer;inner;leaf <count>"), which
+speedscope, flamegraph.pl and inferno render as a flame graph.
+
+Triggers:
+    - HTTP: an X-Profile-Token header signed with APP_PROFILING_SECRET
+      (see sign_profile_token); the response carries X-Profile-Id
+    - Celery: a `_profile=True` kwarg, removed before the task runs
+
+Captures are rate limited per process (one at a time, at most
+APP_PROFILING_MAX_PER_MINUTE) and stop sampling after
+APP_PROFILING_MAX_SECONDS, so the hook can stay enabled in production.
+Requests without a valid token pay one header lookup.
+"""
+import contextvars
+import hashlib
+import hmac
+import re
+import secrets
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from app.config.setting import settings
+from app.utils.logger_util import logger_info, logger_error
+
+PROFILE_STORAGE_DIR = Path("storage/profiles")
+PROFILE_HEADER = "x-profile-token"
+PROFILE_ID_HEADER = "x-profile-id"
+PROFILE_TASK_KWARG = "_profile"
+
+# Frames this close to a thread's root are checked for the context running
+# the profiled work (anyio worker threads, asyncio handles)
+_CONTEXT_SEARCH_DEPTH = 12
+
+_current_capture: contextvars.ContextVar[Optional["ProfileCapture"]] = contextvars.ContextVar(
+    "profile_capture", default=None
+)
+
+
+def sign_profile_token(method: str, path: str, ttl_seconds: int = 300) -> str:
+    """
+    Token for profiling one endpoint, valid for ttl_seconds.
+    Example: sign_profile_token("GET", "/accounts/12/monthly-statistics")
+    """
+    expires_at = int(time.time()) + ttl_seconds
+    return f"{expires_at}.{_token_signature(method, path, expires_at)}"
+
+
+def verify_profile_token(token: str, method: str, path: str) -> bool:
+    secret = settings.app.APP_PROFILING_SECRET
+    if not secret or not token:
+        return False
+    expires_at, _, signature = token.partition(".")
+    if not expires_at.isdigit() or int(expires_at) < time.time():
+        return False
+    return hmac.compare_digest(signature, _token_signature(method, path, int(expires_at)))
+
+
+def _token_signature(method: str, path: str, expires_at: int) -> str:
+    message = f"{method.upper()} {path} {expires_at}".encode()
+    return hmac.new(settings.app.APP_PROFILING_SECRET.encode(), message, hashlib.sha256).hexdigest()
+
+
+class _CaptureBudget:
+    """Per-process limit: one capture at a time, a fixed number per minute."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._active = False
+        self._started_at: list = []
+
+    def acquire(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            self._started_at = [t for t in self._started_at if now - t < 60]
+            if self._active or len(self._started_at) >= settings.app.APP_PROFILING_MAX_PER_MINUTE:
+                return False
+            self._active = True
+            self._started_at.append(now)
+            return True
+
+    def release(self):
+        with self._lock:
+            self._active = False
+
+
+_budget = _CaptureBudget()
+
+
+class ProfileCapture:
+    """
+    Samples the stacks of one unit of work into collapsed-stack counts.
+
+    With a thread_ident, that thread is sampled (Celery tasks run on the
+    worker child's main thread). Without one, any thread currently running
+    under this capture's context is sampled, which follows a request across
+    the threadpool hops of its dependencies, endpoint and serialisation.
+    """
+
+    def __init__(self, name: str, thread_ident: Optional[int] = None):
+        started = datetime.now(timezone.utc)
+        self.profile_id = f"{started:%Y%m%dT%H%M%S}-{_slug(name)}-{secrets.token_hex(3)}"
+        self.path = PROFILE_STORAGE_DIR / f"{self.profile_id}.folded"
+        self.samples: Counter = Counter()
+        self._thread_ident = thread_ident
+        self._interval = max(settings.app.APP_PROFILING_INTERVAL_MS, 1) / 1000
+        self._deadline = time.monotonic() + settings.app.APP_PROFILING_MAX_SECONDS
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(target=self._run, name=f"profiler-{self.profile_id}", daemon=True)
+        self._labels: Dict[object, str] = {}
+
+    def start(self):
+        self._sampler.start()
+
+    def stop(self) -> Path:
+        """Stops sampling and writes the profile; returns its path."""
+        self._stopped.set()
+        self._sampler.join()
+        PROFILE_STORAGE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+        return self.path
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stopped.wait(self._interval):
+            if time.monotonic() > self._deadline:
+                return
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                if self._thread_ident is not None:
+                    if ident != self._thread_ident:
+                        continue
+                    self.samples[self._stack(frame)] += 1
+                else:
+                    stack = self._stack_in_context(frame)
+                    if stack:
+                        self.samples[stack] += 1
+
+    def _stack(self, frame) -> Tuple[str, ...]:
+        stack = []
+        while frame is not None:
+            stack.append(self._label(frame.f_code))
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+    def _stack_in_context(self, frame) -> Optional[Tuple[str, ...]]:
+        frames = []
+        while frame is not None:
+            frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+
+        # Keep only the frames run inside the capture's context
+        for depth, root_frame in enumerate(frames[:_CONTEXT_SEARCH_DEPTH]):
+            if _frame_context(root_frame) is self:
+                return tuple(self._label(f.f_code) for f in frames[depth + 1:])
+        return None
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+
+def _frame_context(frame) -> Optional[ProfileCapture]:
+    """The capture a frame runs its callee under, when it runs one via Context.run."""
+    code_name = frame.f_code.co_name
+    if code_name == "run":  # anyio WorkerThread.run: context.run(func, *args)
+        context = frame.f_locals.get("context")
+    elif code_name == "_run":  # asyncio Handle._run: self._context.run(...)
+        context = getattr(frame.f_locals.get("self"), "_context", None)
+    else:
+        return None
+    if isinstance(context, contextvars.Context):
+        return context.get(_current_capture)
+    return None
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-")[:80]
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests that carry a valid X-Profile-Token."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.app.APP_PROFILING_SECRET:
+            return await self.app(scope, receive, send)
+
+        token = next(
+            (value.decode() for key, value in scope["headers"] if key == PROFILE_HEADER.encode()),
+            None
+        )
+        if not token or not verify_profile_token(token, scope["method"], scope["path"]):
+            return await self.app(scope, receive, send)
+        if not _budget.acquire():
+            logger_info("Profile capture skipped, budget exhausted", path=scope["path"])
+            return await self.app(scope, receive, send)
+
+        capture = ProfileCapture(f"{scope['method']} {scope['path']}")
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (PROFILE_ID_HEADER.encode(), capture.profile_id.encode())
+                ]
+            await send(message)
+
+        context_token = _current_capture.set(capture)
+        capture.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            _current_capture.reset(context_token)
+            _finish(capture)
+
+
+# Captures of running Celery tasks, by task id
+_task_captures: Dict[str, ProfileCapture] = {}
+
+
+def start_task_profile(task_id: str, task_name: str, kwargs: Optional[dict]):
+    """task_prerun hook: starts a capture when the task was sent with _profile=True."""
+    if not kwargs or not kwargs.pop(PROFILE_TASK_KWARG, False):
+        return
+    if not _budget.acquire():
+        logger_info("Profile capture skipped, budget exhausted", task=task_name, task_id=task_id)
+        return
+    capture = ProfileCapture(task_name, thread_ident=threading.get_ident())
+    _task_captures[task_id] = capture
+    capture.start()
+
+
+def stop_task_profile(task_id: str):
+    """task_postrun hook."""
+    capture = _task_captures.pop(task_id, None)
+    if capture:
+        _finish(capture)
+
+
+def _finish(capture: ProfileCapture):
+    try:
+        path = capture.stop()
+        logger_info(
+            "Profile captured",
+            profile_id=capture.profile_id,
+            path=str(path),
+            samples=sum(capture.samples.values())
+        )
+    except Exception as e:
+        logger_error(f"Failed to write profile: {e}", profile_id=capture.profile_id)
+    finally:
+        _budget.release()
@@ -0,0 +1,180 @@
+"""
+Vectorised recurring-payment detection.
+
+Transactions are grouped by (normalised counterparty, direction, amount band)
+- a band being a run of amounts each within 20% of the next - and every group's inter-transaction intervals are reduced with NumPy in one
+pass over the sorted arrays - no Python loop runs per transaction or per
+interval. Groups whose mean interval matches a known billing cycle, and whose
+intervals and amounts are regular enough, are reported as recurring series.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from app.models.recurring_payment import RecurringFrequencyEnum
+
+SECONDS_PER_DAY = 86400.0
+
+# Nominal cycle length in days, matched against each group's mean interval
+FREQUENCY_PERIODS = [
+    (RecurringFrequencyEnum.WEEKLY, 7.0),
+    (RecurringFrequencyEnum.FORTNIGHTLY, 14.0),
+    (RecurringFrequencyEnum.MONTHLY, 30.44),
+    (RecurringFrequencyEnum.QUARTERLY, 91.31),
+    (RecurringFrequencyEnum.HALF_YEARLY, 182.62),
+    (RecurringFrequencyEnum.YEARLY, 365.25),
+]
+_PERIOD_DAYS = np.array([days for _, days in FREQUENCY_PERIODS])
+
+MIN_OCCURRENCES = 3
+# Mean interval may be this far (relative) from the nominal cycle
+PERIOD_TOLERANCE = 0.15
+# Coefficient of variation limits for intervals and amounts
+MAX_INTERVAL_CV = 0.35
+MAX_AMOUNT_CV = 0.25
+# Sorted amounts of one counterparty and direction start a new band where one
+# exceeds the previous by more than this (relative)
+AMOUNT_BAND_GAP = 0.2
+# A series is over if it missed this many cycles before the latest transaction
+MAX_MISSED_CYCLES = 2.0
+# Short, irregular runs (a few coincidental payments) score below this
+MIN_CONFIDENCE = 0.5
+
+# Alphabetic words only; words glued to digits are reference numbers or account codes
+_WORD = re.compile(r"(?<![A-Z0-9])[A-Z]{2,}(?![A-Z0-9])")
+_UPI_HANDLE = re.compile(r"([A-Z0-9._-]+)@[A-Z]+")
+_NOISE_WORDS = {
+    "UPI", "DR", "CR", "NEFT", "IMPS", "RTGS", "POS", "NACH", "ACH", "ECS", "SI", "MANDATE",
+    "TO", "FROM", "BY", "FOR", "THE", "PAYMENT", "PAY", "TRANSFER", "TRF", "REF", "NA",
+    "P2A", "P2M", "P2P", "INB", "MB", "IB", "BIL", "ONL", "TXN", "COLLECT", "AUTOPAY",
+    "JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC",
+    # IFSC bank prefixes that UPI/NEFT narrations carry next to the counterparty
+    "SBIN", "HDFC", "ICIC", "UTIB", "KKBK", "YESB", "PUNB", "BARB", "CNRB", "UBIN",
+    "IDIB", "INDB", "IDFB", "FDRL", "PYTM", "AIRP",
+}
+
+
+def normalise_counterparty(narration: Optional[str]) -> Optional[str]:
+    """
+    Reduce a narration to a stable counterparty name by dropping rails,
+    reference numbers and bank codes. UPI handles are preferred when named.
+    """
+    if not narration:
+        return None
+
+    text = narration.upper()
+
+    if "@" in text:
+        handle = _UPI_HANDLE.search(text)
+        if handle:
+            name = "".join(char for char in handle.group(1) if char.isalpha())
+            if len(name) > 2:
+                return name[:100]
+            text = f"{text[:handle.start()]} {text[handle.end():]}"
+
+    words = [word for word in _WORD.findall(text) if word not in _NOISE_WORDS]
+    return " ".join(words[:3])[:100] or None
+
+
+def detect_recurring_series(
+    timestamps: np.ndarray,
+    amounts: np.ndarray,
+    counterparty_codes: np.ndarray,
+    debit_flags: np.ndarray
+) -> List[Dict[str, Any]]:
+    """
+    Detect recurring series in one account's transactions.
+
+    Args:
+        timestamps: Epoch seconds (float64)
+        amounts: Absolute amounts (float64)
+        counterparty_codes: Integer code of each row's normalised counterparty
+        debit_flags: True for debits
+
+    Returns:
+        One dict per series with "rows" (indices into the input arrays, in
+        chronological order) and the series statistics.
+    """
+    if timestamps.size < MIN_OCCURRENCES:
+        return []
+
+    # Cluster by relative gap rather than fixed bucket edges, so a steady series
+    # whose amounts straddle an edge still lands in one group
+    pairs = counterparty_codes.astype(np.int64) * 2 + debit_flags.astype(np.int64)
+    by_amount = np.lexsort((amounts, pairs))
+    pair_sorted = pairs[by_amount]
+    amount_sorted = amounts[by_amount]
+    new_group = np.r_[
+        True,
+        (pair_sorted[1:] != pair_sorted[:-1])
+        | (amount_sorted[1:] > amount_sorted[:-1] * (1.0 + AMOUNT_BAND_GAP))
+    ]
+    group_ids = np.empty(amounts.size, dtype=np.int64)
+    group_ids[by_amount] = np.cumsum(new_group) - 1
+
+    # Sort by group, then time, so every group is one contiguous run
+    order = np.lexsort((timestamps, group_ids))
+    groups = group_ids[order]
+    days = timestamps[order] / SECONDS_PER_DAY
+    sorted_amounts = amounts[order]
+
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    counts = np.diff(np.r_[starts, groups.size])
+    ends = starts + counts - 1
+
+    # Intervals between neighbours; the one crossing a group boundary is zeroed.
+    # Padded to len(days) so reduceat over starts sums exactly one group's intervals.
+    intervals = np.diff(days)
+    intervals[groups[1:] != groups[:-1]] = 0.0
+    intervals = np.r_[intervals, 0.0]
+
+    interval_counts = np.maximum(counts - 1, 1)
+    interval_mean = np.add.reduceat(intervals, starts) / interval_counts
+    interval_var = np.add.reduceat(intervals ** 2, starts) / interval_counts - interval_mean ** 2
+    interval_cv = np.sqrt(np.maximum(interval_var, 0.0)) / np.maximum(interval_mean, 1e-9)
+
+    amount_mean = np.add.reduceat(sorted_amounts, starts) / counts
+    amount_var = np.add.reduceat(sorted_amounts ** 2, starts) / counts - amount_mean ** 2
+    amount_cv = np.sqrt(np.maximum(amount_var, 0.0)) / np.maximum(amount_mean, 1e-9)
+
+    period_error = np.abs(interval_mean[:, None] / _PERIOD_DAYS[None, :] - 1.0)
+    period_index = np.argmin(period_error, axis=1)
+    best_error = period_error[np.arange(period_index.size), period_index]
+
+    # Series that stopped long before the account's latest transaction are over
+    latest_day = days.max()
+    still_active = (latest_day - days[ends]) <= MAX_MISSED_CYCLES * _PERIOD_DAYS[period_index]
+
+    confidence = (
+        0.6 * (1.0 - interval_cv / MAX_INTERVAL_CV)
+        + 0.4 * (1.0 - amount_cv / MAX_AMOUNT_CV)
+    ) * np.minimum(counts / 6.0, 1.0)
+
+    recurring = (
+        (counts >= MIN_OCCURRENCES)
+        & (best_error <= PERIOD_TOLERANCE)
+        & (interval_cv <= MAX_INTERVAL_CV)
+        & (amount_cv <= MAX_AMOUNT_CV)
+        & (confidence >= MIN_CONFIDENCE)
+        & still_active
+    )
+
+    series = []
+    for group in np.flatnonzero(recurring):
+        start, end = starts[group], ends[group]
+        frequency, _ = FREQUENCY_PERIODS[period_index[group]]
+        series.append({
+            "rows": order[start:end + 1],
+            "frequency": frequency,
+            "average_interval_days": float(interval_mean[group]),
+            "average_amount": float(amount_mean[group]),
+            "last_amount": float(sorted_amounts[end]),
+            "occurrences": int(counts[group]),
+            "first_seen_at": float(days[start] * SECONDS_PER_DAY),
+            "last_seen_at": float(days[end] * SECONDS_PER_DAY),
+            "next_expected_at": float((days[end] + interval_mean[group]) * SECONDS_PER_DAY),
+            "confidence": round(float(np.clip(confidence[group], 0.0, 1.0)), 3),
+        })
+
+    return series
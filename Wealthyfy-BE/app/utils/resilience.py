@@ -0,0 +1,181 @@
+"""
+Building blocks that keep a degraded upstream API from taking the process
+down with it: a concurrency bulkhead, a token-bucket rate limiter, a circuit
+breaker and jittered exponential backoff.
+
+All state is per process and thread-safe (API threadpool, Celery children).
+A call refused by any of them raises an UpstreamUnavailableError without
+touching the network, so the caller fails fast instead of holding a thread.
+"""
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from typing import Deque, Iterator, Optional
+from app.utils.logger_util import logger_info, logger_warning
+
+
+class UpstreamUnavailableError(RuntimeError):
+    """A call to an upstream was refused locally; retry after retry_after seconds."""
+
+    def __init__(self, message: str, retry_after: float = 1.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(UpstreamUnavailableError):
+    pass
+
+
+class BulkheadFullError(UpstreamUnavailableError):
+    pass
+
+
+class RateLimitedError(UpstreamUnavailableError):
+    pass
+
+
+class Bulkhead:
+    """Caps the calls in flight; a caller waits at most wait_seconds for a slot."""
+
+    def __init__(self, name: str, max_concurrent: int, wait_seconds: float):
+        self.name = name
+        self._wait_seconds = wait_seconds
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        if not self._slots.acquire(timeout=self._wait_seconds):
+            raise BulkheadFullError(f"Too many concurrent calls to {self.name}", retry_after=self._wait_seconds)
+        try:
+            yield
+        finally:
+            self._slots.release()
+
+
+class TokenBucket:
+    """Allows rate_per_second calls on average and bursts of up to burst calls."""
+
+    def __init__(self, name: str, rate_per_second: float, burst: int, wait_seconds: float):
+        self.name = name
+        self._rate = rate_per_second
+        self._capacity = float(burst)
+        self._wait_seconds = wait_seconds
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Takes a token, waiting up to wait_seconds for one to become available."""
+        deadline = time.monotonic() + self._wait_seconds
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+
+            if now + wait > deadline:
+                raise RateLimitedError(f"Rate limit reached for {self.name}", retry_after=wait)
+            time.sleep(wait)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class CircuitBreaker:
+    """
+    Opens when at least failure_rate of the last window_calls calls failed
+    (once minimum_calls were made), refuses calls for open_seconds, then lets
+    one trial call through: success closes it, failure reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float,
+        minimum_calls: int,
+        window_calls: int,
+        open_seconds: float
+    ):
+        self.name = name
+        self._failure_rate = failure_rate
+        self._minimum_calls = minimum_calls
+        self._open_seconds = open_seconds
+        self._outcomes: Deque[bool] = deque(maxlen=window_calls)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def before_call(self):
+        """Raises CircuitOpenError when the call must not be made."""
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return
+
+            remaining = self._opened_at + self._open_seconds - time.monotonic()
+            if self._state == CircuitState.OPEN and remaining > 0:
+                raise CircuitOpenError(f"Circuit open for {self.name}", retry_after=remaining)
+            if self._trial_in_flight:
+                raise CircuitOpenError(f"Circuit half-open for {self.name}", retry_after=1.0)
+
+            self._state = CircuitState.HALF_OPEN
+            self._trial_in_flight = True
+
+    def record(self, success: bool):
+        with self._lock:
+            now = time.monotonic()
+
+            if self._state == CircuitState.HALF_OPEN:
+                self._trial_in_flight = False
+                if success:
+                    self._state = CircuitState.CLOSED
+                    self._outcomes.clear()
+                    logger_info(f"Circuit closed for {self.name}")
+                else:
+                    self._open(now)
+                return
+
+            self._outcomes.append(success)
+            failures = self._outcomes.count(False)
+            if (
+                self._state == CircuitState.CLOSED
+                and len(self._outcomes) >= self._minimum_calls
+                and failures / len(self._outcomes) >= self._failure_rate
+            ):
+                self._open(now, failures=failures)
+
+    def release_trial(self):
+        """Ends a half-open trial that was refused before reaching the upstream."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN:
+                self._trial_in_flight = False
+
+    def _open(self, now: float, failures: Optional[int] = None):
+        self._state = CircuitState.OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        logger_warning(
+            f"Circuit opened for {self.name}",
+            failures=failures,
+            open_seconds=self._open_seconds
+        )
+
+
+def backoff_delays(attempts: int, base_seconds: float, max_seconds: float) -> Iterator[float]:
+    """Full-jitter exponential delays to sleep before each of the attempts after the first."""
+    for attempt in range(attempts - 1):
+        yield random.uniform(0, min(max_seconds, base_seconds * 2 ** attempt))
@@ -1,31 +1,61 @@
 # app/utils/response.py
 
+from decimal import Decimal
+from typing import Any
+import orjson
 from fastapi.responses import JSONResponse
 from fastapi import status
-from fastapi.encoders import jsonable_encoder
-from app.schemas.response import ApiResponse
+from fastapi.encoders import jsonable_encoder, decimal_encoder
+from pydantic import BaseModel
 
 
-def success_response(data=None, message: str = None, status_code: int = status.HTTP_200_OK):
-    # Convert SQLAlchemy models / datetimes / enums into safe JSON types
-    safe_data = jsonable_encoder(data)
+def _orjson_default(value: Any) -> Any:
+    """
+    Fallback for types orjson does not serialise natively.
+    datetime, date, UUID, Enum and dataclasses never reach this hook.
+    """
+    if isinstance(value, Decimal):
+        return decimal_encoder(value)
+
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+
+    # SQLAlchemy models and anything else: same rules as FastAPI
+    return jsonable_encoder(value)
+
 
-    return JSONResponse(
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson, with native Decimal and datetime handling.
+    Used as the application's default response class.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def success_response(data=None, message: str = None, status_code: int = status.HTTP_200_OK):
+    # SQLAlchemy models / Decimals are converted lazily by the orjson default hook
+    return ORJSONResponse(
         status_code=status_code,
-        content=ApiResponse(
-            success=True,
-            data=safe_data,
-            message=message
-        ).model_dump()
+        content={
+            "success": True,
+            "data": data,
+            "message": message,
+        }
     )
 
 
 def error_response(message: str, status_code: int = status.HTTP_400_BAD_REQUEST):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status_code,
-        content=ApiResponse(
-            success=False,
-            data=None,
-            message=message
-        ).model_dump()
+        content={
+            "success": False,
+            "data": None,
+            "message": message,
+        }
     )
@@ -0,0 +1,141 @@
+"""
+Session status push over Redis pub/sub.
+
+Publishers (the Setu webhook handler and the ingest worker) call
+publish_session_status() after committing a transition. Each API process
+holds ONE pattern subscription and fans messages out to the waiters
+registered by the SSE endpoint, so a waiting client costs an asyncio.Queue,
+not a Redis or DB connection.
+"""
+import asyncio
+import json
+from typing import Any, Dict, Optional, Set
+from redis import RedisError
+from redis.asyncio import Redis as AsyncRedis
+from app.config.redis_client import redis_client
+from app.config.setting import settings
+from app.models.consent_data_session import DataSession, DataSessionStatusEnum
+from app.utils.logger_util import logger_warning, logger_error
+
+SESSION_STATUS_CHANNEL_PREFIX = "session-status:"
+
+
+def session_status_payload(consent_id: str, data_session: Optional[DataSession]) -> Dict[str, Any]:
+    """Session status as returned by GET /users/session-status and pushed to streams."""
+    if not data_session:
+        return {
+            "session_id": None,
+            "consent_id": consent_id,
+            "status": None,
+            "exists": False,
+            "completed": False
+        }
+
+    is_completed = data_session.status == DataSessionStatusEnum.COMPLETED
+    usage_count = data_session.usage_count or 0
+    return {
+        "session_id": data_session.session_id,
+        "consent_id": consent_id,
+        "status": data_session.status.value,
+        "exists": True,
+        "completed": is_completed,
+        "usage_count": usage_count,
+        # Green flag: completed and data processing is done (usage_count is 1)
+        "is_ready": is_completed and usage_count == 1
+    }
+
+
+def publish_session_status(consent_id: str, data_session: DataSession):
+    """
+    Publishes a committed session transition to waiting streams.
+    Never raises: clients that miss a message get the state on reconnect.
+    """
+    try:
+        redis_client.publish(
+            f"{SESSION_STATUS_CHANNEL_PREFIX}{consent_id}",
+            json.dumps(session_status_payload(consent_id, data_session))
+        )
+    except RedisError as e:
+        logger_warning(f"Failed to publish session status: {e}", consent_id=consent_id)
+
+
+class SessionStatusHub:
+    """One Redis subscription per process, fanned out to in-process waiters."""
+
+    # Waiters only need the latest transitions; a full queue drops new ones
+    QUEUE_SIZE = 16
+
+    def __init__(self, redis_url: str):
+        self._redis_url = redis_url
+        self._waiters: Dict[str, Set[asyncio.Queue]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._subscribed: Optional[asyncio.Event] = None
+
+    def subscribe(self, consent_id: str) -> asyncio.Queue:
+        """Registers a waiter; starts the subscription on first use."""
+        if self._task is None or self._task.done():
+            self._subscribed = asyncio.Event()
+            self._task = asyncio.create_task(self._listen())
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self._waiters.setdefault(consent_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, consent_id: str, queue: asyncio.Queue):
+        waiters = self._waiters.get(consent_id)
+        if waiters is not None:
+            waiters.discard(queue)
+            if not waiters:
+                del self._waiters[consent_id]
+
+    async def wait_subscribed(self, timeout: float) -> bool:
+        """
+        Waits until the Redis subscription is active, so nothing published
+        after this returns can be missed. False when Redis is unavailable.
+        """
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def _listen(self):
+        backoff = 1
+        while True:
+            client = AsyncRedis.from_url(self._redis_url, decode_responses=True, health_check_interval=30)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{SESSION_STATUS_CHANNEL_PREFIX}*")
+                async for message in pubsub.listen():
+                    if message["type"] == "psubscribe":
+                        self._subscribed.set()
+                        backoff = 1
+                    elif message["type"] == "pmessage":
+                        self._dispatch(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger_error(f"Session status subscription lost: {e}")
+            finally:
+                self._subscribed.clear()
+                await pubsub.aclose()
+                await client.aclose()
+
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 30)
+
+    def _dispatch(self, channel: str, data: str):
+        consent_id = channel[len(SESSION_STATUS_CHANNEL_PREFIX):]
+        waiters = self._waiters.get(consent_id)
+        if not waiters:
+            return
+
+        payload = json.loads(data)
+        for queue in waiters:
+            # A slow reader only needs the latest status: drop its oldest one
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+
+session_status_hub = SessionStatusHub(settings.redis.REDIS_URL)
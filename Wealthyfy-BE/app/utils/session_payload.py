@@ -0,0 +1,15 @@
+"""
+Helpers for Setu FI session payloads ({"fips": [{"accounts": [...]}]}).
+"""
+from typing import Any, Dict
+
+
+def count_session_transactions(session_data: Dict[str, Any]) -> int:
+    """Number of transactions across every account of a session payload."""
+    count = 0
+    for fip_data in session_data.get("fips") or []:
+        for account_data in fip_data.get("accounts") or []:
+            account_info = (account_data.get("data") or {}).get("account") or {}
+            transactions = (account_info.get("transactions") or {}).get("transaction") or []
+            count += len(transactions)
+    return count
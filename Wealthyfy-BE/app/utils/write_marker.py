@@ -0,0 +1,38 @@
+"""
+Per-user marker of recent writes, shared by every API process.
+
+A commit made on behalf of a user (RoutingSession with WRITER_USER_ID) sets
+the user's marker for DB_REPLICA_STICKY_SECONDS. While it is set, that user's
+read-only endpoints use the primary, so a write is visible to the user's next
+request even though the replica may not have replayed it yet.
+"""
+from redis import RedisError
+from app.config.redis_client import redis_client
+from app.config.setting import settings
+from app.utils.logger_util import logger_warning
+
+WRITE_MARKER_KEY = "db:last_write:{user_id}"
+
+
+def mark_recent_write(user_id: int):
+    """Sets the user's marker. Failures are logged: reads may then lag briefly."""
+    sticky_ms = int(settings.db.DB_REPLICA_STICKY_SECONDS * 1000)
+    if sticky_ms <= 0:
+        return
+
+    try:
+        redis_client.set(WRITE_MARKER_KEY.format(user_id=user_id), 1, px=sticky_ms)
+    except RedisError as e:
+        logger_warning(f"Failed to set write marker: {e}", user_id=user_id)
+
+
+def has_recent_write(user_id: int) -> bool:
+    """
+    Whether the user wrote within DB_REPLICA_STICKY_SECONDS. Assumes a write
+    when Redis is unavailable, as the primary is always up to date.
+    """
+    try:
+        return bool(redis_client.exists(WRITE_MARKER_KEY.format(user_id=user_id)))
+    except RedisError as e:
+        logger_warning(f"Write marker lookup failed: {e}", user_id=user_id)
+        return True
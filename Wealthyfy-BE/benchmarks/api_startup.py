@@ -0,0 +1,126 @@
+"""
+API cold-start budget: how long a fresh interpreter takes to import the
+FastAPI app, and which modules it should never load.
+
+Each run imports main in a new `python -X importtime` process, next to a
+baseline process importing only the framework stack (FastAPI, SQLAlchemy,
+Pydantic). Absolute times depend on the machine, so the budget is relative:
+the median ratio of main's cumulative import time to the baseline's is
+checked against --budget-ratio, and the slowest top-level imports of the
+median run are listed. main currently measures a median of about 2.1-2.5x
+(single runs from 1.4x to 3.1x), so the default budget of 3.0x leaves
+headroom for noise while still catching a heavy new dependency. The API sends tasks
+through the producer-only client (app.config.celery_client), so the worker
+app, the task modules and Celery itself must stay out of the process.
+Exits with status 1 when the budget is exceeded or a forbidden module is
+imported.
+
+Run from Wealthyfy-BE (with the .env / environment the API uses):
+ -> python -m benchmarks.api_startup
+ -> python -m benchmarks.api_startup --runs 7 --budget-ratio 2.0
+"""
+import argparse
+import json
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+FORBIDDEN_PREFIXES = (
+    "app.config.celery_app",
+    "app.jobs.tasks.",
+    "app.jobs.scheduler.",
+    "celery",
+)
+
+PROBE = (
+    "import json, sys, main; "
+    "print(json.dumps(sorted(sys.modules)))"
+)
+
+# Third-party stack every API process needs, whatever the app code does
+BASELINE_MODULES = ("fastapi", "sqlalchemy.orm", "pydantic")
+
+
+def _import_times(stderr: str) -> List[Tuple[int, int, str]]:
+    """(cumulative us, nesting depth, module) for each -X importtime line."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(cumulative), depth, name.strip()))
+    return rows
+
+
+def _run_once() -> Tuple[int, List[Tuple[int, int, str]], List[str]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        capture_output=True, text=True, check=True
+    )
+    rows = _import_times(result.stderr)
+    main_us = next(cumulative for cumulative, _, name in rows if name == "main")
+    # The probe prints the module list last; log lines may precede it
+    modules = json.loads(result.stdout.strip().splitlines()[-1])
+    return main_us, rows, modules
+
+
+def _baseline_once() -> int:
+    """Cumulative import time (us) of BASELINE_MODULES in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(BASELINE_MODULES)}"],
+        capture_output=True, text=True, check=True
+    )
+    return sum(
+        cumulative for cumulative, depth, name in _import_times(result.stderr)
+        if depth == 0 and name in BASELINE_MODULES
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ratio", type=float, default=3.0,
+                        help="max import time of main as a multiple of the baseline's")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    # Alternate the probes so machine load affects both alike
+    runs: List[Tuple[float, int, int, List[Tuple[int, int, str]], List[str]]] = []
+    for _ in range(args.runs):
+        baseline_us = _baseline_once()
+        main_us, rows, modules = _run_once()
+        runs.append((main_us / baseline_us, main_us, baseline_us, rows, modules))
+    runs.sort(key=lambda run: run[0])
+    ratio, main_us, baseline_us, rows, modules = runs[len(runs) // 2]
+
+    print(f"import main: {main_us / 1000:.0f} ms, baseline ({', '.join(BASELINE_MODULES)}) "
+          f"{baseline_us / 1000:.0f} ms")
+    print(f"ratio: median {ratio:.2f} (min {runs[0][0]:.2f}, max {runs[-1][0]:.2f}) over {args.runs} runs, "
+          f"budget {args.budget_ratio:.2f}")
+
+    # Slowest imports made directly by main and by the app package
+    direct: Dict[str, int] = {}
+    for cumulative, depth, name in rows:
+        if depth == 1 or (depth <= 3 and name.startswith("app.")):
+            direct[name] = max(direct.get(name, 0), cumulative)
+    print(f"\nslowest imports (cumulative ms, median run):")
+    for name, cumulative in sorted(direct.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {cumulative / 1000:>8.1f}  {name}")
+
+    forbidden = [name for name in modules if name.startswith(FORBIDDEN_PREFIXES)]
+    failures = 0
+    if forbidden:
+        failures += 1
+        print(f"\nFAIL  worker-only modules imported by the API: {', '.join(forbidden)}")
+    if ratio > args.budget_ratio:
+        failures += 1
+        print(f"\nFAIL  cold start is {ratio:.2f}x the baseline, over the {args.budget_ratio:.2f}x budget")
+    if not failures:
+        print("\nok    within budget, no worker-only modules")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
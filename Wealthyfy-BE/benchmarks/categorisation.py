@@ -0,0 +1,110 @@
+"""
+Categorisation throughput benchmark: keyword index vs one regex per category.
+
+Narrations are generated from the shapes banks actually send through the
+account aggregator (UPI, NEFT/IMPS, POS, ATM, NACH, interest postings).
+
+Run from Wealthyfy-BE:
+ -> python -m benchmarks.categorisation
+ -> python -m benchmarks.categorisation --count 1000000
+"""
+import argparse
+import random
+import re
+import time
+
+from app.constants.transaction_categories import CATEGORY_RULES, OTHERS, TRANSFER
+from app.utils.categoriser import categoriser
+
+MERCHANTS = [
+    "SWIGGY", "ZOMATO", "AMAZON PAY", "FLIPKART", "BIGBASKET", "BLINKIT", "UBER INDIA",
+    "IRCTC", "NETFLIX", "APOLLO PHARMACY", "BESCOM", "AIRTEL", "INDIAN OIL", "ZERODHA BROKING",
+]
+PEOPLE = ["RAHUL KUMAR", "PRIYA SHARMA", "ANKIT VERMA", "NEHA GUPTA", "MOHAMMED ASIF", "S RAMESH"]
+BANKS = ["YESB", "HDFC", "ICIC", "SBIN", "UTIB", "KKBK"]
+HANDLES = ["ybl", "okaxis", "okhdfcbank", "paytm", "ibl", "upi"]
+
+
+def _narration(rng: random.Random) -> str:
+    ref = rng.randint(10**11, 10**12 - 1)
+    kind = rng.random()
+    if kind < 0.45:
+        name = rng.choice(MERCHANTS + PEOPLE)
+        handle = f"{name.split()[0].lower()}@{rng.choice(HANDLES)}"
+        return f"UPI/DR/{ref}/{name}/{rng.choice(BANKS)}/{handle}/Payment"
+    if kind < 0.60:
+        return f"NEFT-{rng.choice(BANKS)}N{ref}-{rng.choice(PEOPLE)}-{rng.choice(['RENT', 'TRF', 'SELF', 'NA'])}"
+    if kind < 0.70:
+        return f"POS {rng.randint(1000, 9999)}XXXXXX{rng.randint(1000, 9999)} {rng.choice(MERCHANTS)} {ref}"
+    if kind < 0.78:
+        return f"ATW-{rng.randint(400000, 499999)}XXXXXX{rng.randint(1000, 9999)}-S1AW{ref % 10**6}-MUMBAI"
+    if kind < 0.85:
+        return f"NACH-DR-{rng.choice(['BAJAJ FINANCE EMI', 'HDFC MF SIP', 'LIC OF INDIA PREMIUM'])}-{ref}"
+    if kind < 0.90:
+        return f"NEFT-{rng.choice(BANKS)}N{ref}-ACME TECHNOLOGIES PVT LTD-SALARY {rng.choice(['JAN', 'FEB', 'MAR'])}"
+    if kind < 0.95:
+        return f"{rng.randint(10**9, 10**10 - 1)}:Int.Pd:{rng.randint(1, 28):02d}-03-2025 to {rng.randint(1, 28):02d}-06-2025"
+    return f"IMPS/P2A/{ref}/{rng.choice(PEOPLE)}/{rng.choice(BANKS)}"
+
+
+def _keyword_regex(keyword: str) -> str:
+    words = re.findall(r"[A-Z0-9]+", keyword)
+    pattern = r"[^A-Z0-9]+".join(words)
+    suffix = "" if keyword.endswith("*") else r"(?![A-Z0-9])"
+    return rf"(?<![A-Z0-9]){pattern}{suffix}"
+
+
+class _PerRuleCategoriser:
+    """Baseline: one compiled regex per category, tried in priority order."""
+
+    def __init__(self, rules):
+        self._rules = [
+            (category_id, re.compile("|".join(_keyword_regex(keyword) for keyword in keywords)))
+            for category_id, keywords in rules
+        ]
+
+    def categorise(self, narration):
+        if not narration:
+            return OTHERS
+        text = narration.upper()
+        for category_id, pattern in self._rules:
+            if pattern.search(text):
+                return category_id
+        return TRANSFER if "@" in narration else OTHERS
+
+
+def _throughput(categorise, narrations) -> float:
+    start = time.perf_counter()
+    for narration in narrations:
+        categorise(narration)
+    elapsed = time.perf_counter() - start
+    return len(narrations) / elapsed * 60
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    narrations = [_narration(rng) for _ in range(args.count)]
+
+    baseline = _PerRuleCategoriser(CATEGORY_RULES)
+    mismatches = sum(
+        1 for narration in narrations[:10_000]
+        if baseline.categorise(narration) != categoriser.categorise(narration)
+    )
+
+    index_rate = _throughput(categoriser.categorise, narrations)
+    baseline_rate = _throughput(baseline.categorise, narrations)
+
+    print(f"narrations           {args.count:>12,}")
+    print(f"keyword index        {index_rate:>12,.0f} / min")
+    print(f"regex per category   {baseline_rate:>12,.0f} / min")
+    print(f"speedup              {index_rate / baseline_rate:>11.2f}x")
+    print(f"disagreements (10k)  {mismatches:>12}")
+
+
+if __name__ == "__main__":
+    main()
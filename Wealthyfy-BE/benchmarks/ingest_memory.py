@@ -0,0 +1,134 @@
+"""
+Session ingest sizing: file size, transaction count, routing decision and
+worker memory for synthetic session payloads of graded sizes.
+
+Each payload is written the way UserService.update_session_status stores it
+(json.dump, indent=2). A fresh interpreter then parses it and builds the bulk
+insert rows the ingest task builds, and reports its peak resident memory, so
+the large-ingest thresholds and worker memory limits can be checked against
+real numbers.
+
+Run from Wealthyfy-BE:
+ -> python -m benchmarks.ingest_memory
+ -> python -m benchmarks.ingest_memory --counts 1000 100000 400000 --accounts 4
+"""
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from app.config.celery_client import session_ingest_route
+from app.constants.constant import QUEUE_REFRESH
+from app.utils.session_payload import count_session_transactions
+
+MODES = ["UPI", "CARD", "ATM", "NEFT", "IMPS", "OTHERS"]
+NARRATIONS = [
+    "UPI/DR/{ref}/SWIGGY/YESB/swiggy@ybl/Payment",
+    "POS {ref} AMAZON PAY INDIA PRIVA",
+    "NEFT CR-{ref}-ACME CORP PVT LTD-SALARY",
+    "ATM WDL {ref} MG ROAD BANGALORE",
+    "IMPS/P2A/{ref}/RENT/HDFC",
+]
+
+# Runs in a fresh interpreter so the peak is the ingest's, not this script's
+PARSE_SCRIPT = """
+import json, resource, sys
+from datetime import datetime
+with open(sys.argv[1]) as f:
+    session = json.load(f)
+rows = []
+for fip in session["fips"]:
+    for account in fip["accounts"]:
+        for txn in account["data"]["account"]["transactions"]["transaction"]:
+            rows.append({
+                "amount": txn["amount"],
+                "mode": txn["mode"],
+                "narration": txn["narration"],
+                "transaction_timestamp": datetime.fromisoformat(txn["transactionTimestamp"]),
+                "transaction_id": txn["txnId"],
+                "transaction_type": txn["type"],
+            })
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def _payload(transaction_count: int, accounts: int, rng: random.Random) -> dict:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    per_account = [transaction_count // accounts] * accounts
+    per_account[0] += transaction_count % accounts
+
+    account_entries = []
+    for index, count in enumerate(per_account):
+        transactions = []
+        balance = 100_000.0
+        for n in range(count):
+            amount = round(rng.uniform(10, 50_000), 2)
+            is_debit = rng.random() < 0.7
+            balance += -amount if is_debit else amount
+            ref = f"{rng.getrandbits(40):012d}"
+            transactions.append({
+                "txnId": f"T{index:02d}{n:09d}",
+                "type": "DEBIT" if is_debit else "CREDIT",
+                "mode": rng.choice(MODES),
+                "amount": f"{amount:.2f}",
+                "currentBalance": f"{balance:.2f}",
+                "transactionTimestamp": (start + timedelta(minutes=n * 7)).isoformat(),
+                "valueDate": (start + timedelta(minutes=n * 7)).date().isoformat(),
+                "narration": rng.choice(NARRATIONS).format(ref=ref),
+                "reference": ref,
+            })
+        account_entries.append({
+            "maskedAccNumber": f"XXXXXXXX{index:04d}",
+            "data": {"account": {
+                "type": "deposit",
+                "transactions": {"transaction": transactions},
+            }},
+        })
+    return {"fips": [{"fipID": "SYNTHETIC-FIP", "accounts": account_entries}]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=[1_000, 10_000, 50_000, 200_000, 400_000])
+    parser.add_argument("--accounts", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'transactions':>12} {'file MB':>9} {'counted':>9} {'queue':>14} {'parse s':>8} {'peak RSS MB':>12}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.counts:
+            session = _payload(count, args.accounts, rng)
+            path = Path(tmp) / f"session_{count}.json"
+            with open(path, "w") as f:
+                json.dump(session, f, indent=2)
+
+            counted = count_session_transactions(session)
+            assert counted == count, (counted, count)
+            file_size = path.stat().st_size
+            del session
+
+            route = session_ingest_route(file_size, counted, is_onboarding=False)
+
+            started = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, "-c", PARSE_SCRIPT, str(path)],
+                capture_output=True, text=True, check=True
+            )
+            elapsed = time.perf_counter() - started
+            peak_rss_mb = int(result.stdout.strip()) / 1024  # ru_maxrss is in KB on Linux
+
+            print(
+                f"{count:>12,} {file_size / 1024 / 1024:>9.1f} {counted:>9,} "
+                f"{route.get('queue', QUEUE_REFRESH):>14} {elapsed:>8.2f} {peak_rss_mb:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Local stand-in servers for the external APIs of the onboarding flow, with
+configurable latency and error injection.
+
+One process serves every fake, each under its own path prefix:
+
+    /setu-pan   Setu PAN verification        (SETU_PANCARD_BASE_URL)
+    /setu-aa    Setu AA token, consents, sessions, FIPs (SETU_AA_BASE_URL, SETU_AA_AUTH_URL)
+    /realms     Keycloak token and introspection (KEYCLOAK_URL)
+    /apps       Pusher REST API              (PUSHER_HOST / PUSHER_PORT)
+    /twilio     Twilio Verify                (TWILIO_API_BASE_URL)
+    /_loadtest  Control endpoints the journeys use (session id of a consent)
+
+Access tokens are "lt-<keycloak user id>": introspection accepts any token of
+that form, so each virtual user authenticates as itself. Session data holds
+--accounts accounts of --transactions synthetic transactions each, all at
+FIP_ID; the ingest skips unknown FIPs, so run the sync_fip_master_data task
+once against the fakes before the first load test.
+
+Run from Wealthyfy-BE, then start the API and worker with the printed env:
+ -> python -m benchmarks.loadtest.fakes --print-env
+ -> python -m benchmarks.loadtest.fakes --port 9100 --latency setu-aa=300 --error-rate twilio=0.02
+"""
+import argparse
+import asyncio
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+SERVICES = ("setu-pan", "setu-aa", "keycloak", "pusher", "twilio")
+FIP_ID = "LOADTEST-FIP"
+TOKEN_PREFIX = "lt-"
+
+
+def _service(path: str) -> str:
+    prefix = path.split("/", 2)[1] if path.count("/") >= 1 else ""
+    return {"realms": "keycloak", "apps": "pusher"}.get(prefix, prefix)
+
+
+def _transactions(count: int, rng: random.Random) -> list:
+    start = datetime.now(timezone.utc) - timedelta(days=365)
+    balance = 250_000.0
+    transactions = []
+    for n in range(count):
+        amount = round(rng.uniform(10, 25_000), 2)
+        is_debit = rng.random() < 0.7
+        balance += -amount if is_debit else amount
+        ref = f"{rng.getrandbits(40):012d}"
+        transactions.append({
+            "txnId": f"LT{ref}",
+            "type": "DEBIT" if is_debit else "CREDIT",
+            "mode": rng.choice(["UPI", "CARD", "ATM", "NEFT", "IMPS", "OTHERS"]),
+            "amount": f"{amount:.2f}",
+            "currentBalance": f"{balance:.2f}",
+            "transactionTimestamp": (start + timedelta(hours=n * 365 * 24 / max(count, 1))).isoformat(),
+            "narration": rng.choice([
+                f"UPI/DR/{ref}/SWIGGY/YESB/swiggy@ybl/Payment",
+                f"POS {ref} AMAZON PAY INDIA PRIVA",
+                f"NEFT CR-{ref}-ACME CORP PVT LTD-SALARY",
+                f"ATM WDL {ref} MG ROAD BANGALORE",
+            ]),
+            "reference": ref,
+        })
+    return transactions
+
+
+def create_app(
+    latency_ms: Dict[str, float],
+    error_rate: Dict[str, float],
+    accounts: int = 2,
+    transactions: int = 500,
+    seed: int = 7
+) -> FastAPI:
+    """Fake server app; latency is the mean of an exponential delay per request."""
+    app = FastAPI(title="Wealthyfy load-test fakes")
+    rng = random.Random(seed)
+    consents: Dict[str, Dict[str, Any]] = {}
+    sessions_by_consent: Dict[str, str] = {}
+
+    @app.middleware("http")
+    async def inject_latency_and_errors(request: Request, call_next):
+        service = _service(request.url.path)
+        if latency_ms.get(service):
+            await asyncio.sleep(rng.expovariate(1000 / latency_ms[service]))
+        if rng.random() < error_rate.get(service, 0.0):
+            return JSONResponse({"error": "injected failure", "service": service}, status_code=503)
+        return await call_next(request)
+
+    # ---- Setu PAN ----
+    @app.post("/setu-pan/api/verify/pan")
+    async def verify_pan(payload: dict):
+        return {"verification": "success", "message": "PAN verified", "data": {"full_name": "LOAD TEST"}}
+
+    # ---- Setu AA ----
+    @app.post("/setu-aa/auth/token")
+    async def aa_token():
+        return {"success": True, "data": {"token": f"aa-{uuid.uuid4().hex}", "expiresIn": 1800}}
+
+    @app.post("/setu-aa/consents")
+    async def create_consent(payload: dict, request: Request):
+        consent_id = str(uuid.uuid4())
+        consent = {
+            "id": consent_id,
+            "url": f"{request.base_url}setu-aa/consent-ui/{consent_id}",
+            "status": "PENDING",
+            "detail": {
+                "consentStart": datetime.now(timezone.utc).isoformat(),
+                "consentExpiry": (datetime.now(timezone.utc) + timedelta(days=365)).isoformat(),
+                "vua": payload.get("vua"),
+                "fiTypes": payload.get("fiTypes", []),
+                "dataLife": {"unit": "MONTH", "value": 1},
+                "dataRange": payload.get("dataRange"),
+                "frequency": payload.get("frequency"),
+                "fetchType": payload.get("fetchType"),
+                "purpose": payload.get("purpose"),
+                "consentMode": "STORE",
+            },
+        }
+        consents[consent_id] = consent
+        return consent
+
+    @app.post("/setu-aa/sessions", status_code=201)
+    async def create_session(payload: dict):
+        session_id = str(uuid.uuid4())
+        sessions_by_consent[payload.get("consentId")] = session_id
+        return {
+            "id": session_id,
+            "consentId": payload.get("consentId"),
+            "status": "PENDING",
+            "format": "json",
+            "dataRange": payload.get("dataRange"),
+        }
+
+    @app.get("/setu-aa/sessions/{session_id}")
+    async def fetch_session(session_id: str):
+        return {
+            "id": session_id,
+            "status": "COMPLETED",
+            "fips": [{
+                "fipID": FIP_ID,
+                "accounts": [
+                    {
+                        "linkRefNumber": f"{session_id[:8]}-{index}",
+                        "maskedAccNumber": f"XXXXXXXX{index:04d}",
+                        "FIstatus": "READY",
+                        "data": {"account": {
+                            "type": "deposit",
+                            "profile": {"holders": {"type": "SINGLE", "holder": [{
+                                "name": "LOAD TEST", "dob": "1990-01-01", "mobile": "9999999999",
+                                "nominee": "NOT-REGISTERED", "ckycCompliance": "true",
+                            }]}},
+                            "summary": {
+                                "currentBalance": "250000.00", "currency": "INR", "type": "SAVINGS",
+                                "branch": "LOAD TEST", "ifscCode": "LOAD0000001", "status": "ACTIVE",
+                                "openingDate": "2020-01-01", "balanceDateTime": datetime.now(timezone.utc).isoformat(),
+                            },
+                            "transactions": {"transaction": _transactions(transactions, rng)},
+                        }},
+                    }
+                    for index in range(accounts)
+                ],
+            }],
+        }
+
+    @app.get("/setu-aa/fips")
+    async def fips():
+        return {"data": [{"fipId": FIP_ID, "name": "Load Test Bank", "institutionType": "BANK", "fiTypes": ["DEPOSIT"]}]}
+
+    # ---- Keycloak ----
+    @app.post("/realms/{realm}/protocol/openid-connect/token")
+    async def keycloak_token(realm: str):
+        return {"access_token": f"{TOKEN_PREFIX}service-account", "expires_in": 300, "token_type": "Bearer"}
+
+    @app.post("/realms/{realm}/protocol/openid-connect/token/introspect")
+    async def keycloak_introspect(realm: str, request: Request):
+        token = (await request.form()).get("token", "")
+        if not token.startswith(TOKEN_PREFIX):
+            return {"active": False}
+        return {"active": True, "sub": token[len(TOKEN_PREFIX):], "realm": realm, "token_type": "Bearer"}
+
+    # ---- Pusher ----
+    @app.post("/apps/{app_id}/events")
+    @app.post("/apps/{app_id}/batch_events")
+    async def pusher_events(app_id: str):
+        return {}
+
+    # ---- Twilio Verify ----
+    @app.post("/twilio/v2/Services/{service_sid}/Verifications")
+    async def twilio_send(service_sid: str, request: Request):
+        form = await request.form()
+        return {"sid": f"VE{uuid.uuid4().hex}", "service_sid": service_sid, "to": form.get("To"),
+                "channel": form.get("Channel"), "status": "pending", "valid": False}
+
+    @app.post("/twilio/v2/Services/{service_sid}/VerificationCheck")
+    async def twilio_check(service_sid: str, request: Request):
+        form = await request.form()
+        return {"sid": f"VE{uuid.uuid4().hex}", "service_sid": service_sid, "to": form.get("To"),
+                "status": "approved", "valid": True}
+
+    # ---- Control ----
+    @app.get("/_loadtest/consents/{consent_id}/session")
+    async def consent_session(consent_id: str):
+        session_id = sessions_by_consent.get(consent_id)
+        if not session_id:
+            return JSONResponse({"session_id": None}, status_code=404)
+        return {"session_id": session_id}
+
+    return app
+
+
+def _per_service(values) -> Dict[str, float]:
+    parsed = {}
+    for value in values or []:
+        service, _, number = value.partition("=")
+        if service not in SERVICES:
+            raise SystemExit(f"Unknown service '{service}', expected one of {', '.join(SERVICES)}")
+        parsed[service] = float(number)
+    return parsed
+
+
+def env_overrides(base_url: str) -> Dict[str, str]:
+    """Settings that point the API and worker at the fakes."""
+    return {
+        "setu__SETU_PANCARD_BASE_URL": f"{base_url}/setu-pan",
+        "setu__SETU_AA_BASE_URL": f"{base_url}/setu-aa",
+        "setu__SETU_AA_AUTH_URL": f"{base_url}/setu-aa/auth/token",
+        "keycloak__KEYCLOAK_URL": f"{base_url}/",
+        "twillo__TWILIO_API_BASE_URL": f"{base_url}/twilio",
+        "pusher__PUSHER_HOST": base_url.split("://", 1)[1].split(":")[0],
+        "pusher__PUSHER_PORT": base_url.rsplit(":", 1)[1],
+        "pusher__PUSHER_SSL": "False",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", nargs="*", metavar="SERVICE=MS", help="Mean added latency per service")
+    parser.add_argument("--error-rate", nargs="*", metavar="SERVICE=RATE", help="Share of requests answered 503")
+    parser.add_argument("--accounts", type=int, default=2, help="Accounts per data session")
+    parser.add_argument("--transactions", type=int, default=500, help="Transactions per account")
+    parser.add_argument("--print-env", action="store_true", help="Print the API/worker env for these fakes and exit")
+    args = parser.parse_args()
+
+    if args.print_env:
+        for key, value in env_overrides(f"http://{args.host}:{args.port}").items():
+            print(f"{key}={value}")
+        return
+
+    import uvicorn
+    uvicorn.run(
+        create_app(_per_service(args.latency), _per_service(args.error_rate), args.accounts, args.transactions),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
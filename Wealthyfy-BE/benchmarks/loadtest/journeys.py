@@ -0,0 +1,271 @@
+"""
+End-to-end load test of the onboarding flow, driven against a running API
+and worker that point at the local fakes (benchmarks.loadtest.fakes).
+
+Each virtual user walks the whole flow as the frontend and the webhooks do:
+
+    register        Keycloak REGISTER event (form registration)
+    verify_pan      POST /users/verify_pancard
+    send_otp        POST /users/send-otp
+    verify_otp      POST /users/verify-otp
+    save_profile    POST /users/create_pan_and_phone_no
+    link_bank       POST /users/link-bank (creates the consent)
+    consent_active  Setu CONSENT_STATUS_UPDATE webhook (creates the data session)
+    session_ready   Setu SESSION_STATUS_UPDATE webhook (stores the session data)
+    ingest          webhook -> /users/session-status reporting is_ready
+    deposit         GET /accounts/deposit
+    portfolio       GET /accounts/portfolio
+    metrics         GET /accounts/{id}/metrics, per account
+    monthly_stats   GET /accounts/{id}/monthly-statistics, per account
+
+A failed step ends that user's journey. The report lists, per step, the
+requests made, errors, throughput over the run and latency percentiles;
+"ingest" is the time from the session webhook until the data is ready, so
+it covers the queue wait and the worker.
+
+Run from Wealthyfy-BE, with the fakes, the API and an interactive worker up:
+ -> python -m benchmarks.loadtest.journeys --users 50 --concurrency 10
+ -> python -m benchmarks.loadtest.journeys --users 200 --concurrency 40 --json storage/loadtest.json
+"""
+import argparse
+import asyncio
+import json
+import random
+import string
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.loadtest.fakes import TOKEN_PREFIX
+
+STEPS = (
+    "register", "verify_pan", "send_otp", "verify_otp", "save_profile", "link_bank",
+    "consent_active", "session_ready", "ingest", "deposit", "portfolio", "metrics", "monthly_stats",
+)
+
+
+class StepFailed(Exception):
+    pass
+
+
+class Recorder:
+    """Latencies and errors per step."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.samples: Dict[str, str] = {}
+
+    def record(self, step: str, seconds: float, error: Optional[str] = None):
+        self.latencies[step].append(seconds)
+        if error:
+            self.errors[step] += 1
+            self.samples.setdefault(step, error)
+
+    def report(self, wall_seconds: float) -> Dict[str, Any]:
+        rows = {}
+        for step in STEPS:
+            latencies = sorted(self.latencies.get(step, []))
+            if not latencies:
+                continue
+            rows[step] = {
+                "count": len(latencies),
+                "errors": self.errors.get(step, 0),
+                "per_second": len(latencies) / wall_seconds,
+                "p50_ms": _percentile(latencies, 50) * 1000,
+                "p90_ms": _percentile(latencies, 90) * 1000,
+                "p99_ms": _percentile(latencies, 99) * 1000,
+                "max_ms": latencies[-1] * 1000,
+            }
+        return rows
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(percent / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+async def _call(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    step: str,
+    method: str,
+    url: str,
+    **kwargs
+) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        recorder.record(step, time.perf_counter() - started, f"{type(e).__name__}: {e}")
+        raise StepFailed(step) from e
+
+    elapsed = time.perf_counter() - started
+    if response.status_code >= 400:
+        recorder.record(step, elapsed, f"{response.status_code} {response.text[:200]}")
+        raise StepFailed(step)
+    recorder.record(step, elapsed)
+    return response.json() if response.content else {}
+
+
+def _identity(rng: random.Random) -> Dict[str, str]:
+    letters = string.ascii_uppercase
+    return {
+        "keycloak_user_id": str(uuid.uuid4()),
+        "pancard": "".join(rng.choices(letters, k=5)) + f"{rng.randrange(10000):04d}" + rng.choice(letters),
+        "phone_number": f"9{rng.randrange(10 ** 9):09d}",
+    }
+
+
+async def _journey(
+    client: httpx.AsyncClient,
+    fakes: httpx.AsyncClient,
+    recorder: Recorder,
+    identity: Dict[str, str],
+    ingest_timeout: float,
+    poll_interval: float
+):
+    kc_id = identity["keycloak_user_id"]
+    auth = {"Authorization": f"Bearer {TOKEN_PREFIX}{kc_id}"}
+
+    await _call(client, recorder, "register", "POST", "/events/keyclock_events", json={
+        "type": "REGISTER",
+        "userId": kc_id,
+        "details": {
+            "register_method": "form",
+            "first_name": "Load",
+            "last_name": "Test",
+            "email": f"{kc_id}@loadtest.example.com",
+            "email_verified": True,
+        },
+    })
+
+    await _call(client, recorder, "verify_pan", "POST", "/users/verify_pancard", headers=auth,
+                json={"pancard": identity["pancard"], "consent": "Y"})
+    await _call(client, recorder, "send_otp", "POST", "/users/send-otp", headers=auth,
+                json={"phone_number": identity["phone_number"]})
+    await _call(client, recorder, "verify_otp", "POST", "/users/verify-otp", headers=auth,
+                json={"phone_number": identity["phone_number"], "otp": "123456"})
+    await _call(client, recorder, "save_profile", "POST", "/users/create_pan_and_phone_no", headers=auth,
+                json={"pancard": identity["pancard"], "phone_number": identity["phone_number"], "consent": "Y"})
+
+    today = datetime.now(timezone.utc).date()
+    link = await _call(client, recorder, "link_bank", "POST", "/users/link-bank", headers=auth, json={
+        "start_date": (today - timedelta(days=365)).isoformat(),
+        "end_date": today.isoformat(),
+        "fi_type": ["DEPOSIT"],
+        "consent_duration": {"unit": "MONTH", "value": "1"},
+        "fetch_type": "ONETIME",
+    })
+    consent_id = link["data"]["url"].rstrip("/").rsplit("/", 1)[-1]
+
+    await _call(client, recorder, "consent_active", "POST", "/events/setu_events", json={
+        "type": "CONSENT_STATUS_UPDATE",
+        "consentId": consent_id,
+        "data": {"status": "ACTIVE"},
+    })
+    session = (await fakes.get(f"/_loadtest/consents/{consent_id}/session")).json()
+    if not session.get("session_id"):
+        recorder.record("consent_active", 0, "no data session created for the consent")
+        raise StepFailed("consent_active")
+
+    await _call(client, recorder, "session_ready", "POST", "/events/setu_events", json={
+        "type": "SESSION_STATUS_UPDATE",
+        "consentId": consent_id,
+        "dataSessionId": session["session_id"],
+        "data": {"status": "COMPLETED"},
+    })
+
+    # Ingest: poll the way the frontend does until the worker has stored the data
+    started = time.perf_counter()
+    while True:
+        response = await client.get("/users/session-status", params={"consent_id": consent_id}, headers=auth)
+        if response.status_code < 400 and (response.json().get("data") or {}).get("is_ready"):
+            recorder.record("ingest", time.perf_counter() - started)
+            break
+        if time.perf_counter() - started > ingest_timeout:
+            recorder.record("ingest", time.perf_counter() - started, f"not ready after {ingest_timeout:.0f}s")
+            raise StepFailed("ingest")
+        await asyncio.sleep(poll_interval)
+
+    deposits = await _call(client, recorder, "deposit", "GET", "/accounts/deposit",
+                           params={"type": "deposit"}, headers=auth)
+    await _call(client, recorder, "portfolio", "GET", "/accounts/portfolio", headers=auth)
+    for account in deposits.get("data") or []:
+        await _call(client, recorder, "metrics", "GET", f"/accounts/{account['id']}/metrics", headers=auth)
+        await _call(client, recorder, "monthly_stats", "GET",
+                    f"/accounts/{account['id']}/monthly-statistics", params={"year": today.year}, headers=auth)
+
+
+async def run(args) -> Dict[str, Any]:
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    semaphore = asyncio.Semaphore(args.concurrency)
+    completed = 0
+    limits = httpx.Limits(max_connections=args.concurrency * 2)
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client, \
+            httpx.AsyncClient(base_url=args.fakes_url, timeout=args.timeout) as fakes:
+
+        async def _user(identity):
+            nonlocal completed
+            async with semaphore:
+                try:
+                    await _journey(client, fakes, recorder, identity, args.ingest_timeout, args.poll_interval)
+                    completed += 1
+                except StepFailed:
+                    pass
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_user(_identity(rng)) for _ in range(args.users)))
+        wall_seconds = time.perf_counter() - started
+
+    return {
+        "users": args.users,
+        "concurrency": args.concurrency,
+        "completed": completed,
+        "wall_seconds": wall_seconds,
+        "steps": recorder.report(wall_seconds),
+        "first_errors": recorder.samples,
+    }
+
+
+def _print_report(result: Dict[str, Any]):
+    print(f"{result['completed']}/{result['users']} journeys completed in {result['wall_seconds']:.1f}s "
+          f"(concurrency {result['concurrency']})\n")
+    print(f"{'step':<15} {'count':>6} {'errors':>6} {'req/s':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for step, row in result["steps"].items():
+        print(f"{step:<15} {row['count']:>6} {row['errors']:>6} {row['per_second']:>7.2f} "
+              f"{row['p50_ms']:>8.0f} {row['p90_ms']:>8.0f} {row['p99_ms']:>8.0f} {row['max_ms']:>8.0f}")
+    if result["first_errors"]:
+        print("\nfirst error per step:")
+        for step, error in result["first_errors"].items():
+            print(f"  {step}: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Wealthyfy API")
+    parser.add_argument("--fakes-url", default="http://127.0.0.1:9100", help="benchmarks.loadtest.fakes server")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30, help="Per-request timeout, seconds")
+    parser.add_argument("--ingest-timeout", type=float, default=120)
+    parser.add_argument("--poll-interval", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    _print_report(result)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
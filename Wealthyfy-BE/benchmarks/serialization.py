@@ -0,0 +1,111 @@
+"""
+Serialisation benchmark: stdlib JSONResponse vs ORJSONResponse.
+
+Payloads mirror what the API actually returns:
+    - a full transaction page (100 TransactionResponse items)
+    - payment type statistics
+    - monthly credit/debit statistics
+
+Payloads hold Pydantic models, Decimals and datetimes as endpoints pass them,
+so each encoder's timing includes converting them.
+
+Run from Wealthyfy-BE:
+ -> python -m benchmarks.serialization
+ -> python -m benchmarks.serialization --rounds 5000
+"""
+import argparse
+import gzip
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import brotli
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.schemas.transaction import TransactionResponse
+from app.utils.response import ORJSONResponse
+
+MODES = ["UPI", "NEFT", "IMPS", "RTGS", "ATM", "CARD", "OTHERS"]
+
+
+def _transaction_page(size: int = 100) -> dict:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    items = [
+        TransactionResponse(
+            id=i,
+            account_id=42,
+            amount=Decimal(random.randint(100, 5_000_000)) / 100,
+            mode=random.choice(MODES),
+            transaction_timestamp=start + timedelta(minutes=37 * i),
+            transaction_id=f"TXN{i:012d}",
+            transaction_type=random.choice(["CREDIT", "DEBIT"]),
+        )
+        for i in range(size)
+    ]
+    return {"items": items, "total": 48_213, "page": 1, "size": size}
+
+
+def _payment_statistics() -> dict:
+    return {
+        "success": True,
+        "data": {
+            "payment_types": [
+                {"mode": mode, "amount": Decimal("123456.78"), "count": 321, "percentage": 14.29}
+                for mode in MODES
+            ],
+            "total_amount": Decimal("864197.46"),
+        },
+        "message": "Payment statistics fetch successfully.",
+    }
+
+
+def _monthly_statistics() -> dict:
+    months = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    return {
+        "success": True,
+        "data": {
+            "available_years": [2025, 2024, 2023, 2022],
+            "monthly_data": [
+                {"month": m, "credit": Decimal("84512.10"), "debit": Decimal("61220.95")}
+                for m in months
+            ],
+        },
+        "message": "Monthly statistics fetch successfully.",
+    }
+
+
+def _stdlib(payload):
+    return JSONResponse(content=jsonable_encoder(payload)).body
+
+
+def _orjson(payload):
+    return ORJSONResponse(content=payload).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+
+    payloads = {
+        "transaction page (100)": _transaction_page(),
+        "payment statistics": _payment_statistics(),
+        "monthly statistics": _monthly_statistics(),
+    }
+
+    print(f"{'payload':<24} {'stdlib us':>10} {'orjson us':>10} {'speedup':>8} {'raw B':>8} {'gzip B':>8} {'br B':>8}")
+    for name, payload in payloads.items():
+        stdlib_s = timeit.timeit(lambda: _stdlib(payload), number=args.rounds) / args.rounds
+        orjson_s = timeit.timeit(lambda: _orjson(payload), number=args.rounds) / args.rounds
+
+        body = _orjson(payload)
+        print(
+            f"{name:<24} {stdlib_s * 1e6:>10.1f} {orjson_s * 1e6:>10.1f} {stdlib_s / orjson_s:>7.1f}x "
+            f"{len(body):>8} {len(gzip.compress(body)):>8} {len(brotli.compress(body, quality=4)):>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
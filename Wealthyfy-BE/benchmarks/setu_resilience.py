@@ -0,0 +1,139 @@
+"""
+Outbound Setu protection against a fault-injecting stub: circuit breaker,
+bulkheads and retries of SetuService._request, phase by phase.
+
+The Setu fakes of benchmarks.loadtest.fakes run in-process; each phase sets
+their latency and error rate and calls fetch_fip_ids from a pool of threads:
+
+    healthy    no faults: every call succeeds
+    flaky      10% errors: retries of the idempotent calls hide them
+    outage     every call fails: the breaker opens and later calls fail fast
+    recovery   faults cleared, after the open period: a trial call closes it
+    slow       2s responses: callers beyond the endpoint's bulkhead are
+               refused after the bulkhead wait instead of holding a thread
+
+Breaker and bulkhead settings are shortened so the run takes seconds.
+Exits with status 1 when a phase does not behave as described.
+
+Run from Wealthyfy-BE (with the .env / environment the API uses):
+ -> python -m benchmarks.setu_resilience
+"""
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+PORT = 9189
+BASE_URL = f"http://127.0.0.1:{PORT}"
+
+# Before any app import: settings are read once
+os.environ.update({
+    "setu__SETU_PANCARD_BASE_URL": f"{BASE_URL}/setu-pan",
+    "setu__SETU_AA_BASE_URL": f"{BASE_URL}/setu-aa",
+    "setu__SETU_AA_AUTH_URL": f"{BASE_URL}/setu-aa/auth/token",
+    "setu__SETU_READ_TIMEOUT_SECONDS": "5",
+    "setu__SETU_MAX_CONCURRENT_CALLS_PER_ENDPOINT": "4",
+    "setu__SETU_BULKHEAD_WAIT_SECONDS": "0.2",
+    "setu__SETU_AA_RATE_LIMIT_PER_SECOND": "1000",
+    "setu__SETU_BREAKER_OPEN_SECONDS": "2",
+    "setu__SETU_RETRY_BASE_DELAY_SECONDS": "0.05",
+})
+
+import uvicorn  # noqa: E402
+
+from benchmarks.loadtest.fakes import create_app  # noqa: E402
+from app.services import setu_service  # noqa: E402
+from app.services.setu_service import SetuService, SETU_AA  # noqa: E402
+from app.utils.resilience import UpstreamUnavailableError, CircuitState  # noqa: E402
+
+
+def _call() -> Dict:
+    started = time.perf_counter()
+    try:
+        SetuService().fetch_fip_ids()
+        outcome = "ok"
+    except UpstreamUnavailableError as e:
+        outcome = type(e).__name__
+    except RuntimeError:
+        outcome = "failed"
+    return {"outcome": outcome, "seconds": time.perf_counter() - started}
+
+
+def _phase(name: str, calls: int, threads: int) -> Dict:
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        results: List[Dict] = list(pool.map(lambda _: _call(), range(calls)))
+
+    outcomes: Dict[str, int] = {}
+    for result in results:
+        outcomes[result["outcome"]] = outcomes.get(result["outcome"], 0) + 1
+    latencies = sorted(result["seconds"] for result in results)
+    breaker = setu_service._breakers[SETU_AA].state.value
+
+    print(f"{name:<9} {calls:>5} {threads:>7}  "
+          f"{latencies[len(latencies) // 2] * 1000:>7.0f} {latencies[-1] * 1000:>7.0f}  {breaker:<9}  "
+          + ", ".join(f"{key} {value}" for key, value in sorted(outcomes.items())))
+    return {"outcomes": outcomes, "max_seconds": latencies[-1], "breaker": breaker}
+
+
+def _wait_for_port():
+    for _ in range(50):
+        with socket.socket() as s:
+            if s.connect_ex(("127.0.0.1", PORT)) == 0:
+                return
+        time.sleep(0.1)
+    raise SystemExit("fake Setu server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    latency: Dict[str, float] = {}
+    error_rate: Dict[str, float] = {}
+    server = uvicorn.Server(uvicorn.Config(create_app(latency, error_rate), port=PORT, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    _wait_for_port()
+
+    print(f"{'phase':<9} {'calls':>5} {'threads':>7}  {'p50 ms':>7} {'max ms':>7}  {'breaker':<9}  outcomes")
+    failures = []
+
+    healthy = _phase("healthy", 40, 4)
+    if healthy["outcomes"] != {"ok": 40}:
+        failures.append("healthy: not every call succeeded")
+
+    error_rate["setu-aa"] = 0.1
+    flaky = _phase("flaky", 40, 4)
+    if flaky["outcomes"].get("ok", 0) < 36:
+        failures.append("flaky: retries recovered too few calls")
+
+    error_rate["setu-aa"] = 1.0
+    outage = _phase("outage", 40, 4)
+    if outage["breaker"] != CircuitState.OPEN or not outage["outcomes"].get("CircuitOpenError"):
+        failures.append("outage: circuit did not open")
+
+    error_rate["setu-aa"] = 0.0
+    time.sleep(float(os.environ["setu__SETU_BREAKER_OPEN_SECONDS"]) + 0.1)
+    recovery = _phase("recovery", 20, 1)
+    if recovery["breaker"] != CircuitState.CLOSED or recovery["outcomes"].get("ok", 0) < 19:
+        failures.append("recovery: circuit did not close")
+
+    latency["setu-aa"] = 2000
+    slow = _phase("slow", 16, 16)
+    if not slow["outcomes"].get("BulkheadFullError"):
+        failures.append("slow: bulkhead admitted every caller")
+
+    server.should_exit = True
+    print()
+    for failure in failures:
+        print(f"FAIL  {failure}")
+    if not failures:
+        print("ok    every phase behaved as expected")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Query plan check for transaction filters: each filter combination must be
+served by the index meant for it, never by a sequential scan.
+
+Runs EXPLAIN against the configured database (needs the migrations applied,
+data is optional). Sequential scans are disabled for the check, so the result
+says whether an index *can* serve the query, independent of table size.
+Exits with status 1 when any plan misses its index.
+
+Run from Wealthyfy-BE:
+ -> python -m benchmarks.transaction_filter_plans
+ -> python -m benchmarks.transaction_filter_plans --account-id 42 --analyze
+"""
+import argparse
+import json
+import sys
+from datetime import date, timedelta
+
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+from app.config.database import SessionLocal
+from app.services.transaction_service import TransactionService
+
+LAST_QUARTER = {"from_date": date.today() - timedelta(days=90), "to_date": date.today()}
+
+# (name, sort_by, filters, index expected to drive the scan)
+CASES = [
+    ("default listing", None, {}, "ix_bank_transactions_account_id_timestamp"),
+    ("date range", None, LAST_QUARTER, "ix_bank_transactions_account_id_timestamp"),
+    ("amount range by amount", "amount", {"min_amount": 10_000, "max_amount": 50_000}, "ix_bank_transactions_account_id_amount"),
+    ("debits last quarter", None, {**LAST_QUARTER, "transaction_type": "DEBIT"}, "ix_bank_transactions_account_id_timestamp_debit"),
+    ("credits", None, {"transaction_type": "CREDIT"}, "ix_bank_transactions_account_id_timestamp_credit"),
+    ("upi last quarter", None, {**LAST_QUARTER, "modes": ["UPI"]}, "ix_bank_transactions_account_id_mode_timestamp"),
+    ("category", None, {"category_ids": [3]}, "ix_bank_transactions_account_id_category_id_timestamp"),
+    (
+        "debits over 10k via upi last quarter",
+        None,
+        {**LAST_QUARTER, "transaction_type": "DEBIT", "min_amount": 10_000, "modes": ["UPI"]},
+        None,
+    ),
+]
+
+
+def _plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--account-id", type=int, default=1)
+    parser.add_argument("--size", type=int, default=10)
+    parser.add_argument("--analyze", action="store_true", help="Run the queries and report rows read")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    failures = 0
+    try:
+        db.execute(text("SET LOCAL enable_seqscan = off"))
+        service = TransactionService(db)
+
+        for name, sort_by, filters, expected_index in CASES:
+            query = service.get_transactions_by_account_id_query(
+                args.account_id, sort_by=sort_by, filters=filters
+            ).limit(args.size)
+            # Literal values, as psycopg2 sends them, so partial indexes can match
+            sql = str(query.statement.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            ))
+            options = "ANALYZE, BUFFERS, FORMAT JSON" if args.analyze else "FORMAT JSON"
+            plan = db.execute(text(f"EXPLAIN ({options}) {sql}")).scalar()
+            plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+
+            scans = [
+                node for node in _plan_nodes(plan)
+                if node.get("Relation Name") == "bank_transactions" or "Index Name" in node
+            ]
+            indexes = sorted({node["Index Name"] for node in scans if "Index Name" in node})
+            seq_scan = any(node["Node Type"] == "Seq Scan" for node in scans)
+            ok = not seq_scan and bool(indexes) and (expected_index is None or expected_index in indexes)
+            failures += not ok
+
+            rows_read = ""
+            if args.analyze:
+                rows_read = f"  rows read {sum(node.get('Actual Rows', 0) for node in scans):,}"
+            print(f"{'ok  ' if ok else 'FAIL'}  {name:<40} {', '.join(indexes) or 'Seq Scan'}{rows_read}")
+    finally:
+        db.rollback()
+        db.close()
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
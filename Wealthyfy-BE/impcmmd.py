@@ -14,9 +14,24 @@ Alembic command line interface
 """
 
 """ Celery command line interface
- -> celery -A app.config.celery_app worker --loglevel=info # to start the Celery worker
+ -> celery -A app.config.celery_app worker --loglevel=info # to start the Celery worker (all queues, development)
+ -> celery -A app.config.celery_app worker -Q interactive -c 4 -n interactive@%h --loglevel=info # onboarding ingest, notifications, exports and their cleanup
+ -> celery -A app.config.celery_app worker -Q refresh -c 2 -n refresh@%h --loglevel=info # periodic refresh ingest, recurring payment detection
+ -> celery -A app.config.celery_app worker -Q maintenance -c 1 -n maintenance@%h --loglevel=info # FIP sync, term deposit projections
+ -> celery -A app.config.celery_app worker -Q ingest-large -c 1 --max-memory-per-child=4194304 -n ingest-large@%h --loglevel=info # session ingests over the large-ingest thresholds, on a high-memory host
  -> celery -A app.config.celery_app beat --loglevel=info # to start the Celery beat scheduler
  -> celery -A app.config.celery_app worker --beat --loglevel=info # to start both worker and beat
  -> celery -A app.config.celery_app flower # to start the Flower monitoring tool
  -> celery -A app.config.celery_app status # to check the status of Celery workers
-"""
\ No newline at end of file
+"""
+
+""" Profiling (writes collapsed stacks to storage/profiles, open them in speedscope)
+ -> python -c "from app.utils.profiling import sign_profile_token; print(sign_profile_token('GET', '/accounts/12/monthly-statistics'))" # token for the X-Profile-Token header
+ -> celery_app.send_task("process_session_data", args=[42], kwargs={"_profile": True}) # profile one task run
+"""
+""" Load testing the onboarding flow (fakes for Setu, Keycloak, Twilio and Pusher on port 9100)
+ -> python -m benchmarks.loadtest.fakes --print-env # settings pointing the API and workers at the fakes
+ -> python -m benchmarks.loadtest.fakes --latency setu-aa=300 --error-rate twilio=0.02 # start the fakes
+ -> celery_app.send_task("sync_fip_master_data") # once, against the fakes, so the ingest knows the fake FIP
+ -> python -m benchmarks.loadtest.journeys --users 50 --concurrency 10 # run the journeys and print the per-step report
+"""
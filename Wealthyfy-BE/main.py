@@ -13,18 +13,21 @@ from fastapi.exceptions import RequestValidationError
 
 # Routers & Utilities
 from app.api import router as api_router
-from app.utils.response import error_response
+from app.utils.response import error_response, ORJSONResponse
+from app.config.setting import settings
+from brotli_asgi import BrotliMiddleware
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.resilience import UpstreamUnavailableError
+from app.constants.message import Messages
 from fastapi_pagination import add_pagination
 
-# Celery Beat schedule (import to register periodic tasks)
-from app.config.celery_app import celery_app # noqa: F401
-
 
 # ------------------------------------------------------------
 # Create FastAPI App
 # ------------------------------------------------------------
 app = FastAPI(
     title="Todo App",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -44,6 +47,24 @@ app.add_middleware(
 )
 
 
+# ------------------------------------------------------------
+# Response Compression (brotli, gzip fallback) above a size threshold
+# ------------------------------------------------------------
+app.add_middleware(
+    BrotliMiddleware,
+    minimum_size=settings.app.APP_COMPRESSION_MIN_SIZE,
+    gzip_fallback=True,
+    # Event streams must reach the client as written, not in compressor-sized blocks
+    excluded_handlers=[r"/stream$"],
+)
+
+
+# ------------------------------------------------------------
+# Opt-in request profiling (X-Profile-Token, see app.utils.profiling)
+# ------------------------------------------------------------
+app.add_middleware(ProfilingMiddleware)
+
+
 # ------------------------------------------------------------
 # Register Routers
 # ------------------------------------------------------------
@@ -80,3 +101,20 @@ async def validation_exception_handler(request, exc: RequestValidationError):
         message=detail,
         status_code=status.HTTP_422_UNPROCESSABLE_CONTENT
     )
+
+
+# ------------------------------------------------------------
+# Upstream Unavailable Handler
+# ------------------------------------------------------------
+@app.exception_handler(UpstreamUnavailableError)
+async def upstream_unavailable_handler(request, exc: UpstreamUnavailableError):
+    """
+    An outbound call refused by a circuit breaker, bulkhead or rate limiter:
+    answer 503 with Retry-After instead of a generic 500.
+    """
+    response = error_response(
+        message=Messages.SERVICE_UNAVAILABLE.replace(":name", "Service"),
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+    response.headers["Retry-After"] = str(max(1, round(exc.retry_after)))
+    return response
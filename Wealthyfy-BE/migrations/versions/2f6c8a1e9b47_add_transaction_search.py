@@ -0,0 +1,59 @@
+"""add_transaction_search
+
+Revision ID: 2f6c8a1e9b47
+Revises: 9e4b2d7c6a15
+Create Date: 2026-10-19 15:31:12.604518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f6c8a1e9b47'
+down_revision: Union[str, Sequence[str], None] = '9e4b2d7c6a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # pg_trgm for fuzzy / partial matches, btree_gin to lead GIN indexes with account_id
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+
+    op.add_column('bank_transactions', sa.Column(
+        'narration_search',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "to_tsvector('simple', "
+            "regexp_replace(coalesce(narration, '') || ' ' || transaction_id, '[^[:alnum:]]+', ' ', 'g'))",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.create_index(
+        'ix_bank_transactions_account_id_narration_search', 'bank_transactions',
+        ['account_id', 'narration_search'], unique=False, postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_bank_transactions_account_id_narration_trgm', 'bank_transactions',
+        ['account_id', 'narration'], unique=False, postgresql_using='gin',
+        postgresql_ops={'narration': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_bank_transactions_account_id_transaction_id_trgm', 'bank_transactions',
+        ['account_id', 'transaction_id'], unique=False, postgresql_using='gin',
+        postgresql_ops={'transaction_id': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bank_transactions_account_id_transaction_id_trgm', table_name='bank_transactions')
+    op.drop_index('ix_bank_transactions_account_id_narration_trgm', table_name='bank_transactions')
+    op.drop_index('ix_bank_transactions_account_id_narration_search', table_name='bank_transactions')
+    op.drop_column('bank_transactions', 'narration_search')
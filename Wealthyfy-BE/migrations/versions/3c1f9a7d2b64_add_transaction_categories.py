@@ -0,0 +1,169 @@
+"""add_transaction_categories
+
+Revision ID: 3c1f9a7d2b64
+Revises: aed6f6e0380b
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f9a7d2b64'
+down_revision: Union[str, Sequence[str], None] = 'aed6f6e0380b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Categories and narration rules as of this revision, inlined so later edits to
+# app.constants.transaction_categories never change what this migration does.
+# (id, code, display name)
+TRANSACTION_CATEGORIES = [
+    (1, "SALARY", "Salary"),
+    (2, "EMI_LOAN", "EMI & Loans"),
+    (3, "INVESTMENTS", "Investments"),
+    (4, "INSURANCE", "Insurance"),
+    (5, "TAXES", "Taxes"),
+    (6, "RENT", "Rent"),
+    (7, "UTILITIES", "Bills & Utilities"),
+    (8, "FOOD_DINING", "Food & Dining"),
+    (9, "GROCERIES", "Groceries"),
+    (10, "SHOPPING", "Shopping"),
+    (11, "TRAVEL", "Travel"),
+    (12, "FUEL", "Fuel"),
+    (13, "ENTERTAINMENT", "Entertainment"),
+    (14, "HEALTH", "Health"),
+    (15, "INTEREST", "Interest"),
+    (16, "BANK_CHARGES", "Bank Charges"),
+    (17, "CASH_WITHDRAWAL", "Cash Withdrawal"),
+    (18, "TRANSFER", "Transfers"),
+    (19, "OTHERS", "Others"),
+]
+
+# (category code, keywords), in priority order; see app.utils.categoriser
+CATEGORY_RULES = [
+    ("SALARY", ["SALARY", "SAL", "SAL CR", "PAYROLL"]),
+    ("EMI_LOAN", ["EMI", "LOAN", "BAJAJ FINANCE", "BAJAJ FIN", "LN REPAY"]),
+    ("INVESTMENTS", [
+        "MUTUAL FUND", "MF", "SIP", "ZERODHA", "GROWW", "UPSTOX", "INDIAN CLEARING CORP",
+        "ICCL", "NSE CLEARING", "PPF",
+    ]),
+    ("INSURANCE", ["INSURANCE", "LIC", "PREMIUM", "POLICYBAZAAR"]),
+    ("TAXES", ["INCOME TAX", "TDS", "CBDT", "GST", "ADVANCE TAX"]),
+    ("RENT", ["RENT", "HOUSERENT", "NOBROKER"]),
+    ("UTILITIES", [
+        "ELECTRICITY", "BESCOM", "BSES", "TATA POWER", "MSEDCL", "WATER BILL", "BILLDESK",
+        "RECHARGE", "AIRTEL", "JIO", "VODAFONE", "BROADBAND", "DTH", "TATA PLAY", "LPG",
+        "INDANE", "BHARAT GAS",
+    ]),
+    ("FOOD_DINING", [
+        "SWIGGY", "ZOMATO", "DOMINO*", "MCDONALD*", "STARBUCKS", "KFC", "PIZZA*",
+        "RESTAURANT", "CAFE", "EATSURE",
+    ]),
+    ("GROCERIES", [
+        "BIGBASKET", "BLINKIT", "GROFERS", "ZEPTO", "DMART", "AVENUE SUPERMARTS",
+        "JIOMART", "SUPERMARKET", "KIRANA", "INSTAMART",
+    ]),
+    ("SHOPPING", [
+        "AMAZON", "AMAZONPAY", "FLIPKART", "MYNTRA", "AJIO", "NYKAA", "MEESHO",
+        "TATA CLIQ", "RELIANCE RETAIL", "DECATHLON",
+    ]),
+    ("TRAVEL", [
+        "UBER", "OLA", "RAPIDO", "IRCTC", "MAKEMYTRIP", "GOIBIBO", "INDIGO", "AIR INDIA",
+        "REDBUS", "CLEARTRIP", "YATRA", "FASTAG", "METRO",
+    ]),
+    ("FUEL", ["PETROL", "FUEL", "HPCL", "BPCL", "IOCL", "INDIAN OIL", "SHELL"]),
+    ("ENTERTAINMENT", [
+        "NETFLIX", "SPOTIFY", "HOTSTAR", "BOOKMYSHOW", "PRIME VIDEO", "PVR", "INOX",
+        "YOUTUBE", "SONYLIV",
+    ]),
+    ("HEALTH", [
+        "PHARM*", "APOLLO", "HOSPITAL", "MEDPLUS", "1MG", "PRACTO", "CLINIC",
+        "DIAGNOSTIC*", "NETMEDS",
+    ]),
+    ("INTEREST", ["INT PD", "INTPD", "INTEREST", "INT CR", "SB INT"]),
+    ("BANK_CHARGES", [
+        "CHARGES", "CHRG*", "CHGS", "AMC", "SMS ALERT", "MIN BAL", "PENALTY",
+        "DEBIT CARD FEE",
+    ]),
+    ("CASH_WITHDRAWAL", ["ATM", "ATW", "NFS", "CASH WDL", "CASH WITHDRAWAL", "CWDR"]),
+    ("TRANSFER", ["NEFT", "IMPS", "RTGS", "TRANSFER", "TRF", "SELF", "P2A", "P2P"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    categories = op.create_table('transaction_categories',
+    sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('code', sa.String(length=50), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('code')
+    )
+    op.bulk_insert(categories, [
+        {"id": category_id, "code": code, "name": name}
+        for category_id, code, name in TRANSACTION_CATEGORIES
+    ])
+
+    op.add_column('bank_transactions', sa.Column('category_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'bank_transactions_category_id_fkey', 'bank_transactions',
+        'transaction_categories', ['category_id'], ['id']
+    )
+
+    _backfill_categories()
+
+    op.create_index(
+        'ix_bank_transactions_account_id_category_id', 'bank_transactions',
+        ['account_id', 'category_id'], unique=False,
+        postgresql_include=['amount', 'transaction_type']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_bank_transactions_account_id_category_id', table_name='bank_transactions')
+    op.drop_constraint('bank_transactions_category_id_fkey', 'bank_transactions', type_='foreignkey')
+    op.drop_column('bank_transactions', 'category_id')
+    op.drop_table('transaction_categories')
+
+
+def _backfill_categories() -> None:
+    """
+    Categorises existing transactions in one UPDATE: a CASE with one regex per
+    rule, in priority order, matching keywords on the same word boundaries as
+    the categoriser (runs of A-Z0-9 of the upper-cased narration).
+    """
+    category_ids = {code: category_id for category_id, code, _ in TRANSACTION_CATEGORIES}
+    params = {"others": category_ids["OTHERS"], "transfer": category_ids["TRANSFER"]}
+    branches = []
+    for index, (code, keywords) in enumerate(CATEGORY_RULES):
+        params[f"pattern_{index}"] = _rule_pattern(keywords)
+        params[f"category_{index}"] = category_ids[code]
+        branches.append(f"WHEN upper(narration) ~ :pattern_{index} THEN :category_{index}")
+
+    op.get_bind().execute(sa.text(
+        "UPDATE bank_transactions SET category_id = CASE "
+        "WHEN narration IS NULL OR narration = '' THEN :others "
+        + " ".join(branches)
+        # A UPI handle (name@bank) with no rule match is a transfer
+        + " WHEN narration LIKE '%@%' THEN :transfer ELSE :others END"
+    ), params)
+
+
+def _rule_pattern(keywords: Sequence[str]) -> str:
+    """
+    Regex matching any keyword as whole words; words of a phrase may be
+    separated by any non-alphanumerics and a trailing "*" makes the last word
+    a prefix.
+    """
+    alternatives = []
+    for keyword in keywords:
+        words = re.findall(r"[A-Z0-9]+", keyword.upper())
+        body = "[^A-Z0-9]+".join(words)
+        alternatives.append(body if keyword.endswith("*") else f"{body}([^A-Z0-9]|$)")
+    return f"(^|[^A-Z0-9])({'|'.join(alternatives)})"
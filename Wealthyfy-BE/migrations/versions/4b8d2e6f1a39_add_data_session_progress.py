@@ -0,0 +1,45 @@
+"""add_data_session_progress
+
+Revision ID: 4b8d2e6f1a39
+Revises: e2a9b4c7f156
+Create Date: 2026-10-19 18:05:41.226907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8d2e6f1a39'
+down_revision: Union[str, Sequence[str], None] = 'e2a9b4c7f156'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('data_session_progress',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('data_session_id', sa.Integer(), nullable=False),
+    sa.Column('fip_id', sa.String(length=255), nullable=False),
+    sa.Column('link_ref_number', sa.String(length=64), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=True),
+    sa.Column('status', sa.Enum('COMPLETED', 'FAILED', name='account_ingest_status_enum'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['data_session_id'], ['consent_data_session.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['account_id'], ['financial_accounts.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('data_session_id', 'fip_id', 'link_ref_number', name='uq_data_session_progress_account')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('data_session_progress')
+
+    sa.Enum(name='account_ingest_status_enum').drop(op.get_bind(), checkfirst=True)
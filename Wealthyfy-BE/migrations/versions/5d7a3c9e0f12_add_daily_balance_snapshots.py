@@ -0,0 +1,48 @@
+"""add_daily_balance_snapshots
+
+Revision ID: 5d7a3c9e0f12
+Revises: 8b2e4f6a1d93
+Create Date: 2026-10-19 12:21:09.774312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d7a3c9e0f12'
+down_revision: Union[str, Sequence[str], None] = '8b2e4f6a1d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_balance_snapshots',
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('snapshot_date', sa.Date(), nullable=False),
+    sa.Column('closing_balance', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['account_id'], ['financial_accounts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('account_id', 'snapshot_date')
+    )
+
+    # Backfill from existing transactions: last running balance of each day, in
+    # the timezone FIPs report dates in (BALANCE_SNAPSHOT_TIMEZONE when written;
+    # inlined so a later change of the constant cannot alter this revision)
+    op.execute(sa.text(
+        "INSERT INTO daily_balance_snapshots (account_id, snapshot_date, closing_balance) "
+        "SELECT DISTINCT ON (account_id, day) account_id, day, balance FROM ("
+        "    SELECT account_id, (transaction_timestamp AT TIME ZONE :tz)::date AS day, "
+        "           balance, transaction_timestamp, id "
+        "    FROM bank_transactions "
+        "    WHERE balance IS NOT NULL AND account_id IS NOT NULL"
+        ") t "
+        "ORDER BY account_id, day, transaction_timestamp DESC, id DESC"
+    ).bindparams(tz='Asia/Kolkata'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('daily_balance_snapshots')
@@ -0,0 +1,58 @@
+"""add_transaction_filter_indexes
+
+Revision ID: 6a3e1f8c4d20
+Revises: 2f6c8a1e9b47
+Create Date: 2026-10-19 16:05:37.441902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a3e1f8c4d20'
+down_revision: Union[str, Sequence[str], None] = '2f6c8a1e9b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_bank_transactions_account_id_timestamp', 'bank_transactions', ['account_id', 'transaction_timestamp'], unique=False)
+    op.create_index('ix_bank_transactions_account_id_amount', 'bank_transactions', ['account_id', 'amount'], unique=False)
+    op.create_index(
+        'ix_bank_transactions_account_id_timestamp_debit', 'bank_transactions',
+        ['account_id', 'transaction_timestamp'], unique=False,
+        postgresql_where=sa.text("transaction_type = 'DEBIT'")
+    )
+    op.create_index(
+        'ix_bank_transactions_account_id_timestamp_credit', 'bank_transactions',
+        ['account_id', 'transaction_timestamp'], unique=False,
+        postgresql_where=sa.text("transaction_type = 'CREDIT'")
+    )
+    op.create_index('ix_bank_transactions_account_id_mode_timestamp', 'bank_transactions', ['account_id', 'mode', 'transaction_timestamp'], unique=False)
+
+    # Extends (account_id, category_id) with the timestamp; the new index serves both
+    op.create_index(
+        'ix_bank_transactions_account_id_category_id_timestamp', 'bank_transactions',
+        ['account_id', 'category_id', 'transaction_timestamp'], unique=False,
+        postgresql_include=['amount', 'transaction_type']
+    )
+    op.drop_index('ix_bank_transactions_account_id_category_id', table_name='bank_transactions')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'ix_bank_transactions_account_id_category_id', 'bank_transactions',
+        ['account_id', 'category_id'], unique=False,
+        postgresql_include=['amount', 'transaction_type']
+    )
+    op.drop_index('ix_bank_transactions_account_id_category_id_timestamp', table_name='bank_transactions')
+    op.drop_index('ix_bank_transactions_account_id_mode_timestamp', table_name='bank_transactions')
+    op.drop_index('ix_bank_transactions_account_id_timestamp_credit', table_name='bank_transactions')
+    op.drop_index('ix_bank_transactions_account_id_timestamp_debit', table_name='bank_transactions')
+    op.drop_index('ix_bank_transactions_account_id_amount', table_name='bank_transactions')
+    op.drop_index('ix_bank_transactions_account_id_timestamp', table_name='bank_transactions')
@@ -0,0 +1,28 @@
+"""add_data_session_ingest_stats
+
+Revision ID: 7c3f9a1d5e82
+Revises: 4b8d2e6f1a39
+Create Date: 2026-10-19 18:41:12.530418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c3f9a1d5e82'
+down_revision: Union[str, Sequence[str], None] = '4b8d2e6f1a39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('consent_data_session', sa.Column('ingest_stats', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('consent_data_session', 'ingest_stats')
@@ -0,0 +1,43 @@
+"""add_term_deposit_projections
+
+Revision ID: 9e4b2d7c6a15
+Revises: 5d7a3c9e0f12
+Create Date: 2026-10-19 14:02:41.218904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b2d7c6a15'
+down_revision: Union[str, Sequence[str], None] = '5d7a3c9e0f12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('term_deposit_projections',
+    sa.Column('summary_id', sa.Integer(), nullable=False),
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('as_of_date', sa.Date(), nullable=False),
+    sa.Column('accrued_interest', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('current_value', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('projected_maturity_value', sa.Numeric(precision=15, scale=2), nullable=False),
+    sa.Column('maturity_date', sa.Date(), nullable=False),
+    sa.Column('days_to_maturity', sa.Integer(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['account_id'], ['financial_accounts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['summary_id'], ['term_deposit_details.summary_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('summary_id')
+    )
+    op.create_index(op.f('ix_term_deposit_projections_account_id'), 'term_deposit_projections', ['account_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_term_deposit_projections_account_id'), table_name='term_deposit_projections')
+    op.drop_table('term_deposit_projections')
@@ -0,0 +1,49 @@
+"""add_notification_outbox
+
+Revision ID: c7d1e5a2b830
+Revises: 6a3e1f8c4d20
+Create Date: 2026-10-19 16:48:03.117265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d1e5a2b830'
+down_revision: Union[str, Sequence[str], None] = '6a3e1f8c4d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('notification_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('event', sa.String(length=100), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'SENT', 'SUPERSEDED', 'FAILED', name='notification_status_enum'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('available_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_notification_outbox_pending_available_at', 'notification_outbox',
+        ['available_at'], unique=False,
+        postgresql_where=sa.text("status = 'PENDING'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_notification_outbox_pending_available_at', table_name='notification_outbox')
+    op.drop_table('notification_outbox')
+
+    sa.Enum(name='notification_status_enum').drop(op.get_bind(), checkfirst=True)
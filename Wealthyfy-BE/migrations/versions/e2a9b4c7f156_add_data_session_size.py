@@ -0,0 +1,30 @@
+"""add_data_session_size
+
+Revision ID: e2a9b4c7f156
+Revises: c7d1e5a2b830
+Create Date: 2026-10-19 17:22:50.902314
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a9b4c7f156'
+down_revision: Union[str, Sequence[str], None] = 'c7d1e5a2b830'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('consent_data_session', sa.Column('file_size_bytes', sa.Integer(), nullable=True))
+    op.add_column('consent_data_session', sa.Column('transaction_count', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('consent_data_session', 'transaction_count')
+    op.drop_column('consent_data_session', 'file_size_bytes')
@@ -0,0 +1,34 @@
+"""add_data_session_latest_index
+
+Revision ID: e3a7c5b9d104
+Revises: 7c3f9a1d5e82
+Create Date: 2026-10-19 19:12:48.206735
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a7c5b9d104'
+down_revision: Union[str, Sequence[str], None] = '7c3f9a1d5e82'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Extends (consent_request_id) with id DESC; the new index serves both
+    op.create_index(
+        'ix_consent_data_session_consent_request_id_id', 'consent_data_session',
+        ['consent_request_id', sa.text('id DESC')], unique=False
+    )
+    op.drop_index('ix_consent_data_session_consent_request_id', table_name='consent_data_session')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_consent_data_session_consent_request_id', 'consent_data_session', ['consent_request_id'], unique=False)
+    op.drop_index('ix_consent_data_session_consent_request_id_id', table_name='consent_data_session')